@@ -1,10 +1,30 @@
 """The algolib package."""
 
+from .algorithms.graph.connectivity.components import ConnectedComponents, IncrementalComponents
+from .algorithms.graph.connectivity.scc import StronglyConnectedComponents
+from .algorithms.graph.mst.kruskal import Kruskal
+from .algorithms.graph.mst.prim import Prim
+from .algorithms.graph.ordering.toposort import TopologicalSort
+from .algorithms.graph.shortest_path.astar import AStar
+from .algorithms.graph.shortest_path.batch import BatchShortestPaths
+from .algorithms.graph.shortest_path.dijkstra import Dijkstra
+from .algorithms.graph.shortest_path.floyd_warshall import FloydWarshall
 from .algorithms.graph.traversal.bfs import BFS
+from .algorithms.graph.traversal.bidirectional import BidirectionalBFS
+from .algorithms.graph.traversal.dfs import DFS
+from .algorithms.graph.traversal.direction_optimizing import DirectionOptimizingBFS
+from .algorithms.graph.traversal.parallel import ParallelBFS
+from .algorithms.searching.aho_corasick import AhoCorasick
 from .algorithms.searching.binary import BinarySearcher
+from .algorithms.searching.hash_index import HashIndexSearcher
+from .algorithms.searching.learned import LearnedIndexSearcher
 from .algorithms.searching.linear import LinearSearcher
+from .algorithms.searching.predicate import PredicateSearcher
+from .algorithms.searching.substring import HorspoolSearcher, KMPSearcher
+from .algorithms.searching.suffix_array import SuffixArray
 from .algorithms.sorting.bubble import BubbleSorter
 from .algorithms.sorting.merge import MergeSorter
+from .data_structures.csr_graph import CSRGraph
 from .data_structures.disjoint_set import DisjointSet
 from .data_structures.graph import Graph
 from .data_structures.linked_list import LinkedList
@@ -13,18 +33,40 @@ from .data_structures.stack import Stack
 from .interfaces import Algorithm, GraphSolver, Searcher, Sorter
 
 __all__ = [
+    "AStar",
+    "AhoCorasick",
     "Algorithm",
     "BFS",
+    "BatchShortestPaths",
+    "BidirectionalBFS",
     "BinarySearcher",
     "BubbleSorter",
+    "CSRGraph",
+    "ConnectedComponents",
+    "DFS",
+    "Dijkstra",
+    "DirectionOptimizingBFS",
     "DisjointSet",
+    "FloydWarshall",
     "Graph",
     "GraphSolver",
+    "HashIndexSearcher",
+    "HorspoolSearcher",
+    "IncrementalComponents",
+    "KMPSearcher",
+    "Kruskal",
+    "LearnedIndexSearcher",
     "LinkedList",
     "LinearSearcher",
     "MergeSorter",
+    "ParallelBFS",
+    "PredicateSearcher",
+    "Prim",
     "Queue",
     "Searcher",
     "Sorter",
     "Stack",
+    "StronglyConnectedComponents",
+    "SuffixArray",
+    "TopologicalSort",
 ]
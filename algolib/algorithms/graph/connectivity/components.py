@@ -0,0 +1,328 @@
+from array import array
+from dataclasses import dataclass
+from itertools import compress
+from typing import Any, Dict, Generic, Iterable, List, Literal, Tuple, cast
+
+from algolib._typing import T
+from algolib.data_structures.disjoint_set import DisjointSet
+from algolib.data_structures.graph import Graph, GraphView, Vertex
+from algolib.interfaces import GraphSolver
+
+Backend = Literal["auto", "bfs", "union_find"]
+
+
+@dataclass(slots=True)
+class ComponentsResult(Generic[T]):
+    """A labelling of the connected components of a graph.
+
+    Components are numbered from 0. `ConnectedComponents` numbers them in order
+    of their lowest vertex id, so the labels do not depend on the backend that
+    produced them; `StronglyConnectedComponents` numbers them in topological
+    order of the condensation.
+
+    Attributes:
+        graph: The graph that was labelled.
+        labels: The component label of each vertex id.
+        sizes: The number of vertices in each component, indexed by label.
+    """
+
+    graph: GraphView[T]
+    labels: "array[int]"
+    sizes: "array[int]"
+
+    @property
+    def count(self) -> int:
+        """The number of components."""
+        return len(self.sizes)
+
+    def label_of(self, v: Vertex[T]) -> int:
+        """Returns the component label of a vertex.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        return self.labels[self.graph.vertex_id(v)]
+
+    def connected(self, u: Vertex[T], v: Vertex[T]) -> bool:
+        """Checks whether two vertices are in the same component.
+
+        Raises:
+            ValueError: If either vertex is not in the graph.
+        """
+        return self.label_of(u) == self.label_of(v)
+
+    def members(self, label: int) -> List[Vertex[T]]:
+        """Returns the vertices of a component in id order, in O(V).
+
+        Raises:
+            IndexError: If there is no component with this label.
+        """
+        if not 0 <= label < self.count:
+            raise IndexError("Component label out of range")
+        ids = compress(range(len(self.labels)), (x == label for x in self.labels))
+        return list(map(self.graph.vertex_at, ids))
+
+
+class ConnectedComponents(Generic[T]):
+    """Connected component labelling with a BFS or a union-find backend.
+
+    The `"bfs"` backend sweeps the vertices in id order and runs a breadth-first
+    search from each one not yet labelled; the label array doubles as the
+    visited map, so no per-search state is allocated. It follows out-edges only,
+    so it needs an undirected graph.
+
+    The `"union_find"` backend makes one pass over the edges with a
+    `DisjointSet` of vertex ids and then compacts the set representatives into
+    labels. Edge direction does not matter to it, so on directed graphs it
+    yields the weakly connected components.
+
+    With `"auto"`, undirected graphs use the BFS sweep, which touches each edge
+    through its id array without a per-edge `find`, and directed graphs use
+    union-find.
+
+    Attributes:
+        backend: The configured backend.
+        last_backend: The backend used by the last call to `label`.
+    """
+
+    def __init__(self, backend: Backend = "auto") -> None:
+        """Initializes the labeller.
+
+        Args:
+            backend: `"bfs"`, `"union_find"` or `"auto"`. Defaults to `"auto"`.
+
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        if backend not in ("auto", "bfs", "union_find"):
+            raise ValueError("backend must be 'auto', 'bfs' or 'union_find'")
+        self.backend = backend
+        self.last_backend: Backend = backend
+
+    def label(self, graph: GraphView[T]) -> ComponentsResult[T]:
+        """Labels the connected components of a graph.
+
+        Args:
+            graph: The graph to label.
+
+        Returns:
+            A `ComponentsResult` with the label of every vertex and the size of
+            every component.
+
+        Raises:
+            ValueError: If the BFS backend is requested for a directed graph.
+        """
+        backend = self.backend
+        if backend == "auto":
+            backend = "union_find" if graph.directed else "bfs"
+        elif backend == "bfs" and graph.directed:
+            raise ValueError("The BFS backend requires an undirected graph")
+        self.last_backend = backend
+
+        if backend == "bfs":
+            labels, sizes = self._bfs_labels(graph)
+        else:
+            labels, sizes = self._union_find_labels(graph)
+        return ComponentsResult(graph, labels, sizes)
+
+    @staticmethod
+    def _bfs_labels(graph: GraphView[T]) -> Tuple["array[int]", "array[int]"]:
+        """Labels components with one breadth-first search per component."""
+        n = len(graph)
+        labels = array("i", [-1]) * n
+        sizes = array("i")
+        for start in range(n):
+            if labels[start] >= 0:
+                continue
+            label = len(sizes)
+            labels[start] = label
+            queue = [start]
+            for current in queue:
+                for neighbor in graph.neighbor_ids(current):
+                    if labels[neighbor] < 0:
+                        labels[neighbor] = label
+                        queue.append(neighbor)
+            sizes.append(len(queue))
+        return labels, sizes
+
+    @staticmethod
+    def _union_find_labels(graph: GraphView[T]) -> Tuple["array[int]", "array[int]"]:
+        """Labels components by merging the endpoints of every edge."""
+        n = len(graph)
+        sets = DisjointSet[int](range(n))
+        for u in range(n):
+            for v in graph.neighbor_ids(u):
+                # Undirected edges are stored twice; one union is enough.
+                if graph.directed or v > u:
+                    sets.union(u, v)
+        return _compact(sets, n)
+
+    def run(self, data: Any) -> Any:
+        """Runs connected component labelling on a graph."""
+        if not isinstance(data, GraphView):
+            raise TypeError("Expected a Graph for connected components.")
+        return self.label(cast(GraphView[T], data))
+
+
+class IncrementalComponents(Generic[T]):
+    """Connected components of a `Graph` kept up to date as edges are added.
+
+    Edges are added through this object, which forwards them to the graph and
+    merges the components of their endpoints in a `DisjointSet`, so each
+    insertion costs amortized near-constant time instead of a relabelling
+    pass. Component sizes are tracked per set representative. `snapshot`
+    compacts the current sets into a `ComponentsResult`.
+
+    Edges added to the graph directly, bypassing this object, are not seen.
+    Removing edges is not supported. Removing a vertex reassigns vertex ids
+    (see `Graph.remove_vertex`), so the tracker notices it through
+    `Graph.vertex_removals` and rebuilds its sets from the graph, in
+    O(V + E), on its next call. On directed graphs the components are weakly
+    connected.
+    """
+
+    def __init__(self, graph: Graph[T]) -> None:
+        """Initializes the tracker with the components of an existing graph.
+
+        Args:
+            graph: The graph to track. Its current edges are merged once.
+        """
+        self.graph = graph
+        self._rebuild()
+
+    @property
+    def count(self) -> int:
+        """The current number of components."""
+        self._sync_vertices()
+        return len(self._sizes)
+
+    def add_vertex(self, key: T) -> Vertex[T]:
+        """Adds a vertex to the graph as a new component, if it is not present.
+
+        Returns:
+            The vertex with this key.
+        """
+        vertex = self.graph.add_vertex(key)
+        self._sync_vertices()
+        return vertex
+
+    def add_edge(self, u: Vertex[T], v: Vertex[T], weight: float = 1.0) -> bool:
+        """Adds an edge to the graph and merges the components of its endpoints.
+
+        Args:
+            u: The source vertex.
+            v: The destination vertex.
+            weight: The weight of the edge. Defaults to 1.0.
+
+        Returns:
+            True if the edge joined two different components.
+
+        Raises:
+            ValueError: If either vertex is not in the graph.
+        """
+        self._sync_vertices()
+        self.graph.add_edge(u, v, weight)
+        return self._merge(self.graph.vertex_id(u), self.graph.vertex_id(v))
+
+    def add_edges_from(
+        self,
+        edges: Iterable[Tuple[T, T]] | Iterable[Tuple[T, T, float]],
+        weight: float = 1.0,
+    ) -> int:
+        """Adds many edges given by vertex keys, adding missing vertices.
+
+        Args:
+            edges: `(u, v)` or `(u, v, weight)` key tuples.
+            weight: The weight of edges given as pairs. Defaults to 1.0.
+
+        Returns:
+            The number of merges, i.e. by how much the component count dropped
+            apart from newly added vertices.
+        """
+        edge_list: List[Tuple[Any, ...]] = list(edges)
+        self._sync_vertices()
+        self.graph.add_edges_from(edge_list, weight)
+        self._sync_vertices()
+        vertex_id = self.graph.vertex_id
+        return sum(
+            self._merge(vertex_id(Vertex(edge[0])), vertex_id(Vertex(edge[1])))
+            for edge in edge_list
+        )
+
+    def connected(self, u: Vertex[T], v: Vertex[T]) -> bool:
+        """Checks whether two vertices are in the same component.
+
+        Raises:
+            ValueError: If either vertex is not in the graph.
+        """
+        self._sync_vertices()
+        u_id, v_id = self.graph.vertex_id(u), self.graph.vertex_id(v)
+        return self._sets.find(u_id) == self._sets.find(v_id)
+
+    def component_size(self, v: Vertex[T]) -> int:
+        """Returns the number of vertices in the component of a vertex.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        self._sync_vertices()
+        return self._sizes[self._sets.find(self.graph.vertex_id(v))]
+
+    def snapshot(self) -> ComponentsResult[T]:
+        """Returns the current labelling, numbered as by `ConnectedComponents`."""
+        self._sync_vertices()
+        labels, sizes = _compact(self._sets, len(self.graph))
+        return ComponentsResult(self.graph, labels, sizes)
+
+    def _rebuild(self) -> None:
+        """Recomputes the sets from the current vertices and edges of the graph."""
+        self._sets = DisjointSet[int]()
+        self._sizes: Dict[int, int] = {}
+        self._tracked = 0
+        self._removals = self.graph.vertex_removals
+        self._sync_vertices()
+        for u in range(len(self.graph)):
+            for v in self.graph.neighbor_ids(u):
+                self._merge(u, v)
+
+    def _sync_vertices(self) -> None:
+        """Adds singleton sets for vertices the graph gained since the last call.
+
+        Rebuilds everything instead if a vertex was removed since.
+        """
+        if self.graph.vertex_removals != self._removals:
+            self._rebuild()
+            return
+        # Vertex ids are dense, so the tracked ids are always a prefix.
+        for index in range(self._tracked, len(self.graph)):
+            self._sets.add(index)
+            self._sizes[index] = 1
+        self._tracked = len(self.graph)
+
+    def _merge(self, u: int, v: int) -> bool:
+        """Merges the sets of two vertex ids and their sizes."""
+        root_u, root_v = self._sets.find(u), self._sets.find(v)
+        if not self._sets.union(root_u, root_v):
+            return False
+        root = self._sets.find(root_u)
+        self._sizes[root] = self._sizes.pop(root_u) + self._sizes.pop(root_v)
+        return True
+
+
+def _compact(sets: DisjointSet[int], n: int) -> Tuple["array[int]", "array[int]"]:
+    """Numbers the sets of vertex ids `0..n-1` in order of their lowest member."""
+    labels = array("i", [0]) * n
+    sizes = array("i")
+    label_of_root: Dict[int, int] = {}
+    for v in range(n):
+        root = sets.find(v)
+        label = label_of_root.get(root)
+        if label is None:
+            label = label_of_root[root] = len(sizes)
+            sizes.append(0)
+        labels[v] = label
+        sizes[label] += 1
+    return labels, sizes
+
+
+_components_protocol_check: type[GraphSolver] = ConnectedComponents
@@ -0,0 +1,142 @@
+import math
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, Generic, Iterator, List, Tuple, cast
+
+from algolib._typing import T
+from algolib.algorithms.graph.connectivity.components import ComponentsResult
+from algolib.data_structures.csr_graph import CSRGraph
+from algolib.data_structures.graph import GraphView
+from algolib.interfaces import GraphSolver
+
+
+class StronglyConnectedComponents(Generic[T]):
+    """Tarjan's strongly connected components, without recursion.
+
+    The depth-first search keeps an explicit stack of `(vertex id, neighbor
+    iterator)` pairs, and the discovery indices, low-links and on-stack flags
+    live in arrays indexed by vertex id, so call graphs with millions of
+    vertices and arbitrarily long paths are handled in O(V + E) time.
+
+    Components are numbered in topological order of the condensation: every
+    edge between two components points from a lower label to a higher one, and
+    component 0 has no incoming edges. On undirected graphs the strongly
+    connected components are the connected components.
+    """
+
+    def label(self, graph: GraphView[T]) -> ComponentsResult[T]:
+        """Labels the strongly connected components of a graph.
+
+        Args:
+            graph: The graph to label.
+
+        Returns:
+            A `ComponentsResult` with the component label of every vertex and
+            the size of every component.
+        """
+        n = len(graph)
+        state = _TarjanState(n)
+        for root in range(n):
+            if state.index[root] < 0:
+                self._visit(graph, root, state)
+
+        # Tarjan emits components in reverse topological order.
+        count = len(state.sizes)
+        labels = array("i", (count - 1 - label for label in state.labels))
+        sizes = state.sizes[::-1]
+        return ComponentsResult(graph, labels, sizes)
+
+    def condensation(self, graph: GraphView[T], result: ComponentsResult[T]) -> CSRGraph[int]:
+        """Builds the condensation DAG, with one vertex per component.
+
+        Args:
+            graph: The graph that was labelled.
+            result: The labelling returned by `label` for this graph.
+
+        Returns:
+            A directed `CSRGraph` whose vertex keys and ids are the component
+            labels. Parallel edges between two components are merged into one
+            carrying the smallest weight, and edges inside a component are
+            dropped.
+        """
+        labels = result.labels
+        lightest: List[Dict[int, float]] = [{} for _ in range(result.count)]
+        for u in range(len(graph)):
+            edges = lightest[labels[u]]
+            for v, weight in zip(graph.neighbor_ids(u), graph.neighbor_weights(u), strict=True):
+                target = labels[v]
+                if target != labels[u] and weight < edges.get(target, math.inf):
+                    edges[target] = weight
+
+        offsets = array("q", accumulate((len(edges) for edges in lightest), initial=0))
+        targets = array("i")
+        weights = array("d")
+        for edges in lightest:
+            for target in sorted(edges):
+                targets.append(target)
+                weights.append(edges[target])
+        return CSRGraph(list(range(result.count)), offsets, targets, weights, directed=True)
+
+    @staticmethod
+    def _visit(graph: GraphView[T], root: int, state: "_TarjanState") -> None:
+        """Runs Tarjan's search from `root`, emitting every component it closes."""
+        index, low, on_stack = state.index, state.low, state.on_stack
+        state.discover(root)
+        stack: List[Tuple[int, Iterator[int]]] = [(root, iter(graph.neighbor_ids(root)))]
+        while stack:
+            current, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if index[neighbor] < 0:
+                    state.discover(neighbor)
+                    stack.append((neighbor, iter(graph.neighbor_ids(neighbor))))
+                    break
+                if on_stack[neighbor] and index[neighbor] < low[current]:
+                    low[current] = index[neighbor]
+            else:
+                stack.pop()
+                if stack and low[current] < low[stack[-1][0]]:
+                    low[stack[-1][0]] = low[current]
+                if low[current] == index[current]:
+                    state.emit(current)
+
+    def run(self, data: Any) -> Any:
+        """Runs strongly connected component labelling on a graph."""
+        if not isinstance(data, GraphView):
+            raise TypeError("Expected a Graph for strongly connected components.")
+        return self.label(cast(GraphView[T], data))
+
+
+class _TarjanState:
+    """The per-vertex arrays and the component stack of one Tarjan search."""
+
+    def __init__(self, n: int) -> None:
+        self.index = array("i", [-1]) * n
+        self.low = array("i", [0]) * n
+        self.on_stack = bytearray(n)
+        self.labels = array("i", [-1]) * n
+        self.sizes = array("i")
+        self.stack: List[int] = []
+        self.counter = 0
+
+    def discover(self, v: int) -> None:
+        """Assigns the next discovery index to `v` and pushes it."""
+        self.index[v] = self.low[v] = self.counter
+        self.counter += 1
+        self.stack.append(v)
+        self.on_stack[v] = 1
+
+    def emit(self, root: int) -> None:
+        """Pops the component rooted at `root` off the stack and labels it."""
+        label = len(self.sizes)
+        size = 0
+        while True:
+            v = self.stack.pop()
+            self.on_stack[v] = 0
+            self.labels[v] = label
+            size += 1
+            if v == root:
+                break
+        self.sizes.append(size)
+
+
+_scc_protocol_check: type[GraphSolver] = StronglyConnectedComponents
@@ -0,0 +1,50 @@
+from array import array
+from dataclasses import dataclass
+from typing import Generic, List, Tuple
+
+from algolib._typing import T
+from algolib.data_structures.graph import GraphView, Vertex
+
+
+@dataclass(slots=True)
+class SpanningForest(Generic[T]):
+    """A minimum spanning forest, stored as parallel edge arrays.
+
+    Edge `i` joins vertex ids `sources[i]` and `targets[i]` with weight
+    `weights[i]`. A connected graph yields a spanning tree with `len(graph) - 1`
+    edges; otherwise there is one tree per connected component.
+
+    Attributes:
+        graph: The graph that was spanned.
+        sources: One endpoint id of each forest edge.
+        targets: The other endpoint id of each forest edge.
+        weights: The weight of each forest edge.
+        total_weight: The sum of the forest's edge weights.
+        trees: The number of trees, i.e. of connected components.
+    """
+
+    graph: GraphView[T]
+    sources: "array[int]"
+    targets: "array[int]"
+    weights: "array[float]"
+    total_weight: float = 0.0
+    trees: int = 0
+
+    @property
+    def edges(self) -> List[Tuple[Vertex[T], Vertex[T], float]]:
+        """The forest edges as `(u, v, weight)` vertex triples."""
+        vertex_at = self.graph.vertex_at
+        return [
+            (vertex_at(u), vertex_at(v), w)
+            for u, v, w in zip(self.sources, self.targets, self.weights, strict=True)
+        ]
+
+    def __len__(self) -> int:
+        """Returns the number of forest edges."""
+        return len(self.weights)
+
+
+def _require_undirected(graph: GraphView[T]) -> None:
+    """Rejects directed graphs, whose minimum spanning structures are arborescences."""
+    if graph.directed:
+        raise ValueError("Minimum spanning trees require an undirected graph")
@@ -0,0 +1,91 @@
+from array import array
+from typing import Any, Generic, List, Tuple, cast
+
+from algolib._typing import T
+from algolib.algorithms.graph.mst.base import SpanningForest, _require_undirected
+from algolib.data_structures.disjoint_set import DisjointSet
+from algolib.data_structures.graph import GraphView
+from algolib.interfaces import GraphSolver
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    HAVE_NUMPY = False
+else:
+    HAVE_NUMPY = True
+
+
+class Kruskal(Generic[T]):
+    """Kruskal's minimum spanning forest with a `DisjointSet`.
+
+    Each undirected edge is copied once into packed id and weight arrays, and
+    the edge indices are sorted a single time. With NumPy this is a stable
+    `argsort` over the weight array's buffer, without creating an object per
+    edge; otherwise `sorted` runs with the weight array's `__getitem__` as the
+    key, which is also stable, so both give the same forest. Edges are then
+    taken in order whenever `DisjointSet.union` reports that they join two
+    different trees, stopping as soon as `len(graph) - 1` edges are taken.
+    """
+
+    def solve(self, graph: GraphView[T]) -> SpanningForest[T]:
+        """Computes a minimum spanning forest.
+
+        Args:
+            graph: The undirected graph to span. Self-loops are ignored.
+
+        Returns:
+            A `SpanningForest` whose edges are in nondecreasing weight order.
+
+        Raises:
+            ValueError: If the graph is directed.
+        """
+        _require_undirected(graph)
+        n = len(graph)
+        sources, targets, weights = self._edge_arrays(graph)
+        order = _sort_order(weights)
+
+        forest = SpanningForest(graph, array("i"), array("i"), array("d"))
+        sets = DisjointSet[int](range(n))
+        for edge in order:
+            if len(forest) == n - 1:
+                break
+            u, v = sources[edge], targets[edge]
+            if sets.union(u, v):
+                forest.sources.append(u)
+                forest.targets.append(v)
+                forest.weights.append(weights[edge])
+        forest.total_weight = sum(forest.weights)
+        forest.trees = n - len(forest)
+        return forest
+
+    @staticmethod
+    def _edge_arrays(
+        graph: GraphView[T],
+    ) -> Tuple["array[int]", "array[int]", "array[float]"]:
+        """Packs every undirected edge once, from its lower id to its higher id."""
+        sources = array("i")
+        targets = array("i")
+        weights = array("d")
+        for u in range(len(graph)):
+            for v, weight in zip(graph.neighbor_ids(u), graph.neighbor_weights(u), strict=True):
+                if v > u:
+                    sources.append(u)
+                    targets.append(v)
+                    weights.append(weight)
+        return sources, targets, weights
+
+    def run(self, data: Any) -> Any:
+        """Runs Kruskal's algorithm on a graph."""
+        if not isinstance(data, GraphView):
+            raise TypeError("Expected a Graph for Kruskal's algorithm.")
+        return self.solve(cast(GraphView[T], data))
+
+
+def _sort_order(weights: "array[float]") -> List[int]:
+    """Returns the edge indices in stable nondecreasing order of weight."""
+    if HAVE_NUMPY:
+        return cast(List[int], np.argsort(np.frombuffer(weights), kind="stable").tolist())
+    return sorted(range(len(weights)), key=weights.__getitem__)
+
+
+_kruskal_protocol_check: type[GraphSolver] = Kruskal
@@ -0,0 +1,79 @@
+import heapq
+from array import array
+from typing import Any, Generic, List, Tuple, cast
+
+from algolib._typing import T
+from algolib.algorithms.graph.mst.base import SpanningForest, _require_undirected
+from algolib.data_structures.graph import GraphView
+from algolib.interfaces import GraphSolver
+
+
+class Prim(Generic[T]):
+    """Lazy Prim's minimum spanning forest with a binary heap.
+
+    Each tree grows from its lowest unspanned vertex id. The heap holds
+    `(weight, vertex id, parent id)` entries for every edge leaving the tree;
+    entries whose vertex has since joined the tree are skipped when popped.
+    Membership is a bytearray indexed by vertex id. Unlike `Kruskal`, Prim needs
+    no global edge sort and reports each tree edge as `(parent, child)`.
+    """
+
+    def solve(self, graph: GraphView[T]) -> SpanningForest[T]:
+        """Computes a minimum spanning forest.
+
+        Args:
+            graph: The undirected graph to span. Self-loops are ignored.
+
+        Returns:
+            A `SpanningForest` whose edges are in the order they joined a tree,
+            each as `(parent, child)`.
+
+        Raises:
+            ValueError: If the graph is directed.
+        """
+        _require_undirected(graph)
+        n = len(graph)
+        forest = SpanningForest(graph, array("i"), array("i"), array("d"))
+        in_tree = bytearray(n)
+        for root in range(n):
+            if not in_tree[root]:
+                forest.trees += 1
+                self._grow(graph, root, in_tree, forest)
+        forest.total_weight = sum(forest.weights)
+        return forest
+
+    @staticmethod
+    def _grow(
+        graph: GraphView[T], root: int, in_tree: bytearray, forest: SpanningForest[T]
+    ) -> None:
+        """Grows the tree of `root` until no edge leaves it."""
+        in_tree[root] = 1
+        heap: List[Tuple[float, int, int]] = [
+            (weight, v, root)
+            for v, weight in zip(
+                graph.neighbor_ids(root), graph.neighbor_weights(root), strict=True
+            )
+        ]
+        heapq.heapify(heap)
+        while heap:
+            weight, current, parent = heapq.heappop(heap)
+            if in_tree[current]:
+                continue
+            in_tree[current] = 1
+            forest.sources.append(parent)
+            forest.targets.append(current)
+            forest.weights.append(weight)
+            for v, w in zip(
+                graph.neighbor_ids(current), graph.neighbor_weights(current), strict=True
+            ):
+                if not in_tree[v]:
+                    heapq.heappush(heap, (w, v, current))
+
+    def run(self, data: Any) -> Any:
+        """Runs Prim's algorithm on a graph."""
+        if not isinstance(data, GraphView):
+            raise TypeError("Expected a Graph for Prim's algorithm.")
+        return self.solve(cast(GraphView[T], data))
+
+
+_prim_protocol_check: type[GraphSolver] = Prim
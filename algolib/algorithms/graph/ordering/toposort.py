@@ -0,0 +1,108 @@
+from array import array
+from typing import Any, Generic, Iterator, List, Optional, Tuple, cast
+
+from algolib._typing import T
+from algolib.data_structures.graph import GraphView, Vertex
+from algolib.interfaces import GraphSolver
+
+
+class TopologicalSort(Generic[T]):
+    """Topological ordering and cycle detection for directed graphs.
+
+    `sort` is Kahn's algorithm: in-degrees are counted into an array indexed by
+    vertex id, and vertices are emitted as their in-degree drops to zero, in a
+    first-in-first-out order that starts from the lowest ids. `find_cycle` is a
+    stack-based depth-first search that reports the first back edge it meets.
+    Both run in O(V + E) without recursion.
+    """
+
+    def sort(self, graph: GraphView[T]) -> List[Vertex[T]]:
+        """Orders the vertices so that every edge points from earlier to later.
+
+        Args:
+            graph: The directed acyclic graph to sort.
+
+        Returns:
+            The vertices in topological order.
+
+        Raises:
+            ValueError: If the graph is undirected or contains a cycle; use
+                `find_cycle` to get the offending cycle.
+        """
+        _require_directed(graph)
+        n = len(graph)
+        in_degree = array("i", [0]) * n
+        for v in range(n):
+            for w in graph.neighbor_ids(v):
+                in_degree[w] += 1
+
+        order = [v for v in range(n) if in_degree[v] == 0]
+        for current in order:
+            for w in graph.neighbor_ids(current):
+                in_degree[w] -= 1
+                if in_degree[w] == 0:
+                    order.append(w)
+        if len(order) < n:
+            raise ValueError("Graph contains a cycle")
+        return list(map(graph.vertex_at, order))
+
+    def find_cycle(self, graph: GraphView[T]) -> Optional[List[Vertex[T]]]:
+        """Finds a directed cycle, if there is one.
+
+        Args:
+            graph: The directed graph to check.
+
+        Returns:
+            The vertices of a cycle in edge order, where the last vertex has an
+            edge back to the first (a self-loop is a one-vertex cycle), or None
+            if the graph is acyclic.
+
+        Raises:
+            ValueError: If the graph is undirected.
+        """
+        _require_directed(graph)
+        # 0 = unvisited, 1 = on the current DFS path, 2 = finished.
+        state = bytearray(len(graph))
+        for root in range(len(graph)):
+            if state[root] == 0:
+                cycle = self._cycle_from(graph, root, state)
+                if cycle is not None:
+                    return list(map(graph.vertex_at, cycle))
+        return None
+
+    @staticmethod
+    def _cycle_from(graph: GraphView[T], root: int, state: bytearray) -> Optional[List[int]]:
+        """Searches from `root` and returns the ids of the first cycle found."""
+        path = [root]
+        state[root] = 1
+        stack: List[Tuple[int, Iterator[int]]] = [(root, iter(graph.neighbor_ids(root)))]
+        while stack:
+            current, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if state[neighbor] == 1:
+                    return path[path.index(neighbor) :]
+                if state[neighbor] == 0:
+                    state[neighbor] = 1
+                    path.append(neighbor)
+                    stack.append((neighbor, iter(graph.neighbor_ids(neighbor))))
+                    break
+            else:
+                stack.pop()
+                path.pop()
+                state[current] = 2
+        return None
+
+    def run(self, data: Any) -> Any:
+        """Runs a topological sort on a graph."""
+        if not isinstance(data, GraphView):
+            raise TypeError("Expected a Graph for topological sort.")
+        return self.sort(cast(GraphView[T], data))
+
+
+def _require_directed(graph: GraphView[T]) -> None:
+    """Rejects undirected graphs, whose edges have no orientation to respect."""
+    if not graph.directed:
+        raise ValueError("Topological ordering requires a directed graph")
+
+
+_toposort_protocol_check: type[GraphSolver] = TopologicalSort
@@ -0,0 +1,192 @@
+import heapq
+import math
+from array import array
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, cast
+
+from algolib._typing import T
+from algolib.algorithms.graph.shortest_path.base import ShortestPathResult, _reset_unsettled
+from algolib.data_structures.graph import GraphView, Vertex
+from algolib.interfaces import GraphSolver
+
+Heuristic = Callable[[Any, Any], float]
+"""A heuristic called as `heuristic(key, target_key)` that estimates the remaining distance."""
+
+
+def euclidean(a: Sequence[float], b: Sequence[float]) -> float:
+    """Straight-line distance between two coordinate keys."""
+    return math.dist(a, b)
+
+
+def manhattan(a: Sequence[float], b: Sequence[float]) -> float:
+    """Grid (L1) distance between two coordinate keys."""
+    return sum(abs(x - y) for x, y in zip(a, b, strict=True))
+
+
+class AStar(Generic[T]):
+    """A* point-to-point shortest paths guided by a heuristic.
+
+    Vertices are expanded in order of `f = g + epsilon * h`, where `g` is the
+    distance from the source and `h` the heuristic estimate to the target. With
+    an admissible heuristic (one that never overestimates) and `epsilon = 1` the
+    path found is optimal; with `epsilon > 1` (weighted A*) the search expands
+    fewer vertices and the path costs at most `epsilon` times the optimum.
+
+    Ties on `f` are broken in favor of the larger `g`, i.e. the vertex believed
+    closer to the target. On grids and road networks, where many vertices share
+    the same `f`, this drives the search along one of the equally good paths
+    instead of flooding all of them.
+
+    Heuristic values are computed once per vertex and cached in an array.
+
+    Attributes:
+        heuristic: The heuristic, called with vertex keys.
+        epsilon: The heuristic weight.
+        prefer_deeper: Whether ties on `f` go to the vertex with the larger `g`.
+        max_expansions: The expansion budget per search, or None for no limit.
+        expansions: The number of expansions made by the last search.
+    """
+
+    def __init__(
+        self,
+        heuristic: Heuristic,
+        epsilon: float = 1.0,
+        prefer_deeper: bool = True,
+        max_expansions: Optional[int] = None,
+    ) -> None:
+        """Initializes the search.
+
+        Args:
+            heuristic: Estimates the distance between two vertex keys, called as
+                `heuristic(key, target_key)`. It must be non-negative.
+            epsilon: The heuristic weight; values above 1 trade optimality for
+                speed. Defaults to 1.
+            prefer_deeper: Break ties on `f` in favor of the larger `g`. Defaults
+                to True; False breaks ties by insertion order.
+            max_expansions: Give up after this many expansions, bounding the time
+                and heap size of searches for unreachable or distant targets.
+
+        Raises:
+            ValueError: If `epsilon` is less than 1.
+        """
+        if epsilon < 1:
+            raise ValueError("epsilon must be at least 1")
+        self.heuristic = heuristic
+        self.epsilon = epsilon
+        self.prefer_deeper = prefer_deeper
+        self.max_expansions = max_expansions
+        self.expansions = 0
+
+    def search(
+        self, graph: GraphView[T], source: Vertex[T], target: Vertex[T]
+    ) -> ShortestPathResult[T]:
+        """Searches for a shortest path from `source` to `target`.
+
+        Args:
+            graph: The graph to search.
+            source: The start vertex.
+            target: The destination vertex.
+
+        Returns:
+            A `ShortestPathResult` whose `target` is set if the target was reached.
+            Only expanded vertices have finite distances.
+
+        Raises:
+            ValueError: If either endpoint is not in the graph, or a negative edge
+                weight is encountered.
+        """
+        if source not in graph or target not in graph:
+            raise ValueError("Source and target must be in the graph")
+        start, goal = graph.vertex_id(source), graph.vertex_id(target)
+        goal_key = target.key
+
+        n = len(graph)
+        distances = array("d", [math.inf]) * n
+        predecessors = array("i", [-1]) * n
+        estimates = array("d", [math.nan]) * n
+        closed = bytearray(n)
+        result = ShortestPathResult(graph, distances, predecessors)
+        # Entries are (f, tie, g, id); `tie` is -g to prefer deeper vertices, or
+        # an insertion counter for first-in-first-out ties.
+        counter = 0
+        distances[start] = 0.0
+        heap: List[Tuple[float, float, float, int]] = [
+            (self.epsilon * self._estimate(graph, start, goal_key, estimates), 0.0, 0.0, start)
+        ]
+        budget = math.inf if self.max_expansions is None else self.max_expansions
+
+        while heap and result.expansions < budget:
+            _, _, g, current = heapq.heappop(heap)
+            if g > distances[current]:
+                continue
+            closed[current] = 1
+            result.expansions += 1
+            if current == goal:
+                result.target = target
+                break
+            for neighbor, weight in zip(
+                graph.neighbor_ids(current), graph.neighbor_weights(current), strict=True
+            ):
+                if weight < 0:
+                    raise ValueError("A* requires non-negative edge weights")
+                candidate = g + weight
+                if candidate < distances[neighbor]:
+                    distances[neighbor] = candidate
+                    predecessors[neighbor] = current
+                    f = candidate + self.epsilon * self._estimate(
+                        graph, neighbor, goal_key, estimates
+                    )
+                    counter += 1
+                    tie = -candidate if self.prefer_deeper else counter
+                    heapq.heappush(heap, (f, tie, candidate, neighbor))
+
+        self.expansions = result.expansions
+        _reset_unsettled((entry[3] for entry in heap), closed, distances, predecessors)
+        return result
+
+    def shortest_path(
+        self, graph: GraphView[T], source: Vertex[T], target: Vertex[T]
+    ) -> Optional[List[Vertex[T]]]:
+        """Finds a path from `source` to `target`.
+
+        Args:
+            graph: The graph to search.
+            source: The start vertex.
+            target: The destination vertex.
+
+        Returns:
+            The vertices of the path found, or None if the target was not reached.
+
+        Raises:
+            ValueError: If either endpoint is not in the graph, or a negative edge
+                weight is encountered.
+        """
+        result = self.search(graph, source, target)
+        return None if result.target is None else result.path_to(target)
+
+    def _estimate(
+        self, graph: GraphView[T], index: int, goal_key: T, estimates: "array[float]"
+    ) -> float:
+        """Returns the cached heuristic value of a vertex, computing it on first use."""
+        h = estimates[index]
+        if math.isnan(h):
+            h = self.heuristic(graph.vertex_at(index).key, goal_key)
+            estimates[index] = h
+        return h
+
+    def run(self, data: Any) -> Any:
+        """Runs A* and returns the path found."""
+        if not isinstance(data, tuple) or len(data) != 3:
+            raise TypeError("Expected a tuple (graph, source, target) for A*.")
+
+        graph, source, target = data
+        if not isinstance(graph, GraphView):
+            raise TypeError("First element of the tuple must be a Graph.")
+        if not isinstance(source, Vertex) or not isinstance(target, Vertex):
+            raise TypeError("Source and target must be Vertex objects.")
+
+        return self.shortest_path(
+            cast(GraphView[T], graph), cast(Vertex[T], source), cast(Vertex[T], target)
+        )
+
+
+_astar_protocol_check: type[GraphSolver] = AStar
@@ -0,0 +1,73 @@
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Generic, Iterable, List, Optional
+
+from algolib._typing import T
+from algolib.data_structures.graph import GraphView, Vertex
+
+
+@dataclass(slots=True)
+class ShortestPathResult(Generic[T]):
+    """The outcome of a weighted shortest-path search.
+
+    Distances and predecessors are stored as arrays indexed by vertex id, with
+    `inf` and -1 for vertices the search did not settle.
+
+    Attributes:
+        graph: The graph that was searched.
+        distances: The shortest distance from the nearest source for each vertex id.
+        predecessors: The id of each settled vertex's predecessor on its shortest
+            path (-1 for sources).
+        target: The target vertex reached, if the search stopped early.
+        expansions: The number of vertices settled (popped from the heap).
+    """
+
+    graph: GraphView[T]
+    distances: "array[float]"
+    predecessors: "array[int]"
+    target: Optional[Vertex[T]] = None
+    expansions: int = 0
+
+    def distance(self, v: Vertex[T]) -> Optional[float]:
+        """Returns the shortest distance to a vertex, or None if it was not reached."""
+        dist = self.distances[self.graph.vertex_id(v)]
+        return None if dist == math.inf else dist
+
+    def path_to(self, v: Vertex[T]) -> Optional[List[Vertex[T]]]:
+        """Reconstructs the shortest path from the nearest source in O(path length).
+
+        Args:
+            v: The destination vertex.
+
+        Returns:
+            The vertices from a source to `v`, or None if `v` was not reached.
+        """
+        index = self.graph.vertex_id(v)
+        if self.distances[index] == math.inf:
+            return None
+        path = [index]
+        while self.predecessors[index] >= 0:
+            index = self.predecessors[index]
+            path.append(index)
+        path.reverse()
+        return list(map(self.graph.vertex_at, path))
+
+    def __contains__(self, item: object) -> bool:
+        """Checks whether a vertex was reached by the search."""
+        if not isinstance(item, Vertex) or item not in self.graph:
+            return False
+        return self.distances[self.graph.vertex_id(item)] != math.inf
+
+
+def _reset_unsettled(
+    pending: Iterable[int],
+    settled: bytearray,
+    distances: "array[float]",
+    predecessors: "array[int]",
+) -> None:
+    """Resets the tentative distances of pending vertices that were never settled."""
+    for v in pending:
+        if not settled[v]:
+            distances[v] = math.inf
+            predecessors[v] = -1
@@ -0,0 +1,284 @@
+import mmap
+import os
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
+
+from algolib._typing import T
+from algolib.algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algolib.algorithms.graph.traversal.bfs import BFS, source_ids
+from algolib.data_structures.graph import GraphView, Vertex
+from algolib.interfaces import GraphSolver
+
+Method = Literal["bfs", "dijkstra"]
+
+# Distance typecodes: hop counts for BFS, weighted distances for Dijkstra.
+_TYPECODES: Dict[Method, str] = {"bfs": "i", "dijkstra": "d"}
+
+# A chunk of work is a list of (matrix row, source vertex id) pairs.
+_Chunk = List[Tuple[int, int]]
+_Rows = List[Tuple[int, "array[Any]"]]
+
+
+@dataclass(slots=True, frozen=True)
+class DistanceMatrix:
+    """A row-major distance matrix stored in a file.
+
+    Row `i` holds the distances from the `i`-th source to every vertex, indexed
+    by vertex id. Entries are native-endian `int32` hop counts (-1 if unreachable)
+    for BFS, or `float64` distances (`inf` if unreachable) for Dijkstra, so the
+    file can be mapped directly, e.g. with
+    `numpy.memmap(path, dtype, shape=(rows, columns))`.
+
+    Attributes:
+        path: The file holding the matrix.
+        rows: The number of sources.
+        columns: The number of vertices.
+        typecode: The `array` typecode of the entries.
+    """
+
+    path: str
+    rows: int
+    columns: int
+    typecode: str
+
+    def row(self, index: int) -> "array[Any]":
+        """Reads the distances from one source.
+
+        Args:
+            index: The position of the source in the batch.
+
+        Returns:
+            The distances to every vertex, indexed by vertex id.
+
+        Raises:
+            IndexError: If `index` is out of range.
+        """
+        if not 0 <= index < self.rows:
+            raise IndexError("Row index out of range")
+        distances = array(self.typecode)
+        with open(self.path, "rb") as f:
+            f.seek(index * self.columns * distances.itemsize)
+            distances.fromfile(f, self.columns)
+        return distances
+
+
+class BatchShortestPaths(Generic[T]):
+    """Single-source shortest paths from many sources over a process pool.
+
+    The graph is handed to each worker once, when the worker starts. With the
+    default `fork` start method on Linux the workers inherit the parent's graph
+    without copying it; with `spawn` it is pickled once per worker rather than
+    once per source. Sources are sent in chunks of `chunk_size`, and at most two
+    chunks per worker are in flight, so memory stays bounded however many
+    sources there are.
+
+    Results are either streamed back to a callback in the parent, one source at
+    a time, or written by the workers straight into a memory-mapped distance
+    matrix on disk, which never passes the rows through the parent at all.
+
+    Attributes:
+        method: `"bfs"` for hop counts or `"dijkstra"` for weighted distances.
+        workers: The number of worker processes; 1 runs in the calling process.
+        chunk_size: The number of sources sent to a worker per task.
+    """
+
+    def __init__(
+        self, method: Method = "bfs", workers: Optional[int] = None, chunk_size: int = 16
+    ) -> None:
+        """Initializes the batch runner.
+
+        Args:
+            method: `"bfs"` for hop counts or `"dijkstra"` for weighted distances.
+                Defaults to `"bfs"`.
+            workers: The number of worker processes. Defaults to the CPU count.
+            chunk_size: The number of sources sent to a worker per task.
+                Defaults to 16.
+
+        Raises:
+            ValueError: If `method` is unknown, or `workers` or `chunk_size` is
+                less than 1.
+        """
+        if method not in _TYPECODES:
+            raise ValueError("method must be 'bfs' or 'dijkstra'")
+        self.method = method
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+
+    def stream(
+        self,
+        graph: GraphView[T],
+        sources: Iterable[Vertex[T]],
+        callback: Callable[[Vertex[T], "array[Any]"], None],
+    ) -> int:
+        """Searches from every source and passes each result to a callback.
+
+        Results arrive in completion order, not source order.
+
+        Args:
+            graph: The graph to search.
+            sources: The start vertices; each one is searched separately.
+            callback: Called in this process as `callback(source, distances)`,
+                where `distances` is indexed by vertex id.
+
+        Returns:
+            The number of searches run.
+
+        Raises:
+            ValueError: If a source is not in the graph, or no source is given.
+        """
+        starts = source_ids(graph, sources)
+        for rows in self._execute(graph, self._chunks(starts), None):
+            for row, distances in rows:
+                callback(graph.vertex_at(starts[row]), distances)
+        return len(starts)
+
+    def write_matrix(
+        self, graph: GraphView[T], sources: Iterable[Vertex[T]], path: str | os.PathLike[str]
+    ) -> DistanceMatrix:
+        """Searches from every source and writes the distances to a file.
+
+        Args:
+            graph: The graph to search.
+            sources: The start vertices, one matrix row each, in order.
+            path: The file to write; it is created or overwritten.
+
+        Returns:
+            A `DistanceMatrix` describing the file.
+
+        Raises:
+            ValueError: If a source is not in the graph, or no source is given.
+        """
+        starts = source_ids(graph, sources)
+        typecode = _TYPECODES[self.method]
+        row_bytes = len(graph) * array(typecode).itemsize
+        path = os.fspath(path)
+        with open(path, "wb") as f:
+            f.truncate(len(starts) * row_bytes)
+        for _ in self._execute(graph, self._chunks(starts), (path, row_bytes)):
+            pass
+        return DistanceMatrix(path, len(starts), len(graph), typecode)
+
+    def _chunks(self, starts: List[int]) -> List[_Chunk]:
+        """Splits the numbered sources into tasks."""
+        rows = list(enumerate(starts))
+        return [rows[i : i + self.chunk_size] for i in range(0, len(rows), self.chunk_size)]
+
+    def _execute(
+        self, graph: GraphView[T], chunks: List[_Chunk], matrix: Optional[Tuple[str, int]]
+    ) -> Iterator[_Rows]:
+        """Solves every chunk and yields the rows that were not written to disk."""
+        if self.workers == 1 or len(chunks) == 1:
+            worker = _BatchWorker(graph, self.method, matrix)
+            try:
+                yield from map(worker.solve, chunks)
+            finally:
+                worker.close()
+        else:
+            yield from self._execute_pool(graph, chunks, matrix)
+
+    def _execute_pool(
+        self, graph: GraphView[T], chunks: List[_Chunk], matrix: Optional[Tuple[str, int]]
+    ) -> Iterator[_Rows]:
+        """Solves the chunks in worker processes, keeping a bounded number in flight."""
+        workers = min(self.workers, len(chunks))
+        queue = iter(chunks)
+        with ProcessPoolExecutor(
+            workers, initializer=_attach, initargs=(graph, self.method, matrix)
+        ) as pool:
+            pending: Set[Future[_Rows]] = {
+                pool.submit(_solve_chunk, chunk) for chunk in islice(queue, 2 * workers)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = next(queue, None)
+                    if chunk is not None:
+                        pending.add(pool.submit(_solve_chunk, chunk))
+                    yield future.result()
+
+    def run(self, data: Any) -> Any:
+        """Runs the batch and returns a dict from each source to its distances."""
+        if not isinstance(data, tuple) or len(data) != 2:
+            raise TypeError("Expected a tuple (graph, sources) for batch shortest paths.")
+
+        graph, sources = data
+        if not isinstance(graph, GraphView):
+            raise TypeError("First element of the tuple must be a Graph.")
+        sources = list(sources)
+        if not all(isinstance(v, Vertex) for v in sources):
+            raise TypeError("Sources must be Vertex objects.")
+
+        results: Dict[Vertex[T], "array[Any]"] = {}
+        self.stream(cast(GraphView[T], graph), sources, results.__setitem__)
+        return results
+
+
+class _BatchWorker:
+    """Runs single-source searches in one process and returns or stores the rows."""
+
+    def __init__(
+        self, graph: GraphView[Any], method: Method, matrix: Optional[Tuple[str, int]]
+    ) -> None:
+        self.graph = graph
+        self.search = BFS[Any]().search if method == "bfs" else Dijkstra[Any]().search
+        self.matrix: Optional[mmap.mmap] = None
+        self.row_bytes = 0
+        if matrix is not None:
+            path, self.row_bytes = matrix
+            with open(path, "r+b") as f:
+                self.matrix = mmap.mmap(f.fileno(), 0)
+
+    def solve(self, chunk: _Chunk) -> _Rows:
+        """Searches from each source of a chunk."""
+        rows: _Rows = []
+        for row, index in chunk:
+            distances = self.search(self.graph, self.graph.vertex_at(index)).distances
+            if self.matrix is None:
+                rows.append((row, distances))
+            else:
+                start = row * self.row_bytes
+                self.matrix[start : start + self.row_bytes] = distances.tobytes()
+        return rows
+
+    def close(self) -> None:
+        """Unmaps the distance matrix, if any."""
+        if self.matrix is not None:
+            self.matrix.close()
+
+
+# Per-worker state, set up once by `_attach` when the worker process starts.
+_worker: Optional[_BatchWorker] = None
+
+
+def _attach(graph: GraphView[Any], method: Method, matrix: Optional[Tuple[str, int]]) -> None:
+    """Installs the graph and output of a batch in a worker process."""
+    global _worker
+    _worker = _BatchWorker(graph, method, matrix)
+
+
+def _solve_chunk(chunk: _Chunk) -> _Rows:
+    """Solves a chunk of sources inside a worker process."""
+    return cast(_BatchWorker, _worker).solve(chunk)
+
+
+_batch_protocol_check: type[GraphSolver] = BatchShortestPaths
@@ -0,0 +1,120 @@
+import heapq
+import math
+from array import array
+from typing import Any, Generic, Iterable, List, Optional, Tuple, cast
+
+from algolib._typing import T
+from algolib.algorithms.graph.shortest_path.base import ShortestPathResult, _reset_unsettled
+from algolib.algorithms.graph.traversal.bfs import source_ids
+from algolib.data_structures.graph import GraphView, Vertex
+from algolib.interfaces import GraphSolver
+
+
+class Dijkstra(Generic[T]):
+    """Dijkstra's single-source shortest paths for non-negative edge weights.
+
+    The frontier is a `heapq` binary heap of `(distance, vertex id)` pairs with
+    lazy deletion: improving a distance pushes a new entry, and stale entries are
+    skipped when popped. Distances and predecessors live in arrays indexed by
+    vertex id, and a bytearray marks settled vertices.
+    """
+
+    def search(
+        self,
+        graph: GraphView[T],
+        sources: Vertex[T] | Iterable[Vertex[T]],
+        *,
+        target: Optional[Vertex[T]] = None,
+        cutoff: Optional[float] = None,
+    ) -> ShortestPathResult[T]:
+        """Computes shortest distances and predecessors from one or more sources.
+
+        Args:
+            graph: The graph to search.
+            sources: The start vertex, or several start vertices at distance 0.
+            target: If given, the search stops as soon as this vertex is settled.
+            cutoff: If given, vertices farther than this distance are not reached.
+
+        Returns:
+            A `ShortestPathResult`. Only settled vertices have finite distances;
+            vertices left on the heap by an early exit are reset to unreached.
+
+        Raises:
+            ValueError: If a source or the target is not in the graph, no source
+                is given, or a negative edge weight is encountered.
+        """
+        starts = source_ids(graph, sources)
+        goal = -1
+        if target is not None:
+            if target not in graph:
+                raise ValueError("Target vertex must be in the graph")
+            goal = graph.vertex_id(target)
+        limit = math.inf if cutoff is None else cutoff
+
+        n = len(graph)
+        distances = array("d", [math.inf]) * n
+        predecessors = array("i", [-1]) * n
+        settled = bytearray(n)
+        heap: List[Tuple[float, int]] = []
+        for index in starts:
+            distances[index] = 0.0
+            heap.append((0.0, index))
+        heapq.heapify(heap)
+        result = ShortestPathResult(graph, distances, predecessors)
+
+        while heap:
+            dist, current = heapq.heappop(heap)
+            if settled[current]:
+                continue
+            settled[current] = 1
+            result.expansions += 1
+            if current == goal:
+                result.target = graph.vertex_at(goal)
+                _reset_unsettled((v for _, v in heap), settled, distances, predecessors)
+                break
+            for neighbor, weight in zip(
+                graph.neighbor_ids(current), graph.neighbor_weights(current), strict=True
+            ):
+                if weight < 0:
+                    raise ValueError("Dijkstra requires non-negative edge weights")
+                candidate = dist + weight
+                if candidate < distances[neighbor] and candidate <= limit:
+                    distances[neighbor] = candidate
+                    predecessors[neighbor] = current
+                    heapq.heappush(heap, (candidate, neighbor))
+        return result
+
+    def shortest_path(
+        self, graph: GraphView[T], source: Vertex[T], target: Vertex[T]
+    ) -> Optional[List[Vertex[T]]]:
+        """Finds a minimum-weight path between two vertices.
+
+        Args:
+            graph: The graph to search.
+            source: The start vertex.
+            target: The destination vertex.
+
+        Returns:
+            The vertices of a shortest path, or None if the target is unreachable.
+
+        Raises:
+            ValueError: If either endpoint is not in the graph, or a negative edge
+                weight is encountered.
+        """
+        return self.search(graph, source, target=target).path_to(target)
+
+    def run(self, data: Any) -> Any:
+        """Runs Dijkstra's algorithm from a source vertex."""
+        if not isinstance(data, tuple) or len(data) != 2:
+            raise TypeError("Expected a tuple (graph, source) for Dijkstra.")
+
+        graph, source = data
+        if not isinstance(graph, GraphView):
+            raise TypeError("First element of the tuple must be a Graph.")
+        if not isinstance(source, Vertex):
+            raise TypeError("Second element of the tuple must be a Vertex.")
+
+        return self.search(cast(GraphView[T], graph), cast(Vertex[T], source))
+
+
+_dijkstra_protocol_check: type[GraphSolver] = Dijkstra
@@ -0,0 +1,315 @@
+import math
+from array import array
+from dataclasses import dataclass
+from itertools import compress
+from typing import Any, Generic, List, Literal, Optional, Tuple, cast
+
+from algolib._typing import T
+from algolib.data_structures.graph import GraphView, Vertex
+from algolib.interfaces import GraphSolver
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    HAVE_NUMPY = False
+else:
+    HAVE_NUMPY = True
+
+Backend = Literal["auto", "numpy", "python"]
+
+# Elements in the broadcast temporary of one relaxation step (8 MB of float64).
+_BROADCAST_BUDGET = 1 << 20
+
+
+@dataclass(slots=True)
+class AllPairsResult(Generic[T]):
+    """Dense all-pairs shortest path distances.
+
+    Attributes:
+        graph: The graph that was solved.
+        distances: One row per vertex id; `distances[i][j]` is the distance from
+            vertex `i` to vertex `j`, or `inf` if it is unreachable.
+        next_hops: One row per vertex id; `next_hops[i][j]` is the id of the
+            vertex after `i` on a shortest path to `j`, or -1 if there is none.
+            None if next hops were not recorded.
+    """
+
+    graph: GraphView[T]
+    distances: List["array[float]"]
+    next_hops: Optional[List["array[int]"]] = None
+
+    def distance(self, source: Vertex[T], target: Vertex[T]) -> Optional[float]:
+        """Returns the distance between two vertices, or None if unreachable.
+
+        Raises:
+            ValueError: If either vertex is not in the graph.
+        """
+        d = self.distances[self.graph.vertex_id(source)][self.graph.vertex_id(target)]
+        return None if d == math.inf else d
+
+    def path(self, source: Vertex[T], target: Vertex[T]) -> Optional[List[Vertex[T]]]:
+        """Rebuilds a shortest path from the next-hop matrix.
+
+        Args:
+            source: The start vertex.
+            target: The destination vertex.
+
+        Returns:
+            The vertices of a shortest path, or None if the target is unreachable.
+
+        Raises:
+            ValueError: If next hops were not recorded, or either vertex is not
+                in the graph.
+        """
+        if self.next_hops is None:
+            raise ValueError("Next hops were not recorded")
+        current, goal = self.graph.vertex_id(source), self.graph.vertex_id(target)
+        if self.next_hops[current][goal] < 0:
+            return None
+        path = [current]
+        while current != goal:
+            current = self.next_hops[current][goal]
+            path.append(current)
+        return list(map(self.graph.vertex_at, path))
+
+
+class FloydWarshall(Generic[T]):
+    """Floyd–Warshall all-pairs shortest paths on a dense distance matrix.
+
+    The graph is packed into a distance matrix, keeping the lightest of any
+    parallel edges, so the matrix costs 8 bytes per vertex pair (4 with
+    `float32`).
+
+    The `"numpy"` backend runs the blocked algorithm: the intermediate vertices
+    are taken `block_size` at a time, the row and column panels of a block are
+    closed with vectorized rank-one updates, and every other row is then relaxed
+    through the whole block at once with a broadcast `(rows, block, V)` sum and
+    a minimum over the block axis. Each pass over the matrix thus covers a block
+    of intermediates instead of one.
+
+    The `"python"` backend uses one `array` row per vertex id. For each
+    intermediate vertex `k`, the finite entries of row `k` are collected once as
+    `(column, distance)` pairs, and every row `i` that reaches `k` is relaxed
+    over just those columns. Rows that cannot reach `k` are skipped outright,
+    which makes sparse or disconnected graphs much cheaper than the full `V^3`
+    loop. `"auto"` picks NumPy when it is installed.
+
+    Negative edge weights are allowed; negative cycles are reported.
+
+    Attributes:
+        typecode: `"f"` for float32 rows or `"d"` for float64 rows.
+        record_next_hops: Whether next-hop matrices are built.
+        backend: The backend in use, `"numpy"` or `"python"`.
+        block_size: The number of intermediate vertices per NumPy block.
+    """
+
+    def __init__(
+        self,
+        float32: bool = False,
+        next_hops: bool = False,
+        backend: Backend = "auto",
+        block_size: int = 16,
+    ) -> None:
+        """Initializes the solver.
+
+        Args:
+            float32: Store distances as float32, halving the matrix size at the
+                cost of precision. Defaults to False.
+            next_hops: Also build a next-hop matrix for path recovery, which
+                costs another four bytes per vertex pair. Defaults to False.
+            backend: `"numpy"`, `"python"` or `"auto"`. Defaults to `"auto"`.
+            block_size: The number of intermediate vertices relaxed per pass by
+                the NumPy backend. Defaults to 16.
+
+        Raises:
+            ValueError: If the backend is unknown or `block_size` is not positive.
+            ImportError: If the NumPy backend is requested without NumPy.
+        """
+        if backend not in ("auto", "numpy", "python"):
+            raise ValueError("backend must be 'auto', 'numpy' or 'python'")
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        if backend == "numpy" and not HAVE_NUMPY:
+            raise ImportError("The NumPy backend requires numpy")
+        if backend == "auto":
+            backend = "numpy" if HAVE_NUMPY else "python"
+        self.typecode = "f" if float32 else "d"
+        self.record_next_hops = next_hops
+        self.backend = backend
+        self.block_size = block_size
+
+    def solve(self, graph: GraphView[T]) -> AllPairsResult[T]:
+        """Computes the distances between every pair of vertices.
+
+        Args:
+            graph: The graph to solve. Memory grows with the square of its
+                vertex count, so this is meant for graphs of a few thousand
+                vertices.
+
+        Returns:
+            An `AllPairsResult` with the distance matrix and, if requested, the
+            next-hop matrix.
+
+        Raises:
+            ValueError: If the graph contains a negative cycle.
+        """
+        if self.backend == "numpy":
+            distances, hops = self._solve_numpy(graph)
+        else:
+            distances, hops = self._solve_python(graph)
+        if any(distances[i][i] < 0 for i in range(len(graph))):
+            raise ValueError("Graph contains a negative cycle")
+        return AllPairsResult(graph, distances, hops)
+
+    def _solve_python(
+        self, graph: GraphView[T]
+    ) -> Tuple[List["array[float]"], Optional[List["array[int]"]]]:
+        """Runs the pure-Python solver over one `array` row per vertex."""
+        n = len(graph)
+        distances = self._weight_matrix(graph)
+        hops = self._hop_matrix(distances) if self.record_next_hops else None
+
+        columns = range(n)
+        for k in columns:
+            row_k = distances[k]
+            reach = [(j, row_k[j]) for j in compress(columns, map(math.isfinite, row_k)) if j != k]
+            if not reach:
+                continue
+            for i in columns:
+                d_ik = distances[i][k]
+                if i == k or d_ik == math.inf:
+                    continue
+                if hops is None:
+                    self._relax(distances[i], d_ik, reach)
+                else:
+                    self._relax_with_hops(distances[i], d_ik, reach, hops[i], hops[i][k])
+        return distances, hops
+
+    def _solve_numpy(
+        self, graph: GraphView[T]
+    ) -> Tuple[List["array[float]"], Optional[List["array[int]"]]]:
+        """Runs the blocked solver on a NumPy matrix and unpacks it into rows."""
+        n = len(graph)
+        matrix = _numpy_weights(graph, np.float32 if self.typecode == "f" else np.float64)
+        hops = None
+        if self.record_next_hops:
+            columns = np.broadcast_to(np.arange(n, dtype=np.intc), (n, n))
+            hops = np.where(np.isfinite(matrix), columns, np.intc(-1)).astype(np.intc)
+        for start in range(0, n, self.block_size):
+            block = slice(start, min(start + self.block_size, n))
+            _close_panels(matrix, hops, block)
+            _relax_through_block(matrix, hops, block)
+
+        distances = [array(self.typecode, row.tobytes()) for row in matrix]
+        hop_rows = None if hops is None else [array("i", row.tobytes()) for row in hops]
+        return distances, hop_rows
+
+    @staticmethod
+    def _relax(row: "array[float]", d_ik: float, reach: List[Tuple[int, float]]) -> None:
+        """Relaxes row `i` through vertex `k`, given the distance `d_ik`."""
+        for j, d_kj in reach:
+            candidate = d_ik + d_kj
+            if candidate < row[j]:
+                row[j] = candidate
+
+    @staticmethod
+    def _relax_with_hops(
+        row: "array[float]",
+        d_ik: float,
+        reach: List[Tuple[int, float]],
+        hop_row: "array[int]",
+        hop: int,
+    ) -> None:
+        """Like `_relax`, also routing improved entries through `hop`, the first hop to `k`."""
+        for j, d_kj in reach:
+            candidate = d_ik + d_kj
+            if candidate < row[j]:
+                row[j] = candidate
+                hop_row[j] = hop
+
+    def _weight_matrix(self, graph: GraphView[T]) -> List["array[float]"]:
+        """Packs the edge weights into one row per vertex, with 0 on the diagonal."""
+        n = len(graph)
+        matrix = []
+        for i in range(n):
+            row = array(self.typecode, [math.inf]) * n
+            row[i] = 0.0
+            for j, weight in zip(graph.neighbor_ids(i), graph.neighbor_weights(i), strict=True):
+                if weight < row[j]:
+                    row[j] = weight
+            matrix.append(row)
+        return matrix
+
+    @staticmethod
+    def _hop_matrix(distances: List["array[float]"]) -> List["array[int]"]:
+        """Returns the initial next hops: `j` for every edge `i -> j`, else -1."""
+        columns = range(len(distances))
+        hops = []
+        for row in distances:
+            hop = array("i", [-1]) * len(distances)
+            for j in compress(columns, map(math.isfinite, row)):
+                hop[j] = j
+            hops.append(hop)
+        return hops
+
+    def run(self, data: Any) -> Any:
+        """Runs the Floyd–Warshall algorithm on a graph."""
+        if not isinstance(data, GraphView):
+            raise TypeError("Expected a Graph for Floyd–Warshall.")
+        return self.solve(cast(GraphView[T], data))
+
+
+def _numpy_weights(graph: GraphView[T], dtype: Any) -> Any:
+    """Packs the edge weights into a NumPy matrix, with 0 on the diagonal."""
+    n = len(graph)
+    sources, targets, weights = array("i"), array("i"), array("d")
+    for i in range(n):
+        ids = graph.neighbor_ids(i)
+        sources.extend(array("i", [i]) * len(ids))
+        targets.extend(ids)
+        weights.extend(graph.neighbor_weights(i))
+    matrix = np.full((n, n), np.inf, dtype=dtype)
+    np.fill_diagonal(matrix, 0.0)
+    if weights:
+        edges = (np.frombuffer(sources, dtype=np.intc), np.frombuffer(targets, dtype=np.intc))
+        np.minimum.at(matrix, edges, np.frombuffer(weights, dtype=np.float64).astype(dtype))
+    return matrix
+
+
+def _close_panels(matrix: Any, hops: Any, block: slice) -> None:
+    """Relaxes the rows and columns of a block through each of its vertices in turn.
+
+    Afterwards `matrix[i, k]` and `matrix[k, j]` for `k` in the block account for
+    every path whose intermediates lie in this or an earlier block.
+    """
+    for k in range(block.start, block.stop):
+        for rows, cols in ((block, slice(None)), (slice(None), block)):
+            candidate = matrix[rows, k, None] + matrix[None, k, cols]
+            if hops is not None:
+                better = candidate < matrix[rows, cols]
+                via = np.broadcast_to(hops[rows, k, None], better.shape)
+                hops[rows, cols][better] = via[better]
+            np.minimum(matrix[rows, cols], candidate, out=matrix[rows, cols])
+
+
+def _relax_through_block(matrix: Any, hops: Any, block: slice) -> None:
+    """Relaxes every row through all vertices of a block whose panels are closed."""
+    n = len(matrix)
+    size = block.stop - block.start
+    rows_per_chunk = max(1, _BROADCAST_BUDGET // (size * n))
+    panel = matrix[None, block, :]
+    for start in range(0, n, rows_per_chunk):
+        rows = slice(start, start + rows_per_chunk)
+        through = matrix[rows, block, None] + panel
+        if hops is None:
+            np.minimum(matrix[rows], through.min(axis=1), out=matrix[rows])
+            continue
+        best = through.argmin(axis=1)
+        candidate = np.take_along_axis(through, best[:, None, :], axis=1)[:, 0, :]
+        better = candidate < matrix[rows]
+        via = np.take_along_axis(hops[rows, block], best, axis=1)
+        hops[rows][better] = via[better]
+        matrix[rows][better] = candidate[better]
+
+
+_floyd_warshall_protocol_check: type[GraphSolver] = FloydWarshall
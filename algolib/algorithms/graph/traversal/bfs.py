@@ -1,15 +1,78 @@
-from collections import deque
-from typing import Any, Deque, Generic, List, Set, cast
+from array import array
+from dataclasses import dataclass
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple, cast
 
 from algolib._typing import T
-from algolib.data_structures.graph import Graph, Vertex
+from algolib.data_structures.graph import GraphView, Vertex
 from algolib.interfaces import GraphSolver
 
 
+@dataclass(slots=True)
+class BFSResult(Generic[T]):
+    """The outcome of a `BFS.search`.
+
+    Distances and parents are stored as arrays indexed by vertex id, with -1 for
+    vertices the search did not reach.
+
+    Attributes:
+        graph: The graph that was searched.
+        distances: The hop count from the nearest source for each vertex id.
+        parents: The id of each reached vertex's BFS-tree parent (-1 for sources).
+        order: The ids of the reached vertices in the order they were discovered.
+        target: The first target vertex reached, if the search stopped early.
+    """
+
+    graph: GraphView[T]
+    distances: "array[int]"
+    parents: "array[int]"
+    order: "array[int]"
+    target: Optional[Vertex[T]] = None
+
+    @property
+    def visited(self) -> List[Vertex[T]]:
+        """The reached vertices in discovery order."""
+        return list(map(self.graph.vertex_at, self.order))
+
+    def distance(self, v: Vertex[T]) -> Optional[int]:
+        """Returns the hop count to a vertex, or None if it was not reached."""
+        dist = self.distances[self.graph.vertex_id(v)]
+        return None if dist < 0 else dist
+
+    def parent(self, v: Vertex[T]) -> Optional[Vertex[T]]:
+        """Returns the BFS-tree parent of a vertex, or None for sources and unreached vertices."""
+        index = self.parents[self.graph.vertex_id(v)]
+        return None if index < 0 else self.graph.vertex_at(index)
+
+    def path_to(self, v: Vertex[T]) -> Optional[List[Vertex[T]]]:
+        """Reconstructs a shortest path from the nearest source in O(path length).
+
+        Args:
+            v: The destination vertex.
+
+        Returns:
+            The vertices from a source to `v`, or None if `v` was not reached.
+        """
+        index = self.graph.vertex_id(v)
+        if self.distances[index] < 0:
+            return None
+        path = [index]
+        while self.parents[index] >= 0:
+            index = self.parents[index]
+            path.append(index)
+        path.reverse()
+        return list(map(self.graph.vertex_at, path))
+
+    def __contains__(self, item: object) -> bool:
+        """Checks whether a vertex was reached by the search."""
+        if not isinstance(item, Vertex) or item not in self.graph:
+            return False
+        return self.distances[self.graph.vertex_id(item)] >= 0
+
+
 class BFS(Generic[T]):
     """Breadth-First Search (BFS) graph traversal algorithm."""
 
-    def traverse(self, graph: Graph[T], start_vertex: Vertex[T]) -> List[Vertex[T]]:
+    def traverse(self, graph: GraphView[T], start_vertex: Vertex[T]) -> List[Vertex[T]]:
         """Performs a breadth-first traversal on a graph.
 
         Args:
@@ -25,20 +88,120 @@ class BFS(Generic[T]):
         if start_vertex not in graph:
             raise ValueError("Start vertex must be in the graph")
 
-        queue: Deque[Vertex[T]] = deque([start_vertex])
-        visited: Set[Vertex[T]] = {start_vertex}
-        traversal_order: List[Vertex[T]] = []
+        # Work on dense vertex ids: the visit order doubles as the FIFO queue and
+        # a bytearray replaces the hash set of visited vertices.
+        start = graph.vertex_id(start_vertex)
+        visited = bytearray(len(graph))
+        visited[start] = 1
+        order = [start]
+        head = 0
+        while head < len(order):
+            for neighbor in graph.neighbor_ids(order[head]):
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    order.append(neighbor)
+            head += 1
+
+        return list(map(graph.vertex_at, order))
+
+    def iter_traverse(
+        self, graph: GraphView[T], start_vertex: Vertex[T]
+    ) -> Iterator[Tuple[Vertex[T], int]]:
+        """Lazily yields vertices in breadth-first order as they are discovered.
+
+        A vertex's neighbors are only scanned once the caller has consumed the
+        vertices discovered before it, so abandoning the iterator after the first
+        few results leaves the rest of the component unexplored.
+
+        Args:
+            graph: The graph to traverse.
+            start_vertex: The vertex from which to start the traversal.
+
+        Returns:
+            An iterator of `(vertex, depth)` pairs, where `depth` is the hop count
+            from the start vertex.
 
-        while queue:
-            current_vertex = queue.popleft()
-            traversal_order.append(current_vertex)
+        Raises:
+            ValueError: If the start vertex is not in the graph.
+        """
+        if start_vertex not in graph:
+            raise ValueError("Start vertex must be in the graph")
+        return self._iter_levels(graph, graph.vertex_id(start_vertex))
+
+    @staticmethod
+    def _iter_levels(graph: GraphView[T], start: int) -> Iterator[Tuple[Vertex[T], int]]:
+        """Yields `(vertex, depth)` pairs one BFS level at a time from vertex id `start`."""
+        visited = bytearray(len(graph))
+        visited[start] = 1
+        yield graph.vertex_at(start), 0
+        frontier = [start]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for current in frontier:
+                for neighbor in graph.neighbor_ids(current):
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        next_frontier.append(neighbor)
+                        yield graph.vertex_at(neighbor), depth
+            frontier = next_frontier
+
+    def search(
+        self,
+        graph: GraphView[T],
+        sources: Vertex[T] | Iterable[Vertex[T]],
+        *,
+        max_depth: Optional[int] = None,
+        targets: Optional[Iterable[Vertex[T]]] = None,
+    ) -> BFSResult[T]:
+        """Runs a breadth-first search and records distances and parents.
 
-            for neighbor, _ in graph.neighbors(current_vertex):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
+        Args:
+            graph: The graph to search.
+            sources: The start vertex, or several start vertices at distance 0.
+            max_depth: If given, vertices farther than this many hops are not
+                discovered.
+            targets: If given, the search stops as soon as any of these vertices
+                is discovered; `BFSResult.target` records which one.
 
-        return traversal_order
+        Returns:
+            A `BFSResult` with the distances, parents and discovery order.
+
+        Raises:
+            ValueError: If a source is not in the graph, or no source is given.
+        """
+        n = len(graph)
+        distances = array("i", [-1]) * n
+        parents = array("i", [-1]) * n
+        order = array("i")
+        is_target = _id_mask(graph, targets or ())
+        result = BFSResult(graph, distances, parents, order)
+
+        for index in source_ids(graph, sources):
+            if distances[index] < 0:
+                distances[index] = 0
+                order.append(index)
+                if is_target[index]:
+                    result.target = graph.vertex_at(index)
+                    return result
+
+        head = 0
+        while head < len(order):
+            current = order[head]
+            head += 1
+            depth = distances[current] + 1
+            if max_depth is not None and depth > max_depth:
+                break
+            for neighbor in graph.neighbor_ids(current):
+                if distances[neighbor] < 0:
+                    distances[neighbor] = depth
+                    parents[neighbor] = current
+                    order.append(neighbor)
+                    if is_target[neighbor]:
+                        result.target = graph.vertex_at(neighbor)
+                        return result
+        return result
 
     def run(self, data: Any) -> Any:
         """Runs the BFS algorithm."""
@@ -46,12 +209,45 @@ class BFS(Generic[T]):
             raise TypeError("Expected a tuple (graph, start_vertex) for BFS.")
 
         graph, start_vertex = data
-        if not isinstance(graph, Graph):
+        if not isinstance(graph, GraphView):
             raise TypeError("First element of the tuple must be a Graph.")
         if not isinstance(start_vertex, Vertex):
             raise TypeError("Second element of the tuple must be a Vertex.")
 
-        return self.traverse(cast(Graph[T], graph), cast(Vertex[T], start_vertex))
+        return self.traverse(cast(GraphView[T], graph), cast(Vertex[T], start_vertex))
+
+
+def source_ids(graph: GraphView[T], sources: Vertex[T] | Iterable[Vertex[T]]) -> List[int]:
+    """Validates one or more start vertices and returns their ids.
+
+    Shared by the searches that accept a vertex or an iterable of vertices as
+    their sources.
+
+    Args:
+        graph: The graph the vertices belong to.
+        sources: A single vertex, or an iterable of vertices.
+
+    Returns:
+        The ids of the vertices, in the given order.
+
+    Raises:
+        ValueError: If no vertex is given, or a vertex is not in the graph.
+    """
+    starts = [sources] if isinstance(sources, Vertex) else list(sources)
+    if not starts:
+        raise ValueError("At least one start vertex is required")
+    if any(v not in graph for v in starts):
+        raise ValueError("Start vertex must be in the graph")
+    return [graph.vertex_id(v) for v in starts]
+
+
+def _id_mask(graph: GraphView[T], vertices: Iterable[Vertex[T]]) -> bytearray:
+    """Returns a bytearray flagging the ids of the given vertices that are in the graph."""
+    mask = bytearray(len(graph))
+    for v in vertices:
+        if v in graph:
+            mask[graph.vertex_id(v)] = 1
+    return mask
 
 
 _bfs_protocol_check: type[GraphSolver] = BFS
@@ -0,0 +1,171 @@
+from typing import Any, Dict, Generic, List, Optional, Tuple, cast
+
+from algolib._typing import T
+from algolib.data_structures.csr_graph import CSRGraph
+from algolib.data_structures.graph import Graph, GraphView, Vertex
+from algolib.interfaces import GraphSolver
+
+
+class BidirectionalBFS(Generic[T]):
+    """Bidirectional breadth-first search for unweighted point-to-point paths.
+
+    One search grows forward from the source and another grows backward from the
+    target along reversed edges. Each round expands a whole level of whichever
+    frontier has fewer out-edges to scan, and the search stops at the first level
+    where the two meet. On graphs with branching factor b and distance d this
+    visits roughly 2·b^(d/2) vertices instead of b^d.
+
+    Visited state is kept in dicts keyed by vertex id, so a query costs time and
+    memory proportional to the vertices it touches rather than to the graph size.
+
+    Attributes:
+        visited: The number of vertices visited by both searches during the last
+            query.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the search."""
+        self.visited = 0
+
+    def shortest_path(
+        self,
+        graph: GraphView[T],
+        source: Vertex[T],
+        target: Vertex[T],
+        reverse: Optional[GraphView[T]] = None,
+    ) -> Optional[List[Vertex[T]]]:
+        """Finds a path with the fewest edges from `source` to `target`.
+
+        Args:
+            graph: The graph to search.
+            source: The start vertex.
+            target: The destination vertex.
+            reverse: The graph with every edge reversed, sharing the vertex ids of
+                `graph`. Only used for directed graphs. Defaults to
+                `graph.reversed()` for a `Graph`, whose in-edges are cached
+                between modifications; for other graphs it is built on each
+                call unless passed in.
+
+        Returns:
+            The vertices of a shortest path from `source` to `target`, or None if
+            the target is unreachable.
+
+        Raises:
+            ValueError: If either endpoint is not in the graph.
+        """
+        if source not in graph or target not in graph:
+            raise ValueError("Source and target must be in the graph")
+        if not graph.directed:
+            reverse = graph
+        elif reverse is None and isinstance(graph, Graph):
+            reverse = graph.reversed()
+        elif reverse is None:
+            reverse = CSRGraph.from_graph(graph).reverse()
+
+        start, goal = graph.vertex_id(source), graph.vertex_id(target)
+        if start == goal:
+            self.visited = 1
+            return [source]
+
+        forward: Dict[int, int] = {start: -1}
+        backward: Dict[int, int] = {goal: -1}
+        forward_frontier, backward_frontier = [start], [goal]
+        meeting = -1
+        while forward_frontier and backward_frontier and meeting < 0:
+            if self._work(graph, forward_frontier) <= self._work(reverse, backward_frontier):
+                forward_frontier, meeting = self._expand(graph, forward_frontier, forward, backward)
+            else:
+                backward_frontier, meeting = self._expand(
+                    reverse, backward_frontier, backward, forward
+                )
+        self.visited = len(forward) + len(backward)
+        if meeting < 0:
+            return None
+
+        path = self._walk(forward, meeting)
+        path.reverse()
+        path.extend(self._walk(backward, backward[meeting]))
+        return list(map(graph.vertex_at, path))
+
+    def distance(
+        self,
+        graph: GraphView[T],
+        source: Vertex[T],
+        target: Vertex[T],
+        reverse: Optional[GraphView[T]] = None,
+    ) -> Optional[int]:
+        """Returns the number of edges on a shortest path, or None if unreachable.
+
+        Takes the same arguments as `shortest_path`.
+        """
+        path = self.shortest_path(graph, source, target, reverse)
+        return None if path is None else len(path) - 1
+
+    @staticmethod
+    def _work(graph: GraphView[T], frontier: List[int]) -> int:
+        """Returns the number of edges expanding a frontier would scan."""
+        return sum(len(graph.neighbor_ids(v)) for v in frontier)
+
+    @staticmethod
+    def _expand(
+        graph: GraphView[T], frontier: List[int], parents: Dict[int, int], other: Dict[int, int]
+    ) -> Tuple[List[int], int]:
+        """Expands one whole level of a search.
+
+        Every vertex of the new level that the other search has already visited
+        completes a path of the same length on this side, so the level is finished
+        and the meeting vertex closest to the other search's root is kept.
+
+        Returns:
+            The next frontier and the meeting vertex id, or -1 if none was found.
+        """
+        next_frontier = []
+        for current in frontier:
+            for neighbor in graph.neighbor_ids(current):
+                if neighbor not in parents:
+                    parents[neighbor] = current
+                    next_frontier.append(neighbor)
+        meeting = -1
+        best = -1
+        for v in next_frontier:
+            if v in other:
+                depth = BidirectionalBFS._depth(other, v)
+                if meeting < 0 or depth < best:
+                    meeting, best = v, depth
+        return next_frontier, meeting
+
+    @staticmethod
+    def _depth(parents: Dict[int, int], v: int) -> int:
+        """Returns the depth of a visited vertex in its search tree."""
+        depth = 0
+        while parents[v] >= 0:
+            v = parents[v]
+            depth += 1
+        return depth
+
+    @staticmethod
+    def _walk(parents: Dict[int, int], v: int) -> List[int]:
+        """Returns the ids from `v` up to the root of its search tree."""
+        path = []
+        while v >= 0:
+            path.append(v)
+            v = parents[v]
+        return path
+
+    def run(self, data: Any) -> Any:
+        """Runs the bidirectional BFS algorithm and returns the path."""
+        if not isinstance(data, tuple) or len(data) != 3:
+            raise TypeError("Expected a tuple (graph, source, target) for bidirectional BFS.")
+
+        graph, source, target = data
+        if not isinstance(graph, GraphView):
+            raise TypeError("First element of the tuple must be a Graph.")
+        if not isinstance(source, Vertex) or not isinstance(target, Vertex):
+            raise TypeError("Source and target must be Vertex objects.")
+
+        return self.shortest_path(
+            cast(GraphView[T], graph), cast(Vertex[T], source), cast(Vertex[T], target)
+        )
+
+
+_bidirectional_protocol_check: type[GraphSolver] = BidirectionalBFS
@@ -0,0 +1,162 @@
+from array import array
+from dataclasses import dataclass
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple, cast
+
+from algolib._typing import T
+from algolib.algorithms.graph.traversal.bfs import source_ids
+from algolib.data_structures.graph import GraphView, Vertex
+from algolib.interfaces import GraphSolver
+
+
+@dataclass(slots=True)
+class DFSResult(Generic[T]):
+    """The outcome of a `DFS.search`.
+
+    Times come from a single clock that ticks once when a vertex is discovered
+    and once when it is finished, so they run from 0 to `2 * len(preorder) - 1`
+    and the interval of a descendant nests inside that of its ancestor.
+
+    Attributes:
+        graph: The graph that was searched.
+        preorder: The ids of the reached vertices in discovery order.
+        postorder: The ids of the reached vertices in finishing order.
+        discovery: The discovery time of each vertex id, or -1 if unreached.
+        finish: The finishing time of each vertex id, or -1 if unreached.
+        parents: The id of each reached vertex's DFS-tree parent (-1 for roots).
+    """
+
+    graph: GraphView[T]
+    preorder: "array[int]"
+    postorder: "array[int]"
+    discovery: "array[int]"
+    finish: "array[int]"
+    parents: "array[int]"
+
+    @property
+    def visited(self) -> List[Vertex[T]]:
+        """The reached vertices in discovery order."""
+        return list(map(self.graph.vertex_at, self.preorder))
+
+    @property
+    def finished(self) -> List[Vertex[T]]:
+        """The reached vertices in finishing order."""
+        return list(map(self.graph.vertex_at, self.postorder))
+
+    def parent(self, v: Vertex[T]) -> Optional[Vertex[T]]:
+        """Returns the DFS-tree parent of a vertex, or None for roots and unreached vertices."""
+        index = self.parents[self.graph.vertex_id(v)]
+        return None if index < 0 else self.graph.vertex_at(index)
+
+    def is_ancestor(self, u: Vertex[T], v: Vertex[T]) -> bool:
+        """Checks whether `u` is an ancestor of `v` (or `v` itself) in the DFS forest."""
+        a, b = self.graph.vertex_id(u), self.graph.vertex_id(v)
+        return 0 <= self.discovery[a] <= self.discovery[b] and self.finish[b] <= self.finish[a]
+
+    def __contains__(self, item: object) -> bool:
+        """Checks whether a vertex was reached by the search."""
+        if not isinstance(item, Vertex) or item not in self.graph:
+            return False
+        return self.discovery[self.graph.vertex_id(item)] >= 0
+
+
+class DFS(Generic[T]):
+    """Depth-First Search (DFS) graph traversal algorithm.
+
+    The search keeps an explicit stack of `(vertex id, neighbor iterator)` pairs
+    instead of recursing, so it handles paths of millions of vertices without
+    touching the interpreter's recursion limit. Resuming a vertex continues its
+    iterator where it left off, which keeps the whole search O(V + E) and visits
+    vertices in exactly the order the recursive formulation would.
+    """
+
+    def traverse(self, graph: GraphView[T], start_vertex: Vertex[T]) -> List[Vertex[T]]:
+        """Performs a depth-first traversal on a graph.
+
+        Args:
+            graph: The graph to traverse.
+            start_vertex: The vertex from which to start the traversal.
+
+        Returns:
+            A list of vertices in the order they were discovered (preorder).
+
+        Raises:
+            ValueError: If the start vertex is not in the graph.
+        """
+        return self.search(graph, start_vertex).visited
+
+    def search(
+        self, graph: GraphView[T], sources: Optional[Vertex[T] | Iterable[Vertex[T]]] = None
+    ) -> DFSResult[T]:
+        """Runs a depth-first search and records orders, times and parents.
+
+        Args:
+            graph: The graph to search.
+            sources: The start vertex, or several start vertices searched in
+                turn. Defaults to every vertex in id order, which yields a DFS
+                forest covering the whole graph.
+
+        Returns:
+            A `DFSResult` with the pre- and postorder, discovery and finishing
+            times, and parents.
+
+        Raises:
+            ValueError: If a source is not in the graph, or an empty collection
+                of sources is given.
+        """
+        n = len(graph)
+        roots: Iterable[int] = range(n) if sources is None else source_ids(graph, sources)
+        result = DFSResult(
+            graph,
+            array("i"),
+            array("i"),
+            array("i", [-1]) * n,
+            array("i", [-1]) * n,
+            array("i", [-1]) * n,
+        )
+        clock = 0
+        for root in roots:
+            if result.discovery[root] < 0:
+                clock = self._visit(graph, root, clock, result)
+        return result
+
+    @staticmethod
+    def _visit(graph: GraphView[T], root: int, clock: int, result: DFSResult[T]) -> int:
+        """Searches the tree rooted at `root` and returns the advanced clock."""
+        discovery, finish, parents = result.discovery, result.finish, result.parents
+        preorder, postorder = result.preorder, result.postorder
+        discovery[root] = clock
+        clock += 1
+        preorder.append(root)
+        stack: List[Tuple[int, Iterator[int]]] = [(root, iter(graph.neighbor_ids(root)))]
+        while stack:
+            current, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if discovery[neighbor] < 0:
+                    discovery[neighbor] = clock
+                    clock += 1
+                    parents[neighbor] = current
+                    preorder.append(neighbor)
+                    stack.append((neighbor, iter(graph.neighbor_ids(neighbor))))
+                    break
+            else:
+                stack.pop()
+                finish[current] = clock
+                clock += 1
+                postorder.append(current)
+        return clock
+
+    def run(self, data: Any) -> Any:
+        """Runs the DFS algorithm."""
+        if not isinstance(data, tuple) or len(data) != 2:
+            raise TypeError("Expected a tuple (graph, start_vertex) for DFS.")
+
+        graph, start_vertex = data
+        if not isinstance(graph, GraphView):
+            raise TypeError("First element of the tuple must be a Graph.")
+        if not isinstance(start_vertex, Vertex):
+            raise TypeError("Second element of the tuple must be a Vertex.")
+
+        return self.traverse(cast(GraphView[T], graph), cast(Vertex[T], start_vertex))
+
+
+_dfs_protocol_check: type[GraphSolver] = DFS
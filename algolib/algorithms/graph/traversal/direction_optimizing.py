@@ -0,0 +1,196 @@
+from array import array
+from typing import Any, Generic, Iterable, List, Optional, Tuple, cast
+
+from algolib._typing import T
+from algolib.algorithms.graph.traversal.bfs import BFSResult, source_ids
+from algolib.data_structures.csr_graph import CSRGraph
+from algolib.data_structures.graph import Vertex
+from algolib.interfaces import GraphSolver
+
+
+class DirectionOptimizingBFS(Generic[T]):
+    """Direction-optimizing breadth-first search (Beamer et al.) on a `CSRGraph`.
+
+    Each level is expanded either top-down, scanning the out-edges of the frontier,
+    or bottom-up, letting every unvisited vertex scan its in-edges until it finds a
+    parent in the frontier. Bottom-up steps stop at the first hit, so on
+    low-diameter graphs they skip most of the edges a top-down step would check
+    against already-visited vertices. The frontier for a bottom-up step is a
+    bytearray map with one byte per vertex.
+
+    The search switches to bottom-up when the frontier's out-edges exceed
+    `1 / alpha` of the edges left on unvisited vertices, and back to top-down when
+    the frontier shrinks below `1 / beta` of the vertices.
+
+    Attributes:
+        alpha: The top-down to bottom-up switching threshold.
+        beta: The bottom-up to top-down switching threshold.
+        directions: The direction used for each level of the last search, as
+            `"top-down"` or `"bottom-up"`.
+    """
+
+    def __init__(self, alpha: float = 15.0, beta: float = 18.0) -> None:
+        """Initializes the search.
+
+        Args:
+            alpha: The top-down to bottom-up switching threshold. Defaults to 15.
+            beta: The bottom-up to top-down switching threshold. Defaults to 18.
+
+        Raises:
+            ValueError: If either threshold is not positive.
+        """
+        if alpha <= 0 or beta <= 0:
+            raise ValueError("alpha and beta must be positive")
+        self.alpha = alpha
+        self.beta = beta
+        self.directions: List[str] = []
+
+    def search(
+        self,
+        graph: CSRGraph[T],
+        sources: Vertex[T] | Iterable[Vertex[T]],
+        reverse: Optional[CSRGraph[T]] = None,
+    ) -> BFSResult[T]:
+        """Runs a breadth-first search and records distances and parents.
+
+        Args:
+            graph: The graph to search.
+            sources: The start vertex, or several start vertices at distance 0.
+            reverse: The reversed graph, as returned by `graph.reverse()`. Pass it
+                in to reuse it across searches; it is built on demand otherwise.
+
+        Returns:
+            A `BFSResult` with the distances, parents and discovery order.
+
+        Raises:
+            ValueError: If a source is not in the graph, or no source is given.
+        """
+        n = len(graph)
+        offsets = graph.offsets
+        distances = array("i", [-1]) * n
+        parents = array("i", [-1]) * n
+        order = array("i")
+        frontier: List[int] = []
+        for index in source_ids(graph, sources):
+            if distances[index] < 0:
+                distances[index] = 0
+                frontier.append(index)
+        order.extend(frontier)
+
+        self.directions = []
+        unvisited_edges = graph.num_edges - self._out_degree(offsets, frontier)
+        unvisited: Optional[List[int]] = None
+        top_down = True
+        depth = 0
+        while frontier:
+            depth += 1
+            frontier_edges = self._out_degree(offsets, frontier)
+            if top_down and frontier_edges > unvisited_edges / self.alpha:
+                top_down = False
+            elif not top_down and len(frontier) < n / self.beta:
+                top_down = True
+
+            if top_down:
+                self.directions.append("top-down")
+                frontier = self._top_down_step(graph, frontier, distances, parents, depth)
+            else:
+                self.directions.append("bottom-up")
+                if reverse is None:
+                    reverse = graph.reverse()
+                if unvisited is None:
+                    unvisited = [v for v in range(n) if distances[v] < 0]
+                frontier, unvisited = self._bottom_up_step(
+                    reverse, frontier, unvisited, distances, parents, depth
+                )
+            order.extend(frontier)
+            unvisited_edges -= self._out_degree(offsets, frontier)
+        return BFSResult(graph, distances, parents, order)
+
+    def traverse(self, graph: CSRGraph[T], start_vertex: Vertex[T]) -> List[Vertex[T]]:
+        """Performs a breadth-first traversal on a graph.
+
+        Args:
+            graph: The graph to traverse.
+            start_vertex: The vertex from which to start the traversal.
+
+        Returns:
+            A list of the reachable vertices in order of increasing depth.
+
+        Raises:
+            ValueError: If the start vertex is not in the graph.
+        """
+        return self.search(graph, start_vertex).visited
+
+    @staticmethod
+    def _out_degree(offsets: "array[int]", vertices: List[int]) -> int:
+        """Returns the total number of out-edges of the given vertex ids."""
+        return sum(offsets[v + 1] - offsets[v] for v in vertices)
+
+    @staticmethod
+    def _top_down_step(
+        graph: CSRGraph[T],
+        frontier: List[int],
+        distances: "array[int]",
+        parents: "array[int]",
+        depth: int,
+    ) -> List[int]:
+        """Expands the frontier along its out-edges and returns the next frontier."""
+        offsets, targets = graph.offsets, graph.targets
+        next_frontier = []
+        for current in frontier:
+            for neighbor in targets[offsets[current] : offsets[current + 1]]:
+                if distances[neighbor] < 0:
+                    distances[neighbor] = depth
+                    parents[neighbor] = current
+                    next_frontier.append(neighbor)
+        return next_frontier
+
+    @staticmethod
+    def _bottom_up_step(
+        reverse: CSRGraph[T],
+        frontier: List[int],
+        unvisited: List[int],
+        distances: "array[int]",
+        parents: "array[int]",
+        depth: int,
+    ) -> Tuple[List[int], List[int]]:
+        """Lets each unvisited vertex look for a parent among its in-neighbors.
+
+        Returns:
+            The next frontier and the vertices that are still unvisited.
+        """
+        offsets, sources = reverse.offsets, reverse.targets
+        in_frontier = bytearray(len(distances))
+        for v in frontier:
+            in_frontier[v] = 1
+        next_frontier = []
+        remaining = []
+        for v in unvisited:
+            if distances[v] >= 0:
+                # Discovered by an earlier top-down step.
+                continue
+            for parent in sources[offsets[v] : offsets[v + 1]]:
+                if in_frontier[parent]:
+                    distances[v] = depth
+                    parents[v] = parent
+                    next_frontier.append(v)
+                    break
+            else:
+                remaining.append(v)
+        return next_frontier, remaining
+
+    def run(self, data: Any) -> Any:
+        """Runs the direction-optimizing BFS algorithm."""
+        if not isinstance(data, tuple) or len(data) != 2:
+            raise TypeError("Expected a tuple (graph, start_vertex) for BFS.")
+
+        graph, start_vertex = data
+        if not isinstance(graph, CSRGraph):
+            raise TypeError("First element of the tuple must be a CSRGraph.")
+        if not isinstance(start_vertex, Vertex):
+            raise TypeError("Second element of the tuple must be a Vertex.")
+
+        return self.traverse(cast(CSRGraph[T], graph), cast(Vertex[T], start_vertex))
+
+
+_direction_optimizing_protocol_check: type[GraphSolver] = DirectionOptimizingBFS
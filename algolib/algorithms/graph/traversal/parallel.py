@@ -0,0 +1,271 @@
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Generic, Iterable, List, Literal, Optional, Sequence, Tuple, cast
+
+from algolib._typing import T
+from algolib.algorithms.graph.traversal.bfs import BFSResult, source_ids
+from algolib.data_structures.csr_graph import CSRGraph
+from algolib.data_structures.graph import Vertex
+from algolib.interfaces import GraphSolver
+
+_Format = Literal["B", "i", "q"]
+
+
+@dataclass(slots=True, frozen=True)
+class LevelStats:
+    """Timing report for one level of a parallel BFS.
+
+    Attributes:
+        depth: The depth of the vertices discovered by this level.
+        frontier: The number of vertices expanded.
+        discovered: The number of new vertices found.
+        seconds: Wall-clock time spent on the level, including the merge.
+        parallel: Whether the level was split across the worker pool.
+    """
+
+    depth: int
+    frontier: int
+    discovered: int
+    seconds: float
+    parallel: bool
+
+
+class ParallelBFS(Generic[T]):
+    """Level-synchronous breadth-first search over a process pool.
+
+    The CSR arrays of the graph are copied once into shared memory, and each
+    worker process maps them without copying. Every level, the frontier is split
+    into one slice per worker; workers scan the out-edges of their slice, mark
+    newly seen vertices in a shared visited map and a shared next-frontier map,
+    record a parent for each, and return the ids they discovered. The main
+    process merges those lists into the next frontier, clearing just their
+    entries of the next-frontier map, so a level costs time in proportion to
+    the frontier and its out-edges rather than to the whole graph. Two workers
+    may race to claim the same vertex; both then write a valid parent from the
+    current level, so the result is still a correct BFS tree, and the merge
+    keeps the vertex once.
+
+    The shared maps use one byte per vertex rather than one bit, so that workers
+    can set entries with plain stores instead of read-modify-write sequences that
+    could lose each other's updates.
+
+    Levels with fewer than `min_parallel_frontier` vertices are expanded in the
+    main process, where the IPC round-trip would cost more than the scan.
+
+    Attributes:
+        workers: The number of worker processes.
+        min_parallel_frontier: The smallest frontier that is split across workers.
+        levels: Per-level timings of the last search.
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_parallel_frontier: int = 4096) -> None:
+        """Initializes the search.
+
+        Args:
+            workers: The number of worker processes. Defaults to the CPU count.
+            min_parallel_frontier: The smallest frontier that is split across
+                workers. Defaults to 4096.
+
+        Raises:
+            ValueError: If `workers` is less than 1.
+        """
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.min_parallel_frontier = min_parallel_frontier
+        self.levels: List[LevelStats] = []
+
+    def search(self, graph: CSRGraph[T], sources: Vertex[T] | Iterable[Vertex[T]]) -> BFSResult[T]:
+        """Runs a parallel breadth-first search and records distances and parents.
+
+        Args:
+            graph: The graph to search.
+            sources: The start vertex, or several start vertices at distance 0.
+
+        Returns:
+            A `BFSResult` with the distances, parents and discovery order. Within
+            a level, vertices are ordered by id.
+
+        Raises:
+            ValueError: If a source is not in the graph, or no source is given.
+        """
+        n = len(graph)
+        starts = source_ids(graph, sources)
+        with _SharedGraph(graph) as shared:
+            visited, next_map, parents = (
+                shared.views["visited"],
+                shared.views["next"],
+                shared.views["parents"],
+            )
+            distances = array("i", [-1]) * n
+            frontier = sorted(set(starts))
+            for v in frontier:
+                visited[v] = 1
+                distances[v] = 0
+            order = array("i", frontier)
+
+            self.levels = []
+            pool: Optional[ProcessPoolExecutor] = None
+            try:
+                depth = 0
+                while frontier:
+                    depth += 1
+                    start = time.perf_counter()
+                    parallel = self.workers > 1 and len(frontier) >= self.min_parallel_frontier
+                    if parallel:
+                        if pool is None:
+                            pool = ProcessPoolExecutor(
+                                self.workers, initializer=_attach, initargs=(shared.names,)
+                            )
+                        step = -(-len(frontier) // self.workers)
+                        chunks = [frontier[i : i + step] for i in range(0, len(frontier), step)]
+                        discovered = list(pool.map(_expand_shared, chunks))
+                    else:
+                        discovered = [_expand(shared.views, frontier)]
+
+                    next_frontier = _merge_discovered(next_map, discovered)
+                    for v in next_frontier:
+                        distances[v] = depth
+                    order.extend(next_frontier)
+                    self.levels.append(
+                        LevelStats(
+                            depth,
+                            len(frontier),
+                            len(next_frontier),
+                            time.perf_counter() - start,
+                            parallel,
+                        )
+                    )
+                    frontier = next_frontier
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+            parent_ids = array("i", parents.tobytes())
+        return BFSResult(graph, distances, parent_ids, order)
+
+    def traverse(self, graph: CSRGraph[T], start_vertex: Vertex[T]) -> List[Vertex[T]]:
+        """Performs a parallel breadth-first traversal on a graph.
+
+        Args:
+            graph: The graph to traverse.
+            start_vertex: The vertex from which to start the traversal.
+
+        Returns:
+            A list of the reachable vertices in order of increasing depth.
+
+        Raises:
+            ValueError: If the start vertex is not in the graph.
+        """
+        return self.search(graph, start_vertex).visited
+
+    def run(self, data: Any) -> Any:
+        """Runs the parallel BFS algorithm."""
+        if not isinstance(data, tuple) or len(data) != 2:
+            raise TypeError("Expected a tuple (graph, start_vertex) for BFS.")
+
+        graph, start_vertex = data
+        if not isinstance(graph, CSRGraph):
+            raise TypeError("First element of the tuple must be a CSRGraph.")
+        if not isinstance(start_vertex, Vertex):
+            raise TypeError("Second element of the tuple must be a Vertex.")
+
+        return self.traverse(cast(CSRGraph[T], graph), cast(Vertex[T], start_vertex))
+
+
+class _SharedGraph:
+    """Shared-memory copies of a CSR graph plus the per-search BFS maps."""
+
+    def __init__(self, graph: CSRGraph[Any]) -> None:
+        n = len(graph)
+        self._blocks: List[SharedMemory] = []
+        self.views: Dict[str, memoryview] = {}
+        self.names: List[Tuple[str, str, _Format, int]] = []
+        self._add("offsets", "q", graph.offsets.tobytes())
+        self._add("targets", "i", graph.targets.tobytes())
+        self._add("visited", "B", bytes(n))
+        self._add("next", "B", bytes(n))
+        self._add("parents", "i", array("i", [-1]).tobytes() * n)
+
+    def _add(self, key: str, fmt: _Format, data: bytes) -> None:
+        # SharedMemory rejects zero-sized blocks.
+        block = SharedMemory(create=True, size=max(len(data), 1))
+        self._blocks.append(block)
+        view = _view(block, len(data), fmt)
+        view.cast("B")[:] = data
+        self.views[key] = view
+        self.names.append((key, block.name, fmt, len(data)))
+
+    def __enter__(self) -> "_SharedGraph":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        for view in self.views.values():
+            view.release()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+
+
+# Per-worker state, set up once by `_attach` when the worker process starts.
+_worker_blocks: List[SharedMemory] = []
+_worker_views: Dict[str, memoryview] = {}
+
+
+def _attach(names: Sequence[Tuple[str, str, _Format, int]]) -> None:
+    """Maps the shared blocks of a search into a worker process."""
+    for key, name, fmt, nbytes in names:
+        block = SharedMemory(name=name)
+        _worker_blocks.append(block)
+        _worker_views[key] = _view(block, nbytes, fmt)
+
+
+def _view(block: SharedMemory, nbytes: int, fmt: _Format) -> memoryview:
+    """Returns a typed view of the first `nbytes` of a shared memory block."""
+    return cast(memoryview, block.buf)[:nbytes].cast(fmt)
+
+
+def _expand_shared(frontier: List[int]) -> List[int]:
+    """Expands a slice of the frontier inside a worker process."""
+    return _expand(_worker_views, frontier)
+
+
+def _expand(views: Dict[str, memoryview], frontier: List[int]) -> List[int]:
+    """Marks the unvisited out-neighbors of `frontier` in the shared maps.
+
+    Returns:
+        The ids this call marked, each once.
+    """
+    offsets, targets = views["offsets"], views["targets"]
+    visited, next_map, parents = views["visited"], views["next"], views["parents"]
+    discovered: List[int] = []
+    for current in frontier:
+        for neighbor in targets[offsets[current] : offsets[current + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                next_map[neighbor] = 1
+                parents[neighbor] = current
+                discovered.append(neighbor)
+    return discovered
+
+
+def _merge_discovered(next_map: memoryview, discovered: Iterable[List[int]]) -> List[int]:
+    """Returns the sorted next frontier and clears its entries of `next_map`.
+
+    A vertex claimed by two racing workers appears in both of their lists; the
+    first occurrence clears its entry, so the second is skipped.
+    """
+    next_frontier: List[int] = []
+    for ids in discovered:
+        for v in ids:
+            if next_map[v]:
+                next_map[v] = 0
+                next_frontier.append(v)
+    next_frontier.sort()
+    return next_frontier
+
+
+_parallel_protocol_check: type[GraphSolver] = ParallelBFS
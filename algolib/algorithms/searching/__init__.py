@@ -1,7 +1,31 @@
 """Searching algorithm implementations."""
 
+from .aho_corasick import AhoCorasick
 from .base import Searcher
 from .binary import BinarySearcher
+from .hash_index import HashIndexSearcher, IndexStats, VersionedList
+from .learned import LearnedIndexSearcher
 from .linear import LinearSearcher
+from .mmap_file import FixedWidthRecordFile, LineRecordFile
+from .predicate import MemoizedPredicate, PredicateSearcher
+from .substring import HorspoolSearcher, KMPSearcher, SubstringSearcher
+from .suffix_array import SuffixArray
 
-__all__ = ["Searcher", "LinearSearcher", "BinarySearcher"]
+__all__ = [
+    "Searcher",
+    "LinearSearcher",
+    "BinarySearcher",
+    "HashIndexSearcher",
+    "IndexStats",
+    "VersionedList",
+    "PredicateSearcher",
+    "MemoizedPredicate",
+    "FixedWidthRecordFile",
+    "LineRecordFile",
+    "LearnedIndexSearcher",
+    "SubstringSearcher",
+    "HorspoolSearcher",
+    "KMPSearcher",
+    "AhoCorasick",
+    "SuffixArray",
+]
@@ -0,0 +1,146 @@
+"""Aho-Corasick multi-pattern search implementation."""
+
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from algolib.algorithms.searching.substring import ByteBuffer
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton for matching many byte patterns in one pass.
+
+    The automaton is built once from a pattern set and stored in flat tables:
+    each state's outgoing edges are a slice of a shared label string and target
+    array, and failure and output links are integer arrays. Scanning is O(n +
+    matches) regardless of the number of patterns, and the tables pickle into a
+    few compact buffers so a built automaton is cheap to ship to worker processes.
+
+    Attributes:
+        patterns: The patterns, indexed by pattern id.
+    """
+
+    def __init__(self, patterns: Iterable[bytes]) -> None:
+        """Builds the automaton.
+
+        Args:
+            patterns: The non-empty byte patterns to match. A pattern's id is its
+                position in this iterable.
+
+        Raises:
+            ValueError: If any pattern is empty.
+        """
+        self.patterns: List[bytes] = list(patterns)
+        if any(not pattern for pattern in self.patterns):
+            raise ValueError("patterns must not be empty")
+
+        # Build the trie with temporary dicts, then freeze it into arrays.
+        children: List[Dict[int, int]] = [{}]
+        output = array("i", [-1])
+        same_next = array("i", [-1] * len(self.patterns))
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for byte in pattern:
+                nxt = children[state].get(byte)
+                if nxt is None:
+                    nxt = len(children)
+                    children[state][byte] = nxt
+                    children.append({})
+                    output.append(-1)
+                state = nxt
+            same_next[pattern_id] = output[state]
+            output[state] = pattern_id
+
+        fail = array("i", [0] * len(children))
+        dict_link = array("i", [0] * len(children))
+        queue = deque(children[0].values())
+        while queue:
+            state = queue.popleft()
+            for byte, child in children[state].items():
+                fallback = fail[state]
+                while fallback and byte not in children[fallback]:
+                    fallback = fail[fallback]
+                link = children[fallback].get(byte, 0)
+                fail[child] = link
+                dict_link[child] = link if output[link] != -1 else dict_link[link]
+                queue.append(child)
+
+        edge_start = array("i", [0])
+        labels = bytearray()
+        targets = array("i")
+        for edges in children:
+            for byte in sorted(edges):
+                labels.append(byte)
+                targets.append(edges[byte])
+            edge_start.append(len(targets))
+
+        self._edge_start = edge_start
+        self._labels = bytes(labels)
+        self._targets = targets
+        self._fail = fail
+        self._output = output
+        self._dict_link = dict_link
+        self._same_next = same_next
+        self._lengths = array("i", (len(pattern) for pattern in self.patterns))
+
+    @property
+    def states(self) -> int:
+        """The number of states in the automaton."""
+        return len(self._fail)
+
+    def scan(self, data: ByteBuffer) -> Iterator[Tuple[int, int]]:
+        """Yields every pattern occurrence in a buffer.
+
+        Args:
+            data: The buffer to scan.
+
+        Yields:
+            `(offset, pattern_id)` pairs, where `offset` is the start of the match,
+            in order of the match's end position.
+        """
+        return self.scan_chunks((data,))
+
+    def scan_chunks(self, chunks: Iterable[ByteBuffer]) -> Iterator[Tuple[int, int]]:
+        """Yields every pattern occurrence across a stream of chunks.
+
+        The automaton state is carried from one chunk to the next, so matches that
+        straddle chunk boundaries are found without buffering.
+
+        Args:
+            chunks: The chunks of the stream, in order.
+
+        Yields:
+            `(offset, pattern_id)` pairs with offsets relative to the stream start.
+        """
+        edge_start, labels, targets = self._edge_start, self._labels, self._targets
+        fail, output, dict_link = self._fail, self._output, self._dict_link
+        same_next, lengths = self._same_next, self._lengths
+
+        state = 0
+        base = 0
+        for chunk in chunks:
+            with memoryview(chunk) as view, view.cast("B") as flat:
+                for i, byte in enumerate(flat):
+                    while True:
+                        edge = labels.find(byte, edge_start[state], edge_start[state + 1])
+                        if edge >= 0:
+                            state = targets[edge]
+                            break
+                        if not state:
+                            break
+                        state = fail[state]
+
+                    hit = state if output[state] != -1 else dict_link[state]
+                    while hit:
+                        pattern_id = output[hit]
+                        while pattern_id != -1:
+                            yield base + i - lengths[pattern_id] + 1, pattern_id
+                            pattern_id = same_next[pattern_id]
+                        hit = dict_link[hit]
+                base += len(flat)
+
+    def run(self, data: Any) -> Any:
+        """Runs the automaton over a buffer and returns all matches."""
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Expected a bytes-like buffer for Aho-Corasick scanning.")
+        return list(self.scan(data))
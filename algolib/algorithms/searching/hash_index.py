@@ -0,0 +1,209 @@
+"""Hash index search algorithm implementation."""
+
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, MutableSequence, Optional, Sequence, overload
+
+from algolib._typing import ComparableT, T
+from algolib.algorithms.searching.base import Searcher
+
+
+@dataclass(slots=True, frozen=True)
+class IndexStats:
+    """Cost report for an index build.
+
+    Attributes:
+        size: The number of distinct values in the index.
+        build_seconds: Wall-clock time spent building the index.
+        memory_bytes: Approximate size of the index mapping itself. Keys are shared
+            with the indexed sequence and are not counted.
+    """
+
+    size: int
+    build_seconds: float
+    memory_bytes: int
+
+
+class VersionedList(MutableSequence[T]):
+    """A list wrapper that bumps a version counter on every mutation.
+
+    Searchers that cache derived state (such as `HashIndexSearcher`) compare the
+    version against the one they last saw to detect changes without rescanning.
+    """
+
+    __slots__ = ("_items", "version")
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        """Initializes the list with an optional iterable of items.
+
+        Args:
+            items: The initial items.
+        """
+        self._items: List[T] = list(items)
+        self.version = 0
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | List[T]:
+        """Returns the item (or list of items) at the given index or slice."""
+        return self._items[index]
+
+    @overload
+    def __setitem__(self, index: int, value: T) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: T | Iterable[T]) -> None:
+        """Replaces the item (or items) at the given index or slice."""
+        self._items[index] = value  # type: ignore[index,assignment]
+        self.version += 1
+
+    def __delitem__(self, index: int | slice) -> None:
+        """Deletes the item (or items) at the given index or slice."""
+        del self._items[index]
+        self.version += 1
+
+    def __len__(self) -> int:
+        """Returns the number of items in the list."""
+        return len(self._items)
+
+    def insert(self, index: int, value: T) -> None:
+        """Inserts an item before the given index."""
+        self._items.insert(index, value)
+        self.version += 1
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the list."""
+        return f"VersionedList({self._items}, version={self.version})"
+
+
+class HashIndexSearcher(Searcher[ComparableT]):
+    """Hash index search implementation.
+
+    This searcher builds a mapping from each value to the index of its first
+    occurrence, then answers lookups in O(1) until the data changes. The index is
+    rebuilt automatically when a different sequence is searched, when the length
+    of the indexed sequence changes, or when a `VersionedList` reports a new
+    version. In-place assignments to a plain list are not detectable; report them
+    through `notify_set` (or call `invalidate`) so the index stays correct.
+
+    Values in the data must be hashable.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty, unbuilt index."""
+        self._index: Dict[ComparableT, int] = {}
+        self._source: Optional[Sequence[ComparableT]] = None
+        self._length = 0
+        self._version: Optional[int] = None
+        self._valid = False
+        self.stats: Optional[IndexStats] = None
+
+    def search(self, data: Sequence[ComparableT], target: ComparableT) -> int | None:
+        """Looks up the first index of a target, building the index if needed.
+
+        Args:
+            data: The sequence to search in.
+            target: The value to search for.
+
+        Returns:
+            The index of the first occurrence of the target, or None if not found.
+        """
+        if self._is_stale(data):
+            self.build(data)
+        return self._index.get(target)
+
+    def build(self, data: Sequence[ComparableT]) -> IndexStats:
+        """Builds the value-to-first-index map for a sequence.
+
+        Args:
+            data: The sequence to index.
+
+        Returns:
+            The cost report for this build, also stored on `stats`.
+        """
+        start = time.perf_counter()
+        index: Dict[ComparableT, int] = {}
+        for i, item in enumerate(data):
+            index.setdefault(item, i)
+        elapsed = time.perf_counter() - start
+
+        self._index = index
+        self._source = data
+        self._length = len(data)
+        self._version = getattr(data, "version", None)
+        self._valid = True
+        self.stats = IndexStats(len(index), elapsed, sys.getsizeof(index))
+        return self.stats
+
+    def invalidate(self) -> None:
+        """Marks the index as stale so the next search rebuilds it."""
+        self._valid = False
+
+    def notify_append(self, value: ComparableT) -> None:
+        """Incrementally updates the index after a value was appended to the data.
+
+        Args:
+            value: The value that was appended.
+        """
+        if not self._valid or self._source is None:
+            return
+        self._index.setdefault(value, self._length)
+        self._length += 1
+        self._sync_version()
+
+    def notify_set(self, index: int, old_value: ComparableT) -> None:
+        """Incrementally updates the index after `data[index]` was reassigned.
+
+        Args:
+            index: The position that was assigned to.
+            old_value: The value previously stored at that position.
+
+        Raises:
+            IndexError: If the index is outside the indexed sequence.
+        """
+        if not self._valid or self._source is None:
+            return
+        if not 0 <= index < self._length:
+            raise IndexError("notify_set index out of range")
+
+        data = self._source
+        if self._index.get(old_value) == index:
+            # The first occurrence moved; find the next one, if any.
+            del self._index[old_value]
+            for i in range(index + 1, self._length):
+                if data[i] == old_value:
+                    self._index[old_value] = i
+                    break
+
+        new_value = data[index]
+        first = self._index.get(new_value)
+        if first is None or first > index:
+            self._index[new_value] = index
+        self._sync_version()
+
+    def _is_stale(self, data: Sequence[ComparableT]) -> bool:
+        """Checks whether the index must be rebuilt before searching `data`."""
+        if not self._valid or data is not self._source or len(data) != self._length:
+            return True
+        return getattr(data, "version", None) != self._version
+
+    def _sync_version(self) -> None:
+        """Accounts for the one mutation an incremental update just reported.
+
+        A `VersionedList` bumps its version once per mutation, so any other step
+        means a mutation went unreported and the index is invalidated instead.
+        """
+        version = getattr(self._source, "version", None)
+        if version is None or self._version is None:
+            return
+        if version == self._version + 1:
+            self._version = version
+        else:
+            self._valid = False
@@ -0,0 +1,201 @@
+"""Learned index (piecewise-linear model) search implementation."""
+
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Optional, Sequence
+
+from algolib.algorithms.searching.base import Searcher
+
+_MAGIC = b"ALGOLIDX"
+_HEADER = struct.Struct("<8sqqq")
+
+
+class LearnedIndexSearcher(Searcher[float]):
+    """Learned index search for large sorted numeric sequences.
+
+    The sorted keys are covered by linear segments (a PGM-style index built with
+    the shrinking-cone method) such that every key's position is predicted within
+    `epsilon` slots. A lookup locates the segment by bisecting the few segment
+    start keys, evaluates one line, and finishes with a binary search over a
+    window of about `2 * epsilon` slots instead of the whole sequence.
+
+    The model is fitted on first use for a sequence (or explicitly with `fit`) and
+    reused for as long as the same sequence is searched at the same length. A
+    sequence that grows or shrinks is refitted; one edited in place without a
+    change of length must be refitted with `fit`.
+    """
+
+    def __init__(self, epsilon: int = 32) -> None:
+        """Initializes an unfitted index.
+
+        Args:
+            epsilon: The maximum distance between a key's predicted and actual
+                position. Larger values give fewer segments but wider final searches.
+
+        Raises:
+            ValueError: If epsilon is negative.
+        """
+        if epsilon < 0:
+            raise ValueError("epsilon must be non-negative")
+        self.epsilon = epsilon
+        self._keys: Optional[Sequence[float]] = None
+        self._n = 0
+        self._fitted = False
+        self._seg_keys = array("d")
+        self._seg_slopes = array("d")
+        self._seg_pos = array("q")
+
+    @property
+    def segments(self) -> int:
+        """The number of linear segments in the model."""
+        return len(self._seg_pos)
+
+    @property
+    def size_bytes(self) -> int:
+        """The size of the model's segment tables in bytes."""
+        return sum(len(a) * a.itemsize for a in (self._seg_keys, self._seg_slopes, self._seg_pos))
+
+    def fit(self, keys: Sequence[float]) -> None:
+        """Fits the piecewise-linear model to a sorted sequence of keys.
+
+        Args:
+            keys: The sorted keys to index.
+
+        Raises:
+            ValueError: If the keys are not sorted.
+        """
+        seg_keys = array("d")
+        seg_slopes = array("d")
+        seg_pos = array("q")
+        eps = self.epsilon
+        n = len(keys)
+
+        start = 0
+        while start < n:
+            origin = keys[start]
+            low_slope, high_slope = 0.0, float("inf")
+            end = start + 1
+            while end < n:
+                dx = keys[end] - origin
+                dy = end - start
+                if keys[end] < keys[end - 1]:
+                    raise ValueError("Keys must be sorted")
+                if dx == 0:
+                    # Duplicates of the origin are all predicted at `start`.
+                    if dy > eps:
+                        break
+                else:
+                    new_low = max(low_slope, (dy - eps) / dx)
+                    new_high = min(high_slope, (dy + eps) / dx)
+                    if new_low > new_high:
+                        break
+                    low_slope, high_slope = new_low, new_high
+                end += 1
+
+            slope = low_slope if high_slope == float("inf") else (low_slope + high_slope) / 2
+            seg_keys.append(origin)
+            seg_slopes.append(slope)
+            seg_pos.append(start)
+            start = end
+
+        self._seg_keys, self._seg_slopes, self._seg_pos = seg_keys, seg_slopes, seg_pos
+        self._keys = keys
+        self._n = n
+        self._fitted = True
+
+    def search(self, data: Sequence[float], target: float) -> int | None:
+        """Searches a sorted sequence using the learned model.
+
+        Args:
+            data: The sorted sequence to search in.
+            target: The value to search for.
+
+        Returns:
+            The index of the first occurrence of the target, or None if not found.
+        """
+        if (
+            not self._fitted
+            or len(data) != self._n
+            or (data is not self._keys and not self._adopt(data))
+        ):
+            self.fit(data)
+        if not self._seg_pos:
+            return None
+
+        seg = bisect_left(self._seg_keys, target)
+        if seg < len(self._seg_keys) and self._seg_keys[seg] == target:
+            start = self._seg_pos[seg]
+            # A run of duplicates may have started in the previous segment.
+            if data[start] == target and (start == 0 or data[start - 1] < target):
+                return start
+        seg = max(seg - 1, 0)
+
+        predicted = int(self._seg_pos[seg] + self._seg_slopes[seg] * (target - self._seg_keys[seg]))
+        n = self._n
+        low = min(max(0, predicted - self.epsilon - 1), n)
+        high = max(min(n, predicted + self.epsilon + 2), low)
+        # Keys that are not exactly representable as floats can land outside the
+        # predicted window; fall back to the full range when the bounds miss.
+        if (low > 0 and not data[low - 1] < target) or (high < n and data[high] < target):
+            low, high = 0, n
+        index = bisect_left(data, target, low, high)
+        if index < n and data[index] == target:
+            return index
+        return None
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Writes the fitted model (not the keys) to a file.
+
+        Args:
+            path: The destination path.
+
+        Raises:
+            ValueError: If the model has not been fitted.
+        """
+        if not self._fitted:
+            raise ValueError("Cannot save an unfitted index")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.epsilon, self._n, self.segments))
+            self._seg_keys.tofile(f)
+            self._seg_slopes.tofile(f)
+            self._seg_pos.tofile(f)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "LearnedIndexSearcher":
+        """Reads a model written by `save`.
+
+        The loaded model binds to the first sequence it is used with whose length
+        matches the one it was fitted on.
+
+        Args:
+            path: The path of the saved model.
+
+        Returns:
+            A fitted searcher.
+
+        Raises:
+            ValueError: If the file is not a saved learned index.
+        """
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError("Not a learned index file")
+            magic, epsilon, n, segments = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError("Not a learned index file")
+            searcher = cls(epsilon)
+            searcher._seg_keys.fromfile(f, segments)
+            searcher._seg_slopes.fromfile(f, segments)
+            searcher._seg_pos.fromfile(f, segments)
+        searcher._n = n
+        searcher._fitted = True
+        return searcher
+
+    def _adopt(self, data: Sequence[float]) -> bool:
+        """Binds a loaded model to the first sequence of matching length."""
+        if self._keys is None and len(data) == self._n:
+            self._keys = data
+            return True
+        return False
@@ -0,0 +1,224 @@
+"""Binary search over sorted on-disk files through a memory map."""
+
+import mmap
+import os
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Sequence, Tuple, overload
+
+
+class _MappedFile(ABC):
+    """Owns a read-only memory map of a file and its lifetime."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Opens and maps a file read-only.
+
+        Args:
+            path: The path of the file to map.
+        """
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # Zero-length files cannot be mapped; an empty bytes object behaves the same.
+        self._buf: mmap.mmap | bytes = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        )
+
+    def close(self) -> None:
+        """Unmaps and closes the file."""
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._file.close()
+
+    def __enter__(self) -> "_MappedFile":
+        """Returns the mapped file for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the mapped file on leaving the context."""
+        self.close()
+
+    def find(self, key: bytes) -> Optional[int]:
+        """Finds the byte offset of the first record whose key equals `key`.
+
+        Args:
+            key: The key to search for, compared as raw bytes.
+
+        Returns:
+            The byte offset of the matching record, or None if not found.
+        """
+        return self._find_from(key, 0)[0]
+
+    def find_many(self, keys: Iterable[bytes]) -> List[Optional[int]]:
+        """Finds the byte offsets of many keys in a single forward sweep.
+
+        The keys are looked up in sorted order, each search starting where the
+        previous one ended, so consecutive probes touch neighbouring pages.
+
+        Args:
+            keys: The keys to search for.
+
+        Returns:
+            The offset (or None) for each key, in the order the keys were given.
+        """
+        key_list = list(keys)
+        results: List[Optional[int]] = [None] * len(key_list)
+        start = 0
+        for i in sorted(range(len(key_list)), key=key_list.__getitem__):
+            results[i], start = self._find_from(key_list[i], start)
+        return results
+
+    @abstractmethod
+    def _find_from(self, key: bytes, start: int) -> Tuple[Optional[int], int]:
+        """Searches from a lower bound and returns (match, next lower bound)."""
+
+
+class FixedWidthRecordFile(_MappedFile, Sequence[bytes]):
+    """A sorted file of fixed-width records, searched in place.
+
+    The file is exposed as a read-only sequence of record keys, so it can also be
+    passed straight to `BinarySearcher`. Only the bytes of probed keys are copied
+    out of the map.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        record_size: int,
+        key_offset: int = 0,
+        key_size: Optional[int] = None,
+    ) -> None:
+        """Maps a fixed-width record file.
+
+        Args:
+            path: The path of the file to map.
+            record_size: The size of each record in bytes.
+            key_offset: The offset of the key within each record.
+            key_size: The size of the key in bytes. Defaults to the rest of the record.
+
+        Raises:
+            ValueError: If the layout is invalid or the file size is not a multiple
+                of `record_size`.
+        """
+        if key_size is None:
+            key_size = record_size - key_offset
+        if record_size <= 0 or key_offset < 0 or key_size <= 0:
+            raise ValueError("record_size and key_size must be positive")
+        if key_offset + key_size > record_size:
+            raise ValueError("Key must lie within the record")
+
+        super().__init__(path)
+        if self.size % record_size:
+            self.close()
+            raise ValueError("File size is not a multiple of record_size")
+        self.record_size = record_size
+        self.key_offset = key_offset
+        self.key_size = key_size
+
+    def __enter__(self) -> "FixedWidthRecordFile":
+        """Returns the mapped file for use as a context manager."""
+        return self
+
+    def __len__(self) -> int:
+        """Returns the number of records in the file."""
+        return self.size // self.record_size
+
+    @overload
+    def __getitem__(self, index: int) -> bytes: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[bytes]: ...
+
+    def __getitem__(self, index: int | slice) -> bytes | List[bytes]:
+        """Returns the key of the record at the given index (or slice)."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        start = index * self.record_size + self.key_offset
+        return self._buf[start : start + self.key_size]
+
+    def record_at(self, offset: int) -> bytes:
+        """Returns the full record stored at a byte offset.
+
+        Args:
+            offset: The byte offset of the record, as returned by `find`.
+        """
+        return self._buf[offset : offset + self.record_size]
+
+    def _find_from(self, key: bytes, start: int) -> Tuple[Optional[int], int]:
+        """Bisects record indices from `start // record_size` for `key`."""
+        low = start // self.record_size
+        high = len(self)
+        while low < high:
+            mid = (low + high) // 2
+            if self[mid] < key:
+                low = mid + 1
+            else:
+                high = mid
+        offset = low * self.record_size
+        if low < len(self) and self[low] == key:
+            return offset, offset
+        return None, offset
+
+
+class LineRecordFile(_MappedFile):
+    """A sorted newline-delimited file, searched in place.
+
+    Probes land on arbitrary byte offsets and resynchronize to the start of the
+    enclosing line, so lines may have any length.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], separator: Optional[bytes] = None) -> None:
+        """Maps a newline-delimited file.
+
+        Args:
+            path: The path of the file to map.
+            separator: If given, the key of each line is the part before the first
+                occurrence of this separator (for example ``b"\\t"``). Otherwise the
+                whole line is the key.
+        """
+        super().__init__(path)
+        self.separator = separator
+
+    def __enter__(self) -> "LineRecordFile":
+        """Returns the mapped file for use as a context manager."""
+        return self
+
+    def record_at(self, offset: int) -> bytes:
+        """Returns the line starting at a byte offset, without its newline.
+
+        Args:
+            offset: The byte offset of the line, as returned by `find`.
+        """
+        return self._buf[offset : self._line_end(offset)]
+
+    def _line_end(self, start: int) -> int:
+        """Returns the offset of the newline ending the line at `start`."""
+        end = self._buf.find(b"\n", start)
+        return self.size if end == -1 else end
+
+    def _key_at(self, start: int, end: int) -> bytes:
+        """Returns the key of the line spanning `[start, end)`."""
+        if self.separator is not None:
+            cut = self._buf.find(self.separator, start, end)
+            if cut != -1:
+                end = cut
+        return self._buf[start:end]
+
+    def _find_from(self, key: bytes, start: int) -> Tuple[Optional[int], int]:
+        """Bisects byte offsets from the line at `start` for `key`."""
+        # Invariant: `low` and `high` are line starts (or the file size); every line
+        # before `low` has a smaller key and the line at `high` does not.
+        low, high = start, self.size
+        while low < high:
+            mid = (low + high) // 2
+            line_start = max(low, self._buf.rfind(b"\n", low, mid) + 1)
+            line_end = self._line_end(line_start)
+            if self._key_at(line_start, line_end) < key:
+                low = min(line_end + 1, high)
+            else:
+                high = line_start
+        if low < self.size and self._key_at(low, self._line_end(low)) == key:
+            return low, low
+        return None, low
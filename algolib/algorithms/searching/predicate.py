@@ -0,0 +1,161 @@
+"""Predicate (answer-space) binary search implementation."""
+
+from typing import Callable, Dict, Generic, Sequence, TypeVar
+
+from algolib._typing import ComparableT
+from algolib.algorithms.searching.base import Searcher
+
+N = TypeVar("N", int, float)
+
+
+class MemoizedPredicate(Generic[N]):
+    """A predicate wrapper that caches results by argument.
+
+    Useful when each evaluation is expensive (for example a benchmark run). Pass
+    the same instance to several searches to share the cache between them.
+
+    Attributes:
+        calls: The number of times the wrapped predicate was actually evaluated.
+        hits: The number of evaluations answered from the cache.
+    """
+
+    __slots__ = ("_pred", "_cache", "calls", "hits")
+
+    def __init__(self, pred: Callable[[N], bool]) -> None:
+        """Wraps a predicate.
+
+        Args:
+            pred: The predicate to memoize.
+        """
+        self._pred: Callable[[N], bool] = pred
+        self._cache: Dict[N, bool] = {}
+        self.calls = 0
+        self.hits = 0
+
+    def __call__(self, value: N) -> bool:
+        """Evaluates the predicate, consulting the cache first."""
+        cached = self._cache.get(value)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        result = bool(self._pred(value))
+        self._cache[value] = result
+        self.calls += 1
+        return result
+
+
+class PredicateSearcher(Searcher[ComparableT]):
+    """Binary search over a monotonic predicate.
+
+    Instead of searching a materialized sequence, this searcher bisects an integer
+    or float domain `[lo, hi]` for the boundary where a monotonic predicate flips.
+    Only O(log(hi - lo)) points are ever evaluated and no sequence is built.
+
+    A single bisection never probes the same point twice, so predicates are
+    called as given. To reuse evaluations across searches of an expensive
+    predicate, pass the same `MemoizedPredicate` to each of them.
+    """
+
+    def first_true(self, lo: int, hi: int, pred: Callable[[int], bool]) -> int | None:
+        """Finds the smallest integer in `[lo, hi]` for which `pred` is True.
+
+        The predicate must be monotonic: False for every value below the answer
+        and True for every value from the answer on.
+
+        Args:
+            lo: The inclusive lower bound of the domain.
+            hi: The inclusive upper bound of the domain.
+            pred: The monotonic predicate.
+
+        Returns:
+            The smallest value satisfying `pred`, or None if there is none.
+        """
+        return self._first_true(lo, hi, pred)
+
+    def last_true(self, lo: int, hi: int, pred: Callable[[int], bool]) -> int | None:
+        """Finds the largest integer in `[lo, hi]` for which `pred` is True.
+
+        The predicate must be monotonic: True up to the answer and False after.
+
+        Args:
+            lo: The inclusive lower bound of the domain.
+            hi: The inclusive upper bound of the domain.
+            pred: The monotonic predicate.
+
+        Returns:
+            The largest value satisfying `pred`, or None if there is none.
+        """
+        first_false = self._first_true(lo, hi, lambda x: not pred(x))
+        if first_false is None:
+            return hi if lo <= hi else None
+        return first_false - 1 if first_false > lo else None
+
+    def first_true_float(
+        self, lo: float, hi: float, pred: Callable[[float], bool], tol: float = 1e-9
+    ) -> float | None:
+        """Approximates the smallest float in `[lo, hi]` for which `pred` is True.
+
+        Bisection stops once the bracket is narrower than `tol` (or can no longer
+        be split in floating point), so at most about log2((hi - lo) / tol)
+        predicate evaluations are made.
+
+        Args:
+            lo: The lower bound of the domain.
+            hi: The upper bound of the domain.
+            pred: A monotonic predicate, False below the answer and True above it.
+            tol: The absolute width of the final bracket.
+
+        Returns:
+            A value `x` with `pred(x)` True that is within `tol` of the boundary,
+            or None if `pred(hi)` is False.
+
+        Raises:
+            ValueError: If `tol` is not positive.
+        """
+        if tol <= 0:
+            raise ValueError("tol must be positive")
+        if lo > hi:
+            return None
+
+        if not pred(hi):
+            return None
+        if pred(lo):
+            return lo
+
+        while hi - lo > tol:
+            mid = lo + (hi - lo) / 2
+            if mid <= lo or mid >= hi:
+                break
+            if pred(mid):
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+    def search(self, data: Sequence[ComparableT], target: ComparableT) -> int | None:
+        """Searches a sorted sequence by bisecting for its lower bound.
+
+        Args:
+            data: The sorted sequence to search in.
+            target: The value to search for.
+
+        Returns:
+            The index of the first occurrence of the target, or None if not found.
+        """
+        index = self._first_true(0, len(data) - 1, lambda i: not data[i] < target)
+        if index is not None and not target < data[index]:
+            return index
+        return None
+
+    @staticmethod
+    def _first_true(lo: int, hi: int, pred: Callable[[int], bool]) -> int | None:
+        """Bisects `[lo, hi]` for the first True without wrapping the predicate."""
+        end = hi + 1
+        high = end
+        while lo < high:
+            mid = (lo + high) // 2
+            if pred(mid):
+                high = mid
+            else:
+                lo = mid + 1
+        return lo if lo < end else None
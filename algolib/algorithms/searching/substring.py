@@ -0,0 +1,205 @@
+"""Substring search algorithm implementations over byte buffers and streams."""
+
+import mmap
+import os
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Any, Iterable, Iterator, List, Optional
+
+ByteBuffer = bytes | bytearray | memoryview | mmap.mmap
+"""Any buffer that can be scanned: bytes, bytearray, memoryview or an mmap."""
+
+
+class SubstringSearcher(ABC):
+    """Abstract base class for byte-pattern search algorithms.
+
+    Implementations yield match offsets lazily. Besides in-memory buffers, they
+    can scan an iterable of chunks (or a file read chunk by chunk) with matches
+    that straddle chunk boundaries reported exactly once, keeping only O(chunk +
+    pattern) bytes in memory.
+    """
+
+    @abstractmethod
+    def finditer(self, data: ByteBuffer, pattern: bytes) -> Iterator[int]:
+        """Yields the offset of every (possibly overlapping) match in a buffer.
+
+        Args:
+            data: The buffer to scan.
+            pattern: The non-empty byte pattern to find.
+
+        Yields:
+            Match offsets in increasing order.
+        """
+        ...
+
+    def finditer_chunks(self, chunks: Iterable[ByteBuffer], pattern: bytes) -> Iterator[int]:
+        """Yields match offsets across a stream of chunks.
+
+        The last `len(pattern) - 1` bytes of each chunk are carried into the next
+        one, so matches spanning a boundary are found without buffering the stream.
+
+        Args:
+            chunks: The chunks of the stream, in order.
+            pattern: The non-empty byte pattern to find.
+
+        Yields:
+            Match offsets, relative to the start of the stream, in increasing order.
+        """
+        _check_pattern(pattern)
+        keep = len(pattern) - 1
+        tail = b""
+        base = 0
+        for chunk in chunks:
+            buf = tail + bytes(chunk)
+            for position in self.finditer(buf, pattern):
+                yield base + position
+            carried = min(keep, len(buf))
+            tail = buf[len(buf) - carried :]
+            base += len(buf) - carried
+
+    def finditer_file(
+        self, path: str | os.PathLike[str], pattern: bytes, chunk_size: int = 1 << 20
+    ) -> Iterator[int]:
+        """Yields match offsets in a file, reading it in fixed-size chunks.
+
+        Args:
+            path: The path of the file to scan.
+            pattern: The non-empty byte pattern to find.
+            chunk_size: The number of bytes read per chunk.
+
+        Yields:
+            Match offsets in increasing order.
+        """
+        with open(path, "rb") as f:
+            yield from self.finditer_chunks(iter(partial(f.read, chunk_size), b""), pattern)
+
+    def findall(self, data: ByteBuffer, pattern: bytes) -> List[int]:
+        """Returns the offsets of all matches in a buffer."""
+        return list(self.finditer(data, pattern))
+
+    def search(self, data: ByteBuffer, pattern: bytes) -> Optional[int]:
+        """Finds the first match of a pattern in a buffer.
+
+        Args:
+            data: The buffer to scan.
+            pattern: The non-empty byte pattern to find.
+
+        Returns:
+            The offset of the first match, or None if the pattern does not occur.
+        """
+        return next(self.finditer(data, pattern), None)
+
+    def run(self, data: Any) -> Any:
+        """Runs the substring search on a (buffer, pattern) tuple."""
+        if not isinstance(data, tuple) or len(data) != 2:
+            raise TypeError("Expected a tuple (buffer, pattern) for substring search.")
+
+        buffer, pattern = data
+        if not isinstance(buffer, (bytes, bytearray, memoryview, mmap.mmap)):
+            raise TypeError("First element of the tuple must be a bytes-like buffer.")
+        if not isinstance(pattern, bytes):
+            raise TypeError("Second element of the tuple must be bytes.")
+
+        return self.search(buffer, pattern)
+
+
+class HorspoolSearcher(SubstringSearcher):
+    """Boyer-Moore-Horspool substring search.
+
+    Compares the pattern against the text window by window and, on a mismatch,
+    skips ahead by a distance looked up from the window's last byte. Skips grow
+    with the pattern length, so long patterns are found in sublinear time on
+    typical text; the worst case is O(n * m).
+    """
+
+    def finditer(self, data: ByteBuffer, pattern: bytes) -> Iterator[int]:
+        """Yields the offset of every (possibly overlapping) match in a buffer.
+
+        Args:
+            data: The buffer to scan.
+            pattern: The non-empty byte pattern to find.
+
+        Yields:
+            Match offsets in increasing order.
+        """
+        _check_pattern(pattern)
+        m = len(pattern)
+        shift = [m] * 256
+        for i in range(m - 1):
+            shift[pattern[i]] = m - 1 - i
+
+        last = pattern[-1]
+        limit = len(data) - m
+        i = 0
+        while i <= limit:
+            byte = data[i + m - 1]
+            if byte == last and data[i : i + m] == pattern:
+                yield i
+            i += shift[byte]
+
+
+class KMPSearcher(SubstringSearcher):
+    """Knuth-Morris-Pratt substring search.
+
+    Runs a prefix-function automaton over the text one byte at a time, never
+    moving backwards, for a guaranteed O(n + m) running time. The automaton state
+    is carried between chunks, so streams are scanned without overlap buffers.
+    """
+
+    def finditer(self, data: ByteBuffer, pattern: bytes) -> Iterator[int]:
+        """Yields the offset of every (possibly overlapping) match in a buffer.
+
+        Args:
+            data: The buffer to scan.
+            pattern: The non-empty byte pattern to find.
+
+        Yields:
+            Match offsets in increasing order.
+        """
+        return self.finditer_chunks((data,), pattern)
+
+    def finditer_chunks(self, chunks: Iterable[ByteBuffer], pattern: bytes) -> Iterator[int]:
+        """Yields match offsets across a stream of chunks.
+
+        Args:
+            chunks: The chunks of the stream, in order.
+            pattern: The non-empty byte pattern to find.
+
+        Yields:
+            Match offsets, relative to the start of the stream, in increasing order.
+        """
+        _check_pattern(pattern)
+        fail = self._prefix_function(pattern)
+        m = len(pattern)
+        state = 0
+        base = 0
+        for chunk in chunks:
+            with memoryview(chunk) as view, view.cast("B") as flat:
+                for i, byte in enumerate(flat):
+                    while state and pattern[state] != byte:
+                        state = fail[state - 1]
+                    if pattern[state] == byte:
+                        state += 1
+                    if state == m:
+                        yield base + i - m + 1
+                        state = fail[state - 1]
+                base += len(flat)
+
+    @staticmethod
+    def _prefix_function(pattern: bytes) -> List[int]:
+        """Computes the length of the longest proper border of each prefix."""
+        fail = [0] * len(pattern)
+        k = 0
+        for i in range(1, len(pattern)):
+            while k and pattern[i] != pattern[k]:
+                k = fail[k - 1]
+            if pattern[i] == pattern[k]:
+                k += 1
+            fail[i] = k
+        return fail
+
+
+def _check_pattern(pattern: bytes) -> None:
+    """Raises ValueError for an empty pattern."""
+    if not pattern:
+        raise ValueError("pattern must not be empty")
@@ -0,0 +1,250 @@
+"""Suffix array and LCP index for substring queries on a static text."""
+
+import mmap
+import os
+import struct
+from array import array
+from typing import List, Optional, Tuple
+
+_MAGIC = b"ALGOLSFX"
+_HEADER = struct.Struct("<8sq")
+
+Text = bytes | bytearray | mmap.mmap
+"""A text that can be indexed: bytes, bytearray or a memory-mapped file."""
+
+
+class SuffixArray:
+    """Suffix array with an LCP array over a static byte text.
+
+    Suffixes are sorted with prefix doubling, each round ordering by the pair of
+    ranks `(rank[i], rank[i + k])` through radix (counting sort) passes instead of
+    comparisons. The LCP array is built with Kasai's algorithm. Both are stored as
+    `array('i')`, and can be saved to disk and memory-mapped back without copying.
+
+    Substring queries take O(m log n) for a pattern of length m.
+    """
+
+    def __init__(self, text: Text) -> None:
+        """Builds the suffix and LCP arrays for a text.
+
+        Args:
+            text: The text to index. It must stay alive and unchanged while the
+                index is used.
+        """
+        self.text = text
+        self.sa: "array[int] | memoryview" = self._build_suffix_array(text)
+        self.lcp: "array[int] | memoryview" = self._build_lcp(text, self.sa)
+        self._map: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        """Returns the number of suffixes (the length of the text)."""
+        return len(self.sa)
+
+    def count(self, pattern: bytes) -> int:
+        """Counts the occurrences of a pattern in the text.
+
+        Args:
+            pattern: The pattern to count.
+
+        Returns:
+            The number of (possibly overlapping) occurrences.
+        """
+        low, high = self._range(pattern)
+        return high - low
+
+    def positions(self, pattern: bytes) -> List[int]:
+        """Returns the starting positions of every occurrence of a pattern.
+
+        Args:
+            pattern: The pattern to find.
+
+        Returns:
+            The occurrence positions in increasing order.
+        """
+        low, high = self._range(pattern)
+        return sorted(self.sa[low:high])
+
+    def find(self, pattern: bytes) -> Optional[int]:
+        """Finds the first occurrence of a pattern.
+
+        Args:
+            pattern: The pattern to find.
+
+        Returns:
+            The smallest occurrence position, or None if the pattern does not occur.
+        """
+        low, high = self._range(pattern)
+        return min(self.sa[low:high]) if high > low else None
+
+    def longest_repeat(self) -> Tuple[int, int]:
+        """Finds the longest substring that occurs at least twice.
+
+        Returns:
+            A `(position, length)` pair; the length is 0 if nothing repeats.
+        """
+        best = 0
+        position = 0
+        for i in range(1, len(self.lcp)):
+            if self.lcp[i] > best:
+                best = self.lcp[i]
+                position = self.sa[i]
+        return position, best
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Writes the suffix and LCP arrays (not the text) to a file.
+
+        Args:
+            path: The destination path.
+        """
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self.sa)))
+            f.write(self.sa.tobytes() if isinstance(self.sa, array) else bytes(self.sa))
+            f.write(self.lcp.tobytes() if isinstance(self.lcp, array) else bytes(self.lcp))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], text: Text) -> "SuffixArray":
+        """Memory-maps an index written by `save`.
+
+        The arrays are read straight from the page cache; call `close` (or use
+        the index as a context manager) to release the mapping.
+
+        Args:
+            path: The path of the saved index.
+            text: The text the index was built for.
+
+        Returns:
+            The loaded index.
+
+        Raises:
+            ValueError: If the file is not a saved index or does not match the text.
+        """
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, n = _HEADER.unpack_from(buf)
+        except struct.error:
+            buf.close()
+            raise ValueError("Not a suffix array file") from None
+        itemsize = array("i").itemsize
+        if magic != _MAGIC or len(buf) != _HEADER.size + 2 * n * itemsize:
+            buf.close()
+            raise ValueError("Not a suffix array file")
+        if n != len(text):
+            buf.close()
+            raise ValueError("Index does not match the text length")
+
+        index = cls.__new__(cls)
+        index.text = text
+        index._map = buf
+        view = memoryview(buf)
+        start = _HEADER.size
+        end = start + n * itemsize
+        index.sa = view[start:end].cast("i")
+        index.lcp = view[end : end + n * itemsize].cast("i")
+        return index
+
+    def close(self) -> None:
+        """Releases a memory-mapped index loaded with `load`."""
+        if self._map is not None:
+            for view in (self.sa, self.lcp):
+                if isinstance(view, memoryview):
+                    view.release()
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> "SuffixArray":
+        """Returns the index for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Releases the index on leaving the context."""
+        self.close()
+
+    def _range(self, pattern: bytes) -> Tuple[int, int]:
+        """Returns the half-open suffix array range of suffixes prefixed by `pattern`."""
+        sa, text, m = self.sa, self.text, len(pattern)
+        low, high = 0, len(sa)
+        while low < high:
+            mid = (low + high) // 2
+            if text[sa[mid] : sa[mid] + m] < pattern:
+                low = mid + 1
+            else:
+                high = mid
+        start = low
+        high = len(sa)
+        while low < high:
+            mid = (low + high) // 2
+            if text[sa[mid] : sa[mid] + m] <= pattern:
+                low = mid + 1
+            else:
+                high = mid
+        return start, low
+
+    @staticmethod
+    def _build_suffix_array(text: Text) -> "array[int]":
+        """Sorts all suffixes by prefix doubling with counting-sort passes."""
+        n = len(text)
+        if n == 0:
+            return array("i")
+
+        with memoryview(text) as view, view.cast("B") as flat:
+            rank = array("i", flat)
+        classes = 256
+        sa = SuffixArray._counting_sort(array("i", range(n)), rank, classes)
+        k = 1
+        while True:
+            # Order by the second key: suffixes without a partner at i + k come
+            # first, then the rest in the order of their partners.
+            by_second = array("i", range(n - k, n))
+            by_second.extend(i - k for i in sa if i >= k)
+            sa = SuffixArray._counting_sort(by_second, rank, classes)
+
+            new_rank = array("i", [0]) * n
+            classes = 1
+            for j in range(1, n):
+                cur, prev = sa[j], sa[j - 1]
+                cur_second = rank[cur + k] if cur + k < n else -1
+                prev_second = rank[prev + k] if prev + k < n else -1
+                if rank[cur] != rank[prev] or cur_second != prev_second:
+                    classes += 1
+                new_rank[cur] = classes - 1
+            rank = new_rank
+            if classes == n:
+                return sa
+            k *= 2
+
+    @staticmethod
+    def _counting_sort(order: "array[int]", keys: "array[int]", classes: int) -> "array[int]":
+        """Stably sorts `order` by `keys[i]` with a single counting pass."""
+        counts = [0] * (classes + 1)
+        for i in order:
+            counts[keys[i] + 1] += 1
+        for c in range(classes):
+            counts[c + 1] += counts[c]
+        result = array("i", [0]) * len(order)
+        for i in order:
+            key = keys[i]
+            result[counts[key]] = i
+            counts[key] += 1
+        return result
+
+    @staticmethod
+    def _build_lcp(text: Text, sa: "array[int] | memoryview") -> "array[int]":
+        """Computes `lcp[i]` between suffixes `sa[i - 1]` and `sa[i]` (Kasai)."""
+        n = len(sa)
+        rank = array("i", [0]) * n
+        for i, suffix in enumerate(sa):
+            rank[suffix] = i
+        lcp = array("i", [0]) * n
+        h = 0
+        for i in range(n):
+            if rank[i] > 0:
+                j = sa[rank[i] - 1]
+                while i + h < n and j + h < n and text[i + h] == text[j + h]:
+                    h += 1
+                lcp[rank[i]] = h
+                if h:
+                    h -= 1
+            else:
+                h = 0
+        return lcp
@@ -0,0 +1,238 @@
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, cast
+
+from algolib._typing import T
+from algolib.data_structures.graph import GraphView, Vertex
+
+
+@dataclass(slots=True, init=False)
+class CSRGraph(Generic[T]):
+    """An immutable graph in compressed sparse row (CSR) form.
+
+    Vertices are numbered with dense integer ids. The out-edges of vertex `i` are
+    `targets[offsets[i]:offsets[i + 1]]` with matching `weights`, so each edge
+    costs one packed id and one packed float instead of a tuple and two objects.
+    The vertex API mirrors `Graph` (`neighbors`, `__contains__`, `__len__`), so
+    traversals written against `Graph` run on a `CSRGraph` unchanged.
+    `neighbor_ids` and `neighbor_weights` return `memoryview` slices of the
+    packed arrays, so expanding a vertex allocates one small view object and
+    copies no edges. While those views exist the arrays cannot be resized,
+    which an immutable graph never needs.
+
+    Attributes:
+        directed: Whether the graph is directed.
+        offsets: Start of each vertex's edge slice; has `len(self) + 1` entries.
+        targets: Target vertex id of every stored edge.
+        weights: Weight of every stored edge.
+    """
+
+    directed: bool
+    offsets: "array[int]"
+    targets: "array[int]"
+    weights: "array[float]"
+    _vertices: List[Vertex[T]]
+    _ids: Dict[T, int]
+    _target_view: "memoryview[int]"
+    _weight_view: "memoryview[float]"
+
+    def __init__(
+        self,
+        keys: List[T],
+        offsets: "array[int]",
+        targets: "array[int]",
+        weights: "array[float]",
+        directed: bool = False,
+    ) -> None:
+        """Initializes a CSRGraph from prebuilt arrays.
+
+        Args:
+            keys: The vertex keys, indexed by vertex id.
+            offsets: The edge slice boundaries, with `len(keys) + 1` entries.
+            targets: The target id of every stored edge.
+            weights: The weight of every stored edge.
+            directed: Whether the graph is directed. For undirected graphs every
+                edge must be stored in both directions.
+
+        Raises:
+            ValueError: If the arrays are inconsistent with each other.
+        """
+        if len(offsets) != len(keys) + 1 or offsets[0] != 0:
+            raise ValueError("offsets must start at 0 and have one entry per vertex plus one")
+        if len(targets) != offsets[-1] or len(weights) != len(targets):
+            raise ValueError("targets and weights must match the final offset")
+        self.directed = directed
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._vertices = [Vertex(key) for key in keys]
+        self._ids = {key: i for i, key in enumerate(keys)}
+        self._make_views()
+
+    def _make_views(self) -> None:
+        """Caches the views that `neighbor_ids` and `neighbor_weights` slice."""
+        self._target_view = memoryview(self.targets)
+        self._weight_view = cast("memoryview[float]", memoryview(self.weights))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickles the graph by its arrays, since the cached views cannot be."""
+        keys = [v.key for v in self._vertices]
+        return type(self), (keys, self.offsets, self.targets, self.weights, self.directed)
+
+    @classmethod
+    def from_graph(cls, graph: "GraphView[T]") -> "CSRGraph[T]":
+        """Packs an adjacency-list `Graph` (or any `GraphView`) into CSR form.
+
+        Vertex ids are kept, so they follow the order in which vertices were
+        added to the graph.
+
+        Args:
+            graph: The graph to pack.
+
+        Returns:
+            A new CSRGraph with the same vertices, edges and weights.
+        """
+        keys = [v.key for v in graph]
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array("d")
+        for index in range(len(keys)):
+            targets.extend(graph.neighbor_ids(index))
+            weights.extend(graph.neighbor_weights(index))
+            offsets.append(len(targets))
+        return cls(keys, offsets, targets, weights, graph.directed)
+
+    def reverse(self) -> "CSRGraph[T]":
+        """Returns the graph with every edge reversed, sharing this graph's vertices.
+
+        The edges are transposed with a counting sort on their targets, so the
+        in-edges of each vertex keep the order of their sources. An undirected
+        graph is its own reverse and is returned as is.
+
+        Returns:
+            A CSRGraph whose out-edges are this graph's in-edges.
+        """
+        if not self.directed:
+            return self
+        n = len(self._vertices)
+        counts = [0] * (n + 1)
+        for target in self.targets:
+            counts[target + 1] += 1
+        offsets = array("q", accumulate(counts))
+        cursor = list(offsets[:-1])
+        targets = array("i", [0]) * len(self.targets)
+        weights = array("d", [0.0]) * len(self.weights)
+        for source in range(n):
+            for edge in range(self.offsets[source], self.offsets[source + 1]):
+                slot = cursor[self.targets[edge]]
+                cursor[self.targets[edge]] = slot + 1
+                targets[slot] = source
+                weights[slot] = self.weights[edge]
+
+        reversed_graph = CSRGraph.__new__(CSRGraph)
+        reversed_graph.directed = True
+        reversed_graph.offsets = offsets
+        reversed_graph.targets = targets
+        reversed_graph.weights = weights
+        reversed_graph._vertices = self._vertices
+        reversed_graph._ids = self._ids
+        reversed_graph._make_views()
+        return reversed_graph
+
+    @property
+    def num_edges(self) -> int:
+        """The number of stored (directed) edges."""
+        return len(self.targets)
+
+    @property
+    def memory_bytes(self) -> int:
+        """The size of the packed edge arrays in bytes."""
+        return sum(len(a) * a.itemsize for a in (self.offsets, self.targets, self.weights))
+
+    def get_vertex(self, key: T) -> Optional[Vertex[T]]:
+        """Gets a vertex by its key.
+
+        Args:
+            key: The key of the vertex to get.
+
+        Returns:
+            The Vertex object if found, otherwise None.
+        """
+        index = self._ids.get(key)
+        return None if index is None else self._vertices[index]
+
+    def vertex_id(self, v: Vertex[T]) -> int:
+        """Returns the dense integer id of a vertex.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        index = self._ids.get(v.key)
+        if index is None:
+            raise ValueError("Vertex not in graph")
+        return index
+
+    def vertex_at(self, index: int) -> Vertex[T]:
+        """Returns the vertex with the given dense integer id."""
+        return self._vertices[index]
+
+    def neighbor_ids(self, index: int) -> "memoryview[int]":
+        """Returns a view of the target ids of the out-edges of the vertex with id `index`."""
+        return self._target_view[self.offsets[index] : self.offsets[index + 1]]
+
+    def neighbor_weights(self, index: int) -> "memoryview[float]":
+        """Returns a view of the weights of the out-edges of the vertex with id `index`."""
+        return self._weight_view[self.offsets[index] : self.offsets[index + 1]]
+
+    def neighbors(self, v: Vertex[T]) -> Iterator[Tuple[Vertex[T], float]]:
+        """Returns an iterator over the neighbors of a vertex and edge weights.
+
+        Args:
+            v: The vertex whose neighbors to get.
+
+        Yields:
+            A tuple containing the neighbor vertex and the edge weight.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        index = self.vertex_id(v)
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return zip(
+            map(self._vertices.__getitem__, self.targets[start:end]),
+            self.weights[start:end],
+            strict=True,
+        )
+
+    def get_neighbors(self, v: Vertex[T]) -> List[Vertex[T]]:
+        """Gets all neighbor vertices of a given vertex.
+
+        Args:
+            v: The vertex whose neighbors to retrieve.
+
+        Returns:
+            A list of neighbor vertices.
+        """
+        return [self._vertices[i] for i in self.neighbor_ids(self.vertex_id(v))]
+
+    def __contains__(self, item: object) -> bool:
+        """Checks if a vertex or key is in the graph.
+
+        Args:
+            item: The vertex or key to check.
+
+        Returns:
+            True if the item is in the graph, otherwise False.
+        """
+        if isinstance(item, Vertex):
+            return item.key in self._ids
+        return item in self._ids
+
+    def __len__(self) -> int:
+        """Returns the number of vertices in the graph."""
+        return len(self._vertices)
+
+    def __iter__(self) -> Iterator[Vertex[T]]:
+        """Returns an iterator over the vertices in id order."""
+        return iter(self._vertices)
@@ -25,10 +25,25 @@ class DisjointSet(Generic[T]):
                 self._parent[el] = el
                 self._rank[el] = 0
 
+    def add(self, item: T) -> None:
+        """Adds an item in its own set, unless it is already present.
+
+        Args:
+            item: The item to add.
+        """
+        if item not in self._parent:
+            self._parent[item] = item
+            self._rank[item] = 0
+
+    def __contains__(self, item: object) -> bool:
+        """Checks if an item is in the disjoint set."""
+        return item in self._parent
+
     def find(self, item: T) -> T:
         """Finds the representative of the set containing the item.
 
-        This method uses path compression for optimization.
+        This method uses path compression for optimization. It is iterative, so
+        long parent chains cannot exhaust the recursion limit.
 
         Args:
             item: The item to find.
@@ -39,15 +54,18 @@ class DisjointSet(Generic[T]):
         Raises:
             KeyError: If the item is not in the disjoint set.
         """
-        if item not in self._parent:
+        parent = self._parent
+        if item not in parent:
             raise KeyError(f"Item {item} not in DisjointSet")
-        if self._parent[item] == item:
-            return item
+        root = item
+        while parent[root] != root:
+            root = parent[root]
         # Path compression
-        self._parent[item] = self.find(self._parent[item])
-        return self._parent[item]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
 
-    def union(self, item1: T, item2: T) -> None:
+    def union(self, item1: T, item2: T) -> bool:
         """Merges the sets containing item1 and item2.
 
         This method uses union by rank (or size) for optimization.
@@ -55,16 +73,22 @@ class DisjointSet(Generic[T]):
         Args:
             item1: An item in the first set.
             item2: An item in the second set.
+
+        Returns:
+            True if two sets were merged, False if the items were already in the
+            same set.
         """
         root1 = self.find(item1)
         root2 = self.find(item2)
 
-        if root1 != root2:
-            # Union by rank
-            if self._rank[root1] > self._rank[root2]:
-                self._parent[root2] = root1
-            elif self._rank[root1] < self._rank[root2]:
-                self._parent[root1] = root2
-            else:
-                self._parent[root2] = root1
-                self._rank[root1] += 1
+        if root1 == root2:
+            return False
+        # Union by rank
+        if self._rank[root1] > self._rank[root2]:
+            self._parent[root2] = root1
+        elif self._rank[root1] < self._rank[root2]:
+            self._parent[root1] = root2
+        else:
+            self._parent[root2] = root1
+            self._rank[root1] += 1
+        return True
@@ -1,8 +1,57 @@
+import sys
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Generic, Iterator, List, Optional, Tuple, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    cast,
+    runtime_checkable,
+)
 
 from algolib._typing import T
 
+if TYPE_CHECKING:
+    from algolib.data_structures.csr_graph import CSRGraph
+
+
+def _as_iterable(values: Iterable[Any]) -> Iterable[Any]:
+    """Converts array-likes exposing `tolist` (NumPy, `array.array`) to a list."""
+    tolist = getattr(values, "tolist", None)
+    return tolist() if callable(tolist) else values
+
+
+@dataclass(slots=True, frozen=True)
+class GraphMemory:
+    """Approximate memory footprint of a `Graph`, as measured by `sys.getsizeof`.
+
+    Attributes:
+        adjacency_bytes: The per-vertex target and weight arrays and the lists
+            holding them.
+        index_bytes: The per-vertex neighbor-index dicts and the list holding
+            them, or 0 if the graph is not indexed. Vertex ids are small ints
+            shared with the adjacency and are not counted.
+        reverse_bytes: The cached in-edge arrays of a directed graph, or 0 if
+            they are not currently built.
+    """
+
+    adjacency_bytes: int
+    index_bytes: int
+    reverse_bytes: int = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """The adjacency, index and reverse adjacency sizes combined."""
+        return self.adjacency_bytes + self.index_bytes + self.reverse_bytes
+
 
 @dataclass(slots=True, frozen=True)
 class Vertex(Generic[T]):
@@ -25,28 +74,135 @@ class Vertex(Generic[T]):
         return f"Vertex({self.key})"
 
 
+@runtime_checkable
+class GraphView(Protocol[T]):
+    """The read-only vertex API shared by `Graph` and `CSRGraph`.
+
+    Traversal algorithms depend on this protocol rather than a concrete graph class.
+    Both implementations number their vertices with dense integer ids, so hot loops
+    can use the id methods and index plain arrays instead of hashing vertices.
+    """
+
+    directed: bool
+
+    def vertex_id(self, v: Vertex[T]) -> int: ...
+
+    def vertex_at(self, index: int) -> Vertex[T]: ...
+
+    def neighbor_ids(self, index: int) -> Sequence[int]: ...
+
+    def neighbor_weights(self, index: int) -> Sequence[float]: ...
+
+    def neighbors(self, v: Vertex[T]) -> Iterator[Tuple[Vertex[T], float]]: ...
+
+    def __contains__(self, item: object) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[Vertex[T]]: ...
+
+
 @dataclass(slots=True, init=False)
 class Graph(Generic[T]):
     """A graph represented using an adjacency list.
 
+    Each key is interned to a dense integer id when its vertex is added, and the
+    adjacency is stored by id: the out-edges of vertex `i` are the packed arrays
+    `neighbor_ids(i)` and `neighbor_weights(i)`. The `Vertex` API hashes each key
+    once per lookup, while traversals can walk ids directly and track visited
+    vertices in a bytearray.
+
+    An indexed graph additionally keeps, per vertex, a dict from target id to
+    the position of that edge in the arrays. This makes `has_edge`,
+    `get_weight` and `remove_edge` O(1) instead of a scan of the out-edges, at
+    the cost of one dict per vertex (see `memory_usage`). An indexed graph holds
+    at most one edge per ordered vertex pair: adding an edge that already exists
+    replaces its weight. Without the index, parallel edges are kept side by side.
+
+    The in-edges of a directed graph (`predecessor_ids`, `in_degree`,
+    `reversed`) are served from a reverse adjacency that is built in O(V + E)
+    on first use and cached until the graph is next modified, so batches of
+    in-edge queries between mutations share one build.
+
     Attributes:
         directed: Whether the graph is directed.
     """
 
-    _adj: Dict[Vertex[T], List[Tuple[Vertex[T], float]]]
     _vertices: Dict[T, Vertex[T]]
+    _ids: Dict[T, int]
+    _vertex_list: List[Vertex[T]]
+    _targets: List["array[int]"]
+    _weights: List["array[float]"]
+    _positions: Optional[List[Dict[int, int]]]
+    _reverse: Optional[Tuple[List["array[int]"], List["array[float]"]]]
+    _vertex_removals: int
     directed: bool
 
-    def __init__(self, directed: bool = False) -> None:
+    def __init__(self, directed: bool = False, indexed: bool = False) -> None:
         """Initializes a new Graph.
 
         Args:
             directed: If True, the graph is directed. Defaults to False.
+            indexed: If True, keep a neighbor index for O(1) edge lookups and
+                removals. Defaults to False.
         """
-        self._adj = {}
         self._vertices = {}
+        self._ids = {}
+        self._vertex_list = []
+        self._targets = []
+        self._weights = []
+        self._positions = [] if indexed else None
+        self._reverse = None
+        self._vertex_removals = 0
         self.directed = directed
 
+    @property
+    def indexed(self) -> bool:
+        """Whether the graph keeps a neighbor index."""
+        return self._positions is not None
+
+    @property
+    def vertex_removals(self) -> int:
+        """The number of `remove_vertex` calls, each of which may reassign an id.
+
+        Code that keys state by vertex id can compare this counter to notice
+        that its ids are stale.
+        """
+        return self._vertex_removals
+
+    def build_index(self) -> None:
+        """Builds the neighbor index for the current edges, in O(V + E).
+
+        Raises:
+            ValueError: If the graph has parallel edges. Undirected self-loops
+                added without the index are stored twice and count as parallel.
+        """
+        positions: List[Dict[int, int]] = []
+        for targets in self._targets:
+            index = {target: position for position, target in enumerate(targets)}
+            if len(index) < len(targets):
+                raise ValueError("Indexed graphs cannot have parallel edges")
+            positions.append(index)
+        self._positions = positions
+
+    def drop_index(self) -> None:
+        """Discards the neighbor index, freeing its memory."""
+        self._positions = None
+
+    def memory_usage(self) -> GraphMemory:
+        """Reports the approximate memory taken by the adjacency and its caches."""
+        adjacency = sys.getsizeof(self._targets) + sys.getsizeof(self._weights)
+        adjacency += sum(map(sys.getsizeof, self._targets))
+        adjacency += sum(map(sys.getsizeof, self._weights))
+        index = 0
+        if self._positions is not None:
+            index = sys.getsizeof(self._positions) + sum(map(sys.getsizeof, self._positions))
+        reverse = 0
+        if self._reverse is not None:
+            for arrays in self._reverse:
+                reverse += sys.getsizeof(arrays) + sum(map(sys.getsizeof, arrays))
+        return GraphMemory(adjacency, index, reverse)
+
     def add_vertex(self, key: T) -> Vertex[T]:
         """Adds a vertex to the graph or returns it if it already exists.
 
@@ -56,12 +212,22 @@ class Graph(Generic[T]):
         Returns:
             The Vertex object.
         """
-        if key in self._vertices:
-            return self._vertices[key]
-        vertex = Vertex(key)
-        self._vertices[key] = vertex
-        self._adj[vertex] = []
-        return vertex
+        vertex = self._vertices.get(key)
+        if vertex is not None:
+            return vertex
+        return self._vertex_list[self._intern(key)]
+
+    def add_vertices_from(self, keys: Iterable[T]) -> None:
+        """Adds many vertices, skipping keys that are already in the graph.
+
+        Args:
+            keys: The keys of the vertices to add. NumPy arrays and `array.array`
+                objects are converted to Python scalars first.
+        """
+        ids = self._ids
+        for key in _as_iterable(keys):
+            if key not in ids:
+                self._intern(key)
 
     def get_vertex(self, key: T) -> Optional[Vertex[T]]:
         """Gets a vertex by its key.
@@ -85,11 +251,252 @@ class Graph(Generic[T]):
         Raises:
             ValueError: If either vertex is not in the graph.
         """
-        if u not in self._adj or v not in self._adj:
+        u_id = self._ids.get(u.key)
+        v_id = self._ids.get(v.key)
+        if u_id is None or v_id is None:
             raise ValueError("Both vertices must be in the graph")
-        self._adj[u].append((v, weight))
+        self._reverse = None
+        if self._positions is not None:
+            self._link(u_id, v_id, weight)
+            if not self.directed and u_id != v_id:
+                self._link(v_id, u_id, weight)
+            return
+        self._targets[u_id].append(v_id)
+        self._weights[u_id].append(weight)
         if not self.directed:
-            self._adj[v].append((u, weight))
+            self._targets[v_id].append(u_id)
+            self._weights[v_id].append(weight)
+
+    def add_edges_from(
+        self,
+        edges: Iterable[Tuple[T, T]] | Iterable[Tuple[T, T, float]],
+        weight: float = 1.0,
+    ) -> int:
+        """Adds many edges given by vertex keys, adding missing vertices.
+
+        Args:
+            edges: `(u, v)` or `(u, v, weight)` key tuples.
+            weight: The weight of edges given as pairs. Defaults to 1.0.
+
+        Returns:
+            The number of edges added. In an indexed graph, edges that already
+            exist only have their weight replaced and are not counted.
+        """
+        self._reverse = None
+        if self._positions is not None:
+            return self._add_indexed(edges, weight)
+        ids = self._ids
+        targets = self._targets
+        weights = self._weights
+        count = 0
+        for edge in edges:
+            u_id = ids.get(edge[0])
+            if u_id is None:
+                u_id = self._intern(edge[0])
+            v_id = ids.get(edge[1])
+            if v_id is None:
+                v_id = self._intern(edge[1])
+            w = edge[2] if len(edge) > 2 else weight
+            targets[u_id].append(v_id)
+            weights[u_id].append(w)
+            if not self.directed:
+                targets[v_id].append(u_id)
+                weights[v_id].append(w)
+            count += 1
+        return count
+
+    def add_edges_from_arrays(
+        self,
+        sources: Iterable[T],
+        destinations: Iterable[T],
+        weights: Optional[Iterable[float]] = None,
+    ) -> int:
+        """Adds many edges given as parallel arrays of keys, adding missing vertices.
+
+        Args:
+            sources: The source key of each edge.
+            destinations: The destination key of each edge.
+            weights: The weight of each edge. Defaults to 1.0 for every edge.
+                Any of the three may be a list, an `array.array` or a NumPy array.
+
+        Returns:
+            The number of edges added.
+
+        Raises:
+            ValueError: If the arrays have different lengths.
+        """
+        sources = _as_iterable(sources)
+        destinations = _as_iterable(destinations)
+        if weights is None:
+            return self.add_edges_from(zip(sources, destinations, strict=True))
+        return self.add_edges_from(zip(sources, destinations, _as_iterable(weights), strict=True))
+
+    def has_edge(self, u: Vertex[T], v: Vertex[T]) -> bool:
+        """Checks whether there is an edge from `u` to `v`.
+
+        This is O(1) in an indexed graph and O(deg(u)) otherwise.
+
+        Raises:
+            ValueError: If either vertex is not in the graph.
+        """
+        return self._position(self.vertex_id(u), self.vertex_id(v)) >= 0
+
+    def get_weight(self, u: Vertex[T], v: Vertex[T]) -> Optional[float]:
+        """Returns the weight of the edge from `u` to `v`, or None if there is none.
+
+        With parallel edges, the weight of the first one is returned. This is
+        O(1) in an indexed graph and O(deg(u)) otherwise.
+
+        Raises:
+            ValueError: If either vertex is not in the graph.
+        """
+        u_id = self.vertex_id(u)
+        position = self._position(u_id, self.vertex_id(v))
+        return None if position < 0 else self._weights[u_id][position]
+
+    def remove_edge(self, u: Vertex[T], v: Vertex[T]) -> None:
+        """Removes the edge from `u` to `v` (both directions if undirected).
+
+        The last out-edge of `u` is moved into the freed slot, so the order of
+        the remaining neighbors changes. With parallel edges, only one is
+        removed. This is O(1) in an indexed graph and O(deg(u) + deg(v))
+        otherwise.
+
+        Raises:
+            ValueError: If either vertex is not in the graph, or there is no
+                such edge.
+        """
+        u_id, v_id = self.vertex_id(u), self.vertex_id(v)
+        position = self._position(u_id, v_id)
+        if position < 0:
+            raise ValueError("Edge not in graph")
+        weight = self._weights[u_id][position]
+        self._remove_at(u_id, position)
+        self._reverse = None
+        # Undirected self-loops are stored once with the index, twice without.
+        # The mirror copy must carry the same weight, or parallel edges of
+        # different weights would lose a different copy in each direction.
+        if not self.directed and (u_id != v_id or self._positions is None):
+            self._unlink(v_id, u_id, weight)
+
+    def remove_vertex(self, v: Vertex[T]) -> None:
+        """Removes a vertex and every edge incident to it.
+
+        To keep ids dense, the vertex with the highest id takes over the id of
+        the removed one, and the edges pointing at it are renamed. Any id held
+        from before the removal is therefore invalid afterwards; state keyed by
+        id can watch `vertex_removals` to detect this. The renaming costs
+        O(deg) updates for the two vertices involved. Directed graphs find the
+        edges into them through the cached reverse adjacency if it is built,
+        and otherwise scan every vertex, in O(V) with the index and O(V + E)
+        without.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        v_id = self.vertex_id(v)
+        self._vertex_removals += 1
+        last = len(self._vertex_list) - 1
+        sources = self._sources(v_id)
+        # The edges between the two vertices go away with `v`.
+        moved_sources = [u for u in self._sources(last) if u != v_id] if v_id != last else []
+        self._reverse = None
+        self._targets[v_id] = array("i")
+        self._weights[v_id] = array("d")
+        if self._positions is not None:
+            self._positions[v_id] = {}
+        for u in sources:
+            while u != v_id and self._unlink(u, v_id):
+                pass
+
+        if v_id != last:
+            self._targets[v_id] = self._targets[last]
+            self._weights[v_id] = self._weights[last]
+            if self._positions is not None:
+                self._positions[v_id] = self._positions[last]
+            moved = self._vertex_list[last]
+            self._vertex_list[v_id] = moved
+            self._ids[moved.key] = v_id
+            for u in moved_sources:
+                self._rename(v_id if u == last else u, last, v_id)
+
+        self._targets.pop()
+        self._weights.pop()
+        if self._positions is not None:
+            self._positions.pop()
+        self._vertex_list.pop()
+        del self._ids[v.key]
+        del self._vertices[v.key]
+
+    def predecessor_ids(self, index: int) -> "array[int]":
+        """Returns the source ids of the in-edges of the vertex with id `index`.
+
+        On an undirected graph these are its neighbors. The array belongs to the
+        cached reverse adjacency and must not be modified.
+        """
+        return self._reverse_adjacency()[0][index]
+
+    def predecessor_weights(self, index: int) -> "array[float]":
+        """Returns the weights of the in-edges of the vertex with id `index`."""
+        return self._reverse_adjacency()[1][index]
+
+    def predecessors(self, v: Vertex[T]) -> Iterator[Tuple[Vertex[T], float]]:
+        """Returns an iterator over the in-neighbors of a vertex and edge weights.
+
+        Args:
+            v: The vertex whose in-neighbors to get.
+
+        Yields:
+            A tuple containing the source vertex of an in-edge and its weight.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        index = self.vertex_id(v)
+        return zip(
+            map(self._vertex_list.__getitem__, self.predecessor_ids(index)),
+            self.predecessor_weights(index),
+            strict=True,
+        )
+
+    def in_degree(self, v: Vertex[T]) -> int:
+        """Returns the number of edges into a vertex.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        return len(self.predecessor_ids(self.vertex_id(v)))
+
+    def reversed(self) -> "ReversedGraph[T]":
+        """Returns a view of this graph with every edge reversed.
+
+        The view copies nothing: it shares the vertices and ids of this graph
+        and reads its in-edges, so it follows later modifications.
+        """
+        return ReversedGraph(self)
+
+    def vertex_id(self, v: Vertex[T]) -> int:
+        """Returns the dense integer id of a vertex.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        index = self._ids.get(v.key)
+        if index is None:
+            raise ValueError("Vertex not in graph")
+        return index
+
+    def vertex_at(self, index: int) -> Vertex[T]:
+        """Returns the vertex with the given dense integer id."""
+        return self._vertex_list[index]
+
+    def neighbor_ids(self, index: int) -> "array[int]":
+        """Returns the target ids of the out-edges of the vertex with id `index`."""
+        return self._targets[index]
+
+    def neighbor_weights(self, index: int) -> "array[float]":
+        """Returns the weights of the out-edges of the vertex with id `index`."""
+        return self._weights[index]
 
     def neighbors(self, v: Vertex[T]) -> Iterator[Tuple[Vertex[T], float]]:
         """Returns an iterator over the neighbors of a vertex and edge weights.
@@ -103,9 +510,12 @@ class Graph(Generic[T]):
         Raises:
             ValueError: If the vertex is not in the graph.
         """
-        if v not in self._adj:
-            raise ValueError("Vertex not in graph")
-        return iter(self._adj[v])
+        index = self.vertex_id(v)
+        return zip(
+            map(self._vertex_list.__getitem__, self._targets[index]),
+            self._weights[index],
+            strict=True,
+        )
 
     def __contains__(self, item: object) -> bool:
         """Checks if a vertex or key is in the graph.
@@ -117,13 +527,154 @@ class Graph(Generic[T]):
             True if the item is in the graph, otherwise False.
         """
         if isinstance(item, Vertex):
-            return item in self._adj
-        return item in self._vertices
+            return item.key in self._ids
+        return item in self._ids
 
     def __len__(self) -> int:
         """Returns the number of vertices in the graph."""
         return len(self._vertices)
 
+    def __iter__(self) -> Iterator[Vertex[T]]:
+        """Returns an iterator over the vertices in insertion order."""
+        return iter(self._vertex_list)
+
+    def freeze(self) -> "CSRGraph[T]":
+        """Packs the graph into an immutable, compact `CSRGraph`.
+
+        Returns:
+            A CSRGraph with the same vertices, edges and weights.
+        """
+        from algolib.data_structures.csr_graph import CSRGraph
+
+        return CSRGraph.from_graph(self)
+
+    def _intern(self, key: T) -> int:
+        """Creates the vertex for a new key and returns its id."""
+        index = len(self._vertex_list)
+        vertex = Vertex(key)
+        self._vertices[key] = vertex
+        self._ids[key] = index
+        self._vertex_list.append(vertex)
+        self._reverse = None
+        self._targets.append(array("i"))
+        self._weights.append(array("d"))
+        if self._positions is not None:
+            self._positions.append({})
+        return index
+
+    def _add_indexed(
+        self,
+        edges: Iterable[Tuple[T, T]] | Iterable[Tuple[T, T, float]],
+        weight: float,
+    ) -> int:
+        """The `add_edges_from` loop for indexed graphs, which replaces existing edges."""
+        ids = self._ids
+        count = 0
+        for edge in edges:
+            u_id = ids.get(edge[0])
+            if u_id is None:
+                u_id = self._intern(edge[0])
+            v_id = ids.get(edge[1])
+            if v_id is None:
+                v_id = self._intern(edge[1])
+            w = edge[2] if len(edge) > 2 else weight
+            count += self._link(u_id, v_id, w)
+            if not self.directed and u_id != v_id:
+                self._link(v_id, u_id, w)
+        return count
+
+    def _position(self, u_id: int, v_id: int, weight: Optional[float] = None) -> int:
+        """Returns the position of the first edge `u_id -> v_id` in the arrays, or -1.
+
+        If `weight` is given, only a parallel edge with that weight matches.
+        """
+        if self._positions is not None:
+            return self._positions[u_id].get(v_id, -1)
+        targets = self._targets[u_id]
+        if weight is None:
+            return targets.index(v_id) if v_id in targets else -1
+        weights = self._weights[u_id]
+        position = -1
+        while True:
+            try:
+                position = targets.index(v_id, position + 1)
+            except ValueError:
+                return -1
+            if weights[position] == weight:
+                return position
+
+    def _link(self, u_id: int, v_id: int, weight: float) -> bool:
+        """Adds or reweights the edge `u_id -> v_id` in an indexed graph; True if new."""
+        positions = cast(List[Dict[int, int]], self._positions)[u_id]
+        position = positions.get(v_id)
+        if position is not None:
+            self._weights[u_id][position] = weight
+            return False
+        positions[v_id] = len(self._targets[u_id])
+        self._targets[u_id].append(v_id)
+        self._weights[u_id].append(weight)
+        return True
+
+    def _unlink(self, u_id: int, v_id: int, weight: Optional[float] = None) -> bool:
+        """Removes one edge `u_id -> v_id`, of the given weight if any; True if found."""
+        position = self._position(u_id, v_id, weight)
+        if position < 0:
+            return False
+        self._remove_at(u_id, position)
+        return True
+
+    def _remove_at(self, u_id: int, position: int) -> None:
+        """Removes the out-edge of `u_id` at `position` by swapping in the last one."""
+        targets, weights = self._targets[u_id], self._weights[u_id]
+        if self._positions is not None:
+            del self._positions[u_id][targets[position]]
+        last = targets.pop()
+        weight = weights.pop()
+        if position < len(targets):
+            targets[position] = last
+            weights[position] = weight
+            if self._positions is not None:
+                self._positions[u_id][last] = position
+
+    def _reverse_adjacency(self) -> Tuple[List["array[int]"], List["array[float]"]]:
+        """Returns the in-edge arrays of every vertex, building them if needed."""
+        if not self.directed:
+            return self._targets, self._weights
+        if self._reverse is None:
+            sources: List["array[int]"] = [array("i") for _ in self._targets]
+            weights: List["array[float]"] = [array("d") for _ in self._targets]
+            for u, (targets, edge_weights) in enumerate(
+                zip(self._targets, self._weights, strict=True)
+            ):
+                for v, weight in zip(targets, edge_weights, strict=True):
+                    sources[v].append(u)
+                    weights[v].append(weight)
+            self._reverse = (sources, weights)
+        return self._reverse
+
+    def _sources(self, v_id: int) -> List[int]:
+        """Returns the ids of the vertices with an edge into `v_id`, each once."""
+        if not self.directed:
+            return list(set(self._targets[v_id]))
+        if self._reverse is not None:
+            return list(set(self._reverse[0][v_id]))
+        if self._positions is not None:
+            return [u for u, positions in enumerate(self._positions) if v_id in positions]
+        return [u for u, targets in enumerate(self._targets) if v_id in targets]
+
+    def _rename(self, u_id: int, old: int, new: int) -> None:
+        """Points the out-edges of `u_id` that target `old` at `new` instead."""
+        targets = self._targets[u_id]
+        if self._positions is None:
+            for position, target in enumerate(targets):
+                if target == old:
+                    targets[position] = new
+            return
+        positions = self._positions[u_id]
+        position = positions.pop(old)
+        positions[new] = position
+        targets[position] = new
+
     def get_neighbors(self, v: Vertex[T]) -> List[Vertex[T]]:
         """Gets all neighbor vertices of a given vertex.
 
@@ -133,4 +684,63 @@ class Graph(Generic[T]):
         Returns:
             A list of neighbor vertices.
         """
-        return [neighbor for neighbor, _ in self.neighbors(v)]
+        return [self._vertex_list[i] for i in self._targets[self.vertex_id(v)]]
+
+
+@dataclass(slots=True, init=False)
+class ReversedGraph(Generic[T]):
+    """A read-only view of a `Graph` with every edge reversed.
+
+    The out-edges of a vertex in the view are its in-edges in the graph, read
+    from the graph's cached reverse adjacency, and vertices and ids are the
+    graph's own. Reverse traversals can run any `GraphView` algorithm on it
+    without building a second graph.
+
+    Attributes:
+        graph: The underlying graph.
+        directed: Whether the underlying graph is directed.
+    """
+
+    graph: Graph[T]
+    directed: bool
+
+    def __init__(self, graph: Graph[T]) -> None:
+        """Initializes the view.
+
+        Args:
+            graph: The graph to reverse.
+        """
+        self.graph = graph
+        self.directed = graph.directed
+
+    def vertex_id(self, v: Vertex[T]) -> int:
+        """Returns the dense integer id of a vertex."""
+        return self.graph.vertex_id(v)
+
+    def vertex_at(self, index: int) -> Vertex[T]:
+        """Returns the vertex with the given dense integer id."""
+        return self.graph.vertex_at(index)
+
+    def neighbor_ids(self, index: int) -> "array[int]":
+        """Returns the source ids of the in-edges of the vertex with id `index`."""
+        return self.graph.predecessor_ids(index)
+
+    def neighbor_weights(self, index: int) -> "array[float]":
+        """Returns the weights of the in-edges of the vertex with id `index`."""
+        return self.graph.predecessor_weights(index)
+
+    def neighbors(self, v: Vertex[T]) -> Iterator[Tuple[Vertex[T], float]]:
+        """Returns an iterator over the in-neighbors of a vertex and edge weights."""
+        return self.graph.predecessors(v)
+
+    def __contains__(self, item: object) -> bool:
+        """Checks if a vertex or key is in the graph."""
+        return item in self.graph
+
+    def __len__(self) -> int:
+        """Returns the number of vertices in the graph."""
+        return len(self.graph)
+
+    def __iter__(self) -> Iterator[Vertex[T]]:
+        """Returns an iterator over the vertices in insertion order."""
+        return iter(self.graph)
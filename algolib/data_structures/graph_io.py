@@ -0,0 +1,226 @@
+"""Streaming loaders for edge-list files."""
+
+import gzip
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from typing import IO, Any, Callable, Iterator, Optional, Tuple, cast
+
+from algolib.data_structures.graph import Graph
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_PAIR_RECORD = struct.Struct("<ii")
+_WEIGHTED_RECORD = struct.Struct("<iid")
+
+
+def _rows_pattern(columns: int) -> "re.Pattern[bytes]":
+    """Matches a chunk whose lines are blank or hold exactly `columns` tokens."""
+    line = rb"[^\S\n]*+(?:\S++(?:[^\S\n]++\S++){%d}[^\S\n]*+)?+" % (columns - 1)
+    return re.compile(line + rb"(?:\n" + line + rb")*+")
+
+
+_ROWS = {columns: _rows_pattern(columns) for columns in (2, 3)}
+
+
+@dataclass(slots=True, frozen=True)
+class LoadStats:
+    """Throughput report for an edge-list load.
+
+    Attributes:
+        edges: The number of edges read from the file.
+        vertices: The number of vertices in the graph after loading.
+        seconds: Wall-clock time spent loading.
+        bytes_read: The number of (decompressed) bytes read.
+    """
+
+    edges: int
+    vertices: int
+    seconds: float
+    bytes_read: int
+
+    @property
+    def edges_per_second(self) -> float:
+        """The load throughput in edges per second."""
+        return self.edges / self.seconds if self.seconds > 0 else float("inf")
+
+
+def load_edge_list(
+    path: str | os.PathLike[str],
+    *,
+    delimiter: Optional[bytes] = None,
+    key: Callable[[bytes], Any] = int,
+    weighted: bool = False,
+    comment: bytes = b"#",
+    directed: bool = False,
+    graph: Optional[Graph[Any]] = None,
+    chunk_size: int = 1 << 20,
+) -> Tuple[Graph[Any], LoadStats]:
+    """Loads a text edge list (TSV, CSV or whitespace separated) into a graph.
+
+    The file is read in chunks of whole lines, and each chunk is tokenized with a
+    single `bytes.split` and handed to `Graph.add_edges_from_arrays` as strided
+    column slices, so no per-line strings or tuples are created. The column
+    count of every line is checked by one regular-expression match per chunk.
+    Gzip-compressed files are recognized by their magic number and decompressed
+    on the fly.
+
+    Args:
+        path: The file to read. Each line holds `u v` or, if `weighted`, `u v w`.
+        delimiter: The column separator, e.g. `b","`. Defaults to any whitespace.
+        key: Converts a key token to a vertex key. Defaults to `int`; use
+            `bytes.decode` for string keys.
+        weighted: Whether lines carry a third weight column.
+        comment: Lines starting with this prefix are skipped.
+        directed: Whether the new graph is directed. Ignored if `graph` is given.
+        graph: An existing graph to add the edges to.
+        chunk_size: The number of bytes to read per chunk.
+
+    Returns:
+        The graph and a `LoadStats` report.
+
+    Raises:
+        ValueError: If a line has the wrong number of columns.
+    """
+    graph = Graph[Any](directed=directed) if graph is None else graph
+    columns = 3 if weighted else 2
+    start = time.perf_counter()
+    edges = 0
+    bytes_read = 0
+    with _open(path) as f:
+        for chunk in _line_chunks(f, chunk_size):
+            bytes_read += len(chunk)
+            if comment and comment in chunk:
+                chunk = b"\n".join(
+                    line for line in chunk.split(b"\n") if not line.lstrip().startswith(comment)
+                )
+            if delimiter is not None:
+                chunk = chunk.replace(delimiter, b" ")
+            if _ROWS[columns].fullmatch(chunk) is None:
+                raise ValueError(f"Expected {columns} columns per edge")
+            tokens = chunk.split()
+            edges += graph.add_edges_from_arrays(
+                map(key, tokens[0::columns]),
+                map(key, tokens[1::columns]),
+                map(float, tokens[2::columns]) if weighted else None,
+            )
+    stats = LoadStats(edges, len(graph), time.perf_counter() - start, bytes_read)
+    return graph, stats
+
+
+def load_binary_edges(
+    path: str | os.PathLike[str],
+    *,
+    weighted: bool = False,
+    directed: bool = False,
+    graph: Optional[Graph[Any]] = None,
+    chunk_size: int = 1 << 20,
+) -> Tuple[Graph[Any], LoadStats]:
+    """Loads a binary edge file written by `write_binary_edges`.
+
+    Unweighted files are packed little-endian int32 `(u, v)` pairs, decoded a
+    chunk at a time with `array.frombytes`. Weighted files are packed `(u, v, w)`
+    records of two int32 ids and a float64 weight.
+
+    Args:
+        path: The file to read; may be gzip-compressed.
+        weighted: Whether the records carry a weight.
+        directed: Whether the new graph is directed. Ignored if `graph` is given.
+        graph: An existing graph to add the edges to.
+        chunk_size: The approximate number of bytes to read per chunk.
+
+    Returns:
+        The graph and a `LoadStats` report.
+
+    Raises:
+        ValueError: If the file size is not a whole number of records.
+    """
+    graph = Graph[Any](directed=directed) if graph is None else graph
+    record_size = (_WEIGHTED_RECORD if weighted else _PAIR_RECORD).size
+    chunk_size = max(record_size, chunk_size - chunk_size % record_size)
+    start = time.perf_counter()
+    edges = 0
+    bytes_read = 0
+    with _open(path) as f:
+        while chunk := f.read(chunk_size):
+            bytes_read += len(chunk)
+            if len(chunk) % record_size:
+                raise ValueError("Truncated binary edge file")
+            if weighted:
+                edges += graph.add_edges_from(_WEIGHTED_RECORD.iter_unpack(chunk))
+            else:
+                ids = array("i")
+                ids.frombytes(chunk)
+                if sys.byteorder == "big":
+                    ids.byteswap()
+                edges += graph.add_edges_from_arrays(ids[0::2], ids[1::2])
+    stats = LoadStats(edges, len(graph), time.perf_counter() - start, bytes_read)
+    return graph, stats
+
+
+def write_binary_edges(
+    graph: Graph[int], path: str | os.PathLike[str], *, weighted: bool = False
+) -> int:
+    """Writes the edges of a graph with integer keys in the binary edge format.
+
+    Undirected edges are written once, from the endpoint added to the graph first.
+
+    Args:
+        graph: The graph to write. Its keys must fit in an int32.
+        path: The destination path.
+        weighted: Whether to write edge weights.
+
+    Returns:
+        The number of edges written.
+    """
+    record = _WEIGHTED_RECORD if weighted else _PAIR_RECORD
+    count = 0
+    with open(path, "wb") as f:
+        for u_id in range(len(graph)):
+            u = graph.vertex_at(u_id).key
+            buffer = bytearray()
+            self_loop_seen = False
+            for v_id, weight in zip(
+                graph.neighbor_ids(u_id), graph.neighbor_weights(u_id), strict=True
+            ):
+                if not graph.directed:
+                    # Undirected edges are stored twice; a self-loop appears twice
+                    # in the same list.
+                    if v_id < u_id:
+                        continue
+                    if v_id == u_id:
+                        self_loop_seen = not self_loop_seen
+                        if not self_loop_seen:
+                            continue
+                v = graph.vertex_at(v_id).key
+                buffer += record.pack(u, v, weight) if weighted else record.pack(u, v)
+                count += 1
+            f.write(buffer)
+    return count
+
+
+def _open(path: str | os.PathLike[str]) -> IO[bytes]:
+    """Opens a file for binary reading, decompressing gzip transparently."""
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    if magic == _GZIP_MAGIC:
+        return cast(IO[bytes], gzip.open(path, "rb"))
+    return open(path, "rb")
+
+
+def _line_chunks(f: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Yields chunks of a file that end on line boundaries."""
+    tail = b""
+    while block := f.read(chunk_size):
+        block = tail + block
+        cut = block.rfind(b"\n") + 1
+        if cut:
+            tail = block[cut:]
+            yield block[:cut]
+        else:
+            tail = block
+    if tail:
+        yield tail
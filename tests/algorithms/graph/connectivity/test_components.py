@@ -0,0 +1,157 @@
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.connectivity.components import (
+    ComponentsResult,
+    ConnectedComponents,
+    IncrementalComponents,
+)
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.data_structures.graph import Graph, Vertex
+
+edge_lists = st.integers(min_value=1, max_value=15).flatmap(
+    lambda n: st.tuples(
+        st.just(n),
+        st.lists(st.tuples(st.integers(0, n - 1), st.integers(0, n - 1)), max_size=25),
+    )
+)
+
+
+def reference_labels(graph: Graph[int]) -> List[int]:
+    """Labels components by looping BFS.traverse over unlabelled vertices."""
+    undirected = Graph[int]()
+    undirected.add_vertices_from(v.key for v in graph)
+    undirected.add_edges_from((u.key, v.key) for u in graph for v, _ in graph.neighbors(u))
+    labels = [-1] * len(graph)
+    count = 0
+    for v in undirected:
+        if labels[undirected.vertex_id(v)] < 0:
+            for w in BFS[int]().traverse(undirected, v):
+                labels[undirected.vertex_id(w)] = count
+            count += 1
+    return labels
+
+
+@given(instance=edge_lists, directed=st.booleans())
+def test_components_property_backends_match_reference(
+    instance: Tuple[int, List[Tuple[int, int]]], directed: bool
+) -> None:
+    n, edges = instance
+    graph = Graph[int](directed=directed)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from(edges)
+    expected = reference_labels(graph)
+
+    backends = ["union_find"] if directed else ["bfs", "union_find"]
+    for backend in backends:
+        result = ConnectedComponents[int](backend).label(graph)  # type: ignore[arg-type]
+        assert list(result.labels) == expected
+        assert list(result.sizes) == [expected.count(label) for label in range(result.count)]
+
+
+@given(instance=edge_lists, split=st.integers(0, 25))
+def test_incremental_property_matches_batch(
+    instance: Tuple[int, List[Tuple[int, int]]], split: int
+) -> None:
+    n, edges = instance
+    graph = Graph[int]()
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from(edges[:split])
+    tracker = IncrementalComponents(graph)
+    for u, v in edges[split:]:
+        tracker.add_edge(Vertex(u), Vertex(v))
+
+    expected = ConnectedComponents[int]().label(graph)
+    snapshot = tracker.snapshot()
+    assert snapshot.labels == expected.labels
+    assert snapshot.sizes == expected.sizes
+    assert tracker.count == expected.count
+    for vertex in graph:
+        assert tracker.component_size(vertex) == expected.sizes[expected.label_of(vertex)]
+
+
+@pytest.fixture
+def islands() -> Graph[str]:
+    """Fixture for an undirected graph with three components."""
+    graph = Graph[str]()
+    graph.add_edges_from([("A", "B"), ("B", "C"), ("D", "E")])
+    graph.add_vertex("F")
+    return graph
+
+
+@pytest.mark.parametrize("backend", ["auto", "bfs", "union_find"])
+def test_label(islands: Graph[str], backend: str) -> None:
+    """Test labels, sizes and queries on a small graph."""
+    components = ConnectedComponents[str](backend)  # type: ignore[arg-type]
+    result = components.label(islands)
+    assert list(result.labels) == [0, 0, 0, 1, 1, 2]
+    assert list(result.sizes) == [3, 2, 1]
+    assert result.count == 3
+    assert result.connected(Vertex("A"), Vertex("C"))
+    assert not result.connected(Vertex("A"), Vertex("D"))
+    assert result.members(1) == [Vertex("D"), Vertex("E")]
+    with pytest.raises(IndexError):
+        result.members(3)
+    assert components.last_backend == ("bfs" if backend == "auto" else backend)
+
+
+def test_directed_graph_uses_union_find() -> None:
+    """Test that directed graphs get weakly connected components."""
+    graph = Graph[int](directed=True)
+    graph.add_edges_from([(1, 0), (2, 0), (3, 4)])
+    components = ConnectedComponents[int]()
+    assert list(components.label(graph).labels) == [0, 0, 0, 1, 1]
+    assert components.last_backend == "union_find"
+    with pytest.raises(ValueError, match="requires an undirected graph"):
+        ConnectedComponents[int]("bfs").label(graph)
+
+
+def test_incremental_components(islands: Graph[str]) -> None:
+    """Test that merges, new vertices and sizes are tracked."""
+    tracker = IncrementalComponents(islands)
+    assert tracker.count == 3
+    assert not tracker.add_edge(Vertex("A"), Vertex("C"))
+    assert tracker.add_edge(Vertex("C"), Vertex("D"))
+    assert tracker.count == 2
+    assert tracker.component_size(Vertex("E")) == 5
+    assert tracker.connected(Vertex("A"), Vertex("E"))
+
+    tracker.add_vertex("G")
+    assert tracker.count == 3
+    assert tracker.add_edges_from([("G", "H"), ("H", "F"), ("F", "G")]) == 2
+    assert tracker.count == 2
+    assert tracker.component_size(Vertex("H")) == 3
+    assert list(tracker.snapshot().sizes) == [5, 3]
+    assert islands.get_neighbors(Vertex("G")) == [Vertex("H"), Vertex("F")]
+    with pytest.raises(ValueError):
+        tracker.add_edge(Vertex("A"), Vertex("Z"))
+
+
+def test_incremental_components_follow_vertex_removal(islands: Graph[str]) -> None:
+    """Test that removing a vertex, which reassigns ids, triggers a rebuild."""
+    tracker = IncrementalComponents(islands)
+    # F holds the highest id and moves into B's id, splitting A from C.
+    islands.remove_vertex(Vertex("B"))
+    assert islands.vertex_removals == 1
+    assert tracker.count == 4
+    assert not tracker.connected(Vertex("A"), Vertex("C"))
+    assert tracker.component_size(Vertex("F")) == 1
+    assert tracker.component_size(Vertex("E")) == 2
+
+    islands.remove_vertex(Vertex("D"))
+    islands.add_vertex("G")
+    assert tracker.add_edge(Vertex("E"), Vertex("G"))
+    assert tracker.snapshot().labels == ConnectedComponents[str]().label(islands).labels
+    assert tracker.component_size(Vertex("G")) == 2
+
+
+def test_invalid_input(islands: Graph[str]) -> None:
+    """Test backend validation and the run method."""
+    with pytest.raises(ValueError, match="backend"):
+        ConnectedComponents[str]("dfs")  # type: ignore[arg-type]
+    assert isinstance(ConnectedComponents[str]().run(islands), ComponentsResult)
+    with pytest.raises(TypeError, match="Expected a Graph"):
+        ConnectedComponents[str]().run([islands])
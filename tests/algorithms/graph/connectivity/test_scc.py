@@ -0,0 +1,113 @@
+import sys
+from array import array
+from typing import List, Set, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.connectivity.components import ComponentsResult
+from algolib.algorithms.graph.connectivity.scc import StronglyConnectedComponents
+from algolib.algorithms.graph.ordering.toposort import TopologicalSort
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.data_structures.graph import Graph, Vertex
+
+edge_lists = st.integers(min_value=1, max_value=12).flatmap(
+    lambda n: st.tuples(
+        st.just(n),
+        st.lists(st.tuples(st.integers(0, n - 1), st.integers(0, n - 1)), max_size=30),
+    )
+)
+
+
+def reachable(graph: Graph[int], v: int) -> Set[int]:
+    return {w.key for w in BFS[int]().traverse(graph, Vertex(v))}
+
+
+@given(instance=edge_lists)
+def test_scc_property_matches_mutual_reachability(
+    instance: Tuple[int, List[Tuple[int, int]]],
+) -> None:
+    n, edges = instance
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from(edges)
+    scc = StronglyConnectedComponents[int]()
+    result = scc.label(graph)
+
+    reach = [reachable(graph, v) for v in range(n)]
+    for u in range(n):
+        for v in range(n):
+            mutual = v in reach[u] and u in reach[v]
+            assert (result.labels[u] == result.labels[v]) == mutual
+    assert list(result.sizes) == [list(result.labels).count(c) for c in range(result.count)]
+    # Labels follow a topological order of the condensation.
+    assert all(result.labels[u] <= result.labels[v] for u, v in edges)
+
+    dag = scc.condensation(graph, result)
+    assert len(dag) == result.count
+    assert TopologicalSort[int]().find_cycle(dag) is None
+    expected = {(result.labels[u], result.labels[v]) for u, v in edges}
+    expected = {(a, b) for a, b in expected if a != b}
+    assert {(c, d) for c in range(len(dag)) for d in dag.neighbor_ids(c)} == expected
+
+
+@pytest.fixture
+def call_graph() -> Graph[str]:
+    """Fixture for a call graph with two cycles and a leaf."""
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([
+        ("main", "parse", 1.0),
+        ("parse", "lex", 2.0),
+        ("lex", "parse", 1.0),
+        ("parse", "eval", 5.0),
+        ("lex", "eval", 3.0),
+        ("eval", "apply", 1.0),
+        ("apply", "eval", 1.0),
+        ("apply", "log", 1.0),
+    ])
+    return graph
+
+
+def test_label(call_graph: Graph[str]) -> None:
+    """Test component ids and sizes on a small call graph."""
+    result = StronglyConnectedComponents[str]().label(call_graph)
+    assert result.count == 4
+    assert list(result.labels) == [0, 1, 1, 2, 2, 3]
+    assert list(result.sizes) == [1, 2, 2, 1]
+    assert result.connected(Vertex("eval"), Vertex("apply"))
+    assert result.members(1) == [Vertex("parse"), Vertex("lex")]
+
+
+def test_condensation(call_graph: Graph[str]) -> None:
+    """Test that the condensation keeps the lightest edge between components."""
+    scc = StronglyConnectedComponents[str]()
+    dag = scc.condensation(call_graph, scc.label(call_graph))
+    assert dag.directed
+    assert list(dag.offsets) == [0, 1, 2, 3, 3]
+    assert list(dag.targets) == [1, 2, 3]
+    assert list(dag.weights) == [1.0, 3.0, 1.0]
+    assert dag.get_vertex(2) is not None
+
+
+def test_deep_chain() -> None:
+    """Test a cycle far longer than the recursion limit."""
+    n = sys.getrecursionlimit() * 20
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from_arrays(array("i", range(n - 1)), array("i", range(1, n)))
+    scc = StronglyConnectedComponents[int]()
+    chain = scc.label(graph)
+    assert chain.count == n
+    assert list(chain.labels) == list(range(n))
+
+    graph.add_edges_from([(n - 1, 0)])
+    cycle = scc.label(graph)
+    assert cycle.count == 1 and cycle.sizes[0] == n
+
+
+def test_run_method(call_graph: Graph[str]) -> None:
+    """Test the run method and its input validation."""
+    assert isinstance(StronglyConnectedComponents[str]().run(call_graph), ComponentsResult)
+    with pytest.raises(TypeError, match="Expected a Graph"):
+        StronglyConnectedComponents[str]().run((call_graph,))
@@ -0,0 +1,125 @@
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.connectivity.components import ConnectedComponents
+from algolib.algorithms.graph.mst import kruskal
+from algolib.algorithms.graph.mst.base import SpanningForest
+from algolib.algorithms.graph.mst.kruskal import Kruskal
+from algolib.data_structures.graph import Graph, Vertex
+
+Edge = Tuple[int, int, float]
+
+edge_lists = st.integers(min_value=1, max_value=12).flatmap(
+    lambda n: st.tuples(
+        st.just(n),
+        st.lists(
+            st.tuples(st.integers(0, n - 1), st.integers(0, n - 1), st.integers(-5, 20).map(float)),
+            max_size=30,
+        ),
+    )
+)
+
+
+def heaviest_on_path(
+    adjacency: Dict[int, List[Tuple[int, float]]], u: int, v: int
+) -> Optional[float]:
+    """Returns the heaviest edge on the forest path from u to v, or None if disconnected."""
+    stack: List[Tuple[int, int, float]] = [(u, -1, float("-inf"))]
+    while stack:
+        current, parent, heaviest = stack.pop()
+        if current == v:
+            return heaviest
+        for neighbor, weight in adjacency.get(current, []):
+            if neighbor != parent:
+                stack.append((neighbor, current, max(heaviest, weight)))
+    return None
+
+
+@given(instance=edge_lists)
+def test_kruskal_property_is_minimum_spanning_forest(instance: Tuple[int, List[Edge]]) -> None:
+    n, edges = instance
+    graph = Graph[int]()
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from(edges)
+    forest = Kruskal[int]().solve(graph)
+
+    components = ConnectedComponents[int]().label(graph)
+    assert forest.trees == components.count
+    assert len(forest) == n - components.count
+    assert forest.total_weight == sum(forest.weights)
+    assert list(forest.weights) == sorted(forest.weights)
+
+    adjacency: Dict[int, List[Tuple[int, float]]] = {}
+    for u, v, w in zip(forest.sources, forest.targets, forest.weights, strict=True):
+        adjacency.setdefault(u, []).append((v, w))
+        adjacency.setdefault(v, []).append((u, w))
+    # Cycle property: no graph edge is lighter than the heaviest forest edge it
+    # could replace, and every edge's endpoints are spanned by the same tree.
+    for u, v, w in edges:
+        if u != v:
+            heaviest = heaviest_on_path(adjacency, u, v)
+            assert heaviest is not None and heaviest <= w
+
+
+@pytest.fixture
+def weighted_graph() -> Graph[str]:
+    """Fixture for a weighted graph with two components."""
+    graph = Graph[str]()
+    graph.add_edges_from([
+        ("A", "B", 4.0),
+        ("A", "C", 1.0),
+        ("B", "C", 2.0),
+        ("B", "D", 5.0),
+        ("C", "D", 8.0),
+        ("D", "D", 0.0),
+        ("E", "F", 3.0),
+    ])
+    return graph
+
+
+def test_solve(weighted_graph: Graph[str]) -> None:
+    """Test the forest edges, total weight and tree count."""
+    forest = Kruskal[str]().solve(weighted_graph)
+    assert forest.edges == [
+        (Vertex("A"), Vertex("C"), 1.0),
+        (Vertex("B"), Vertex("C"), 2.0),
+        (Vertex("E"), Vertex("F"), 3.0),
+        (Vertex("B"), Vertex("D"), 5.0),
+    ]
+    assert forest.total_weight == 11.0
+    assert forest.trees == 2
+    assert len(forest) == 4
+
+
+def test_sort_paths_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the NumPy argsort and the sorted fallback pick the same edges."""
+    graph = Graph[int]()
+    graph.add_edges_from((i, (i * 7 + 3) % 50, float(i % 4)) for i in range(50))
+    graph.add_edges_from((i, (i + 1) % 50, 2.0) for i in range(50))
+    vectorized = Kruskal[int]().solve(graph)
+    monkeypatch.setattr(kruskal, "HAVE_NUMPY", False)
+    fallback = Kruskal[int]().solve(graph)
+    assert vectorized.edges == fallback.edges
+    assert vectorized.total_weight == fallback.total_weight
+
+
+def test_empty_and_single_vertex() -> None:
+    """Test graphs without edges."""
+    graph = Graph[int]()
+    assert len(Kruskal[int]().solve(graph)) == 0
+    graph.add_vertex(1)
+    forest = Kruskal[int]().solve(graph)
+    assert forest.trees == 1 and forest.total_weight == 0.0
+
+
+def test_invalid_input(weighted_graph: Graph[str]) -> None:
+    """Test that directed graphs and bad run input are rejected."""
+    directed = Graph[str](directed=True)
+    with pytest.raises(ValueError, match="require an undirected graph"):
+        Kruskal[str]().solve(directed)
+    assert isinstance(Kruskal[str]().run(weighted_graph), SpanningForest)
+    with pytest.raises(TypeError, match="Expected a Graph"):
+        Kruskal[str]().run([weighted_graph])
@@ -0,0 +1,78 @@
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.mst.base import SpanningForest
+from algolib.algorithms.graph.mst.kruskal import Kruskal
+from algolib.algorithms.graph.mst.prim import Prim
+from algolib.data_structures.disjoint_set import DisjointSet
+from algolib.data_structures.graph import Graph, Vertex
+
+Edge = Tuple[int, int, float]
+
+edge_lists = st.integers(min_value=1, max_value=12).flatmap(
+    lambda n: st.tuples(
+        st.just(n),
+        st.lists(
+            st.tuples(st.integers(0, n - 1), st.integers(0, n - 1), st.integers(-5, 20).map(float)),
+            max_size=30,
+        ),
+    )
+)
+
+
+@given(instance=edge_lists)
+def test_prim_property_matches_kruskal(instance: Tuple[int, List[Edge]]) -> None:
+    n, edges = instance
+    graph = Graph[int]()
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from(edges)
+    forest = Prim[int]().solve(graph)
+    expected = Kruskal[int]().solve(graph)
+
+    assert forest.total_weight == expected.total_weight
+    assert forest.trees == expected.trees
+    assert len(forest) == len(expected)
+    # The edges form a forest: no edge closes a cycle.
+    sets = DisjointSet[int](range(n))
+    assert all(sets.union(u, v) for u, v in zip(forest.sources, forest.targets, strict=True))
+
+
+@pytest.fixture
+def weighted_graph() -> Graph[str]:
+    """Fixture for a weighted graph with two components."""
+    graph = Graph[str]()
+    graph.add_edges_from([
+        ("A", "B", 4.0),
+        ("A", "C", 1.0),
+        ("B", "C", 2.0),
+        ("B", "D", 5.0),
+        ("C", "D", 8.0),
+        ("D", "D", 0.0),
+        ("E", "F", 3.0),
+    ])
+    return graph
+
+
+def test_solve(weighted_graph: Graph[str]) -> None:
+    """Test that edges are reported as (parent, child) in the order they join."""
+    forest = Prim[str]().solve(weighted_graph)
+    assert forest.edges == [
+        (Vertex("A"), Vertex("C"), 1.0),
+        (Vertex("C"), Vertex("B"), 2.0),
+        (Vertex("B"), Vertex("D"), 5.0),
+        (Vertex("E"), Vertex("F"), 3.0),
+    ]
+    assert forest.total_weight == 11.0
+    assert forest.trees == 2
+
+
+def test_invalid_input(weighted_graph: Graph[str]) -> None:
+    """Test that directed graphs and bad run input are rejected."""
+    with pytest.raises(ValueError, match="require an undirected graph"):
+        Prim[str]().solve(Graph[str](directed=True))
+    assert isinstance(Prim[str]().run(weighted_graph), SpanningForest)
+    with pytest.raises(TypeError, match="Expected a Graph"):
+        Prim[str]().run([weighted_graph])
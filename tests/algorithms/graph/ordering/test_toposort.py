@@ -0,0 +1,117 @@
+import sys
+from array import array
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.ordering.toposort import TopologicalSort
+from algolib.data_structures.graph import Graph, Vertex
+
+edge_lists = st.integers(min_value=1, max_value=12).flatmap(
+    lambda n: st.tuples(
+        st.just(n),
+        st.lists(st.tuples(st.integers(0, n - 1), st.integers(0, n - 1)), max_size=25),
+    )
+)
+
+
+def has_edge(graph: Graph[int], u: Vertex[int], v: Vertex[int]) -> bool:
+    return v in graph.get_neighbors(u)
+
+
+@given(instance=edge_lists)
+def test_toposort_property_sort_or_cycle(instance: Tuple[int, List[Tuple[int, int]]]) -> None:
+    n, edges = instance
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from(edges)
+    toposort = TopologicalSort[int]()
+    cycle = toposort.find_cycle(graph)
+
+    if cycle is None:
+        order = toposort.sort(graph)
+        assert sorted(v.key for v in order) == list(range(n))
+        position = {v.key: i for i, v in enumerate(order)}
+        assert all(position[u] < position[v] for u, v in edges)
+    else:
+        with pytest.raises(ValueError, match="contains a cycle"):
+            toposort.sort(graph)
+        assert len(set(cycle)) == len(cycle)
+        for u, v in zip(cycle, cycle[1:] + cycle[:1], strict=True):
+            assert has_edge(graph, u, v)
+
+
+@given(instance=edge_lists)
+def test_toposort_property_dag(instance: Tuple[int, List[Tuple[int, int]]]) -> None:
+    n, edges = instance
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from((min(u, v), max(u, v)) for u, v in edges if u != v)
+    assert TopologicalSort[int]().find_cycle(graph) is None
+    assert len(TopologicalSort[int]().sort(graph)) == n
+
+
+@pytest.fixture
+def build_graph() -> Graph[str]:
+    """Fixture for a small dependency graph."""
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([
+        ("lib", "app"),
+        ("core", "lib"),
+        ("core", "tests"),
+        ("lib", "tests"),
+        ("docs", "app"),
+    ])
+    return graph
+
+
+def test_sort(build_graph: Graph[str]) -> None:
+    """Test Kahn's order on a small DAG."""
+    order = TopologicalSort[str]().sort(build_graph)
+    assert [v.key for v in order] == ["core", "docs", "lib", "app", "tests"]
+
+
+def test_find_cycle(build_graph: Graph[str]) -> None:
+    """Test that the cycle is reported in edge order."""
+    toposort = TopologicalSort[str]()
+    assert toposort.find_cycle(build_graph) is None
+    build_graph.add_edges_from([("tests", "core")])
+    assert toposort.find_cycle(build_graph) == [Vertex("lib"), Vertex("tests"), Vertex("core")]
+    with pytest.raises(ValueError, match="contains a cycle"):
+        toposort.sort(build_graph)
+
+
+def test_self_loop() -> None:
+    """Test that a self-loop is a one-vertex cycle."""
+    graph = Graph[int](directed=True)
+    graph.add_edges_from([(0, 1), (1, 1)])
+    assert TopologicalSort[int]().find_cycle(graph) == [Vertex(1)]
+
+
+def test_deep_chain() -> None:
+    """Test a chain far longer than the recursion limit, closed into a cycle."""
+    n = sys.getrecursionlimit() * 20
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from_arrays(array("i", range(n - 1)), array("i", range(1, n)))
+    toposort = TopologicalSort[int]()
+    assert [v.key for v in toposort.sort(graph)] == list(range(n))
+    graph.add_edges_from([(n - 1, 0)])
+    cycle = toposort.find_cycle(graph)
+    assert cycle is not None and len(cycle) == n
+
+
+def test_invalid_input(build_graph: Graph[str]) -> None:
+    """Test that undirected graphs and bad run input are rejected."""
+    undirected = Graph[str]()
+    undirected.add_edges_from([("a", "b")])
+    toposort = TopologicalSort[str]()
+    with pytest.raises(ValueError, match="requires a directed graph"):
+        toposort.sort(undirected)
+    with pytest.raises(ValueError, match="requires a directed graph"):
+        toposort.find_cycle(undirected)
+    assert len(toposort.run(build_graph)) == 5
+    with pytest.raises(TypeError, match="Expected a Graph"):
+        toposort.run([build_graph])
@@ -0,0 +1,138 @@
+import math
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.shortest_path.astar import AStar, euclidean, manhattan
+from algolib.algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algolib.data_structures.graph import Graph, Vertex
+
+Point = Tuple[int, int]
+
+points = st.tuples(st.integers(0, 20), st.integers(0, 20))
+
+
+@st.composite
+def geometric_graph(draw: st.DrawFn) -> Tuple[Graph[Point], Vertex[Point], Vertex[Point]]:
+    """Random graph on points whose edge weights are at least the straight-line distance."""
+    keys = draw(st.lists(points, min_size=2, max_size=12, unique=True))
+    graph = Graph[Point](directed=draw(st.booleans()))
+    graph.add_vertices_from(keys)
+    index = st.integers(0, len(keys) - 1)
+    for a, b, stretch in draw(st.lists(st.tuples(index, index, st.floats(1.0, 3.0)), max_size=40)):
+        graph.add_edges_from([(keys[a], keys[b], euclidean(keys[a], keys[b]) * stretch)])
+    return graph, Vertex(keys[draw(index)]), Vertex(keys[draw(index)])
+
+
+def path_cost(graph: Graph[Point], path: List[Vertex[Point]]) -> float:
+    return sum(
+        min(weight for neighbor, weight in graph.neighbors(a) if neighbor == b)
+        for a, b in zip(path, path[1:], strict=False)
+    )
+
+
+@given(instance=geometric_graph(), epsilon=st.sampled_from([1.0, 1.5, 3.0]))
+def test_astar_property_cost_within_epsilon_of_optimal(
+    instance: Tuple[Graph[Point], Vertex[Point], Vertex[Point]], epsilon: float
+) -> None:
+    graph, source, target = instance
+    optimal = Dijkstra[Point]().search(graph, source).distance(target)
+    path = AStar[Point](euclidean, epsilon=epsilon).shortest_path(graph, source, target)
+
+    if optimal is None:
+        assert path is None
+        return
+    assert path is not None and path[0] == source and path[-1] == target
+    assert path_cost(graph, path) <= epsilon * optimal + 1e-9
+    if epsilon == 1.0:
+        assert math.isclose(path_cost(graph, path), optimal)
+
+
+@pytest.fixture
+def grid() -> Graph[Point]:
+    """Fixture for an undirected 30x30 grid with unit weights and a wall."""
+    graph = Graph[Point]()
+    wall = {(15, y) for y in range(5, 30)}
+    for x in range(30):
+        for y in range(30):
+            for nx, ny in ((x + 1, y), (x, y + 1)):
+                if nx < 30 and ny < 30 and (x, y) not in wall and (nx, ny) not in wall:
+                    graph.add_edges_from([((x, y), (nx, ny))])
+    return graph
+
+
+def test_astar_matches_dijkstra_with_fewer_expansions(grid: Graph[Point]) -> None:
+    """Test that a good heuristic keeps the answer and cuts expansions."""
+    source, target = Vertex((0, 29)), Vertex((29, 29))
+    dijkstra = Dijkstra[Point]().search(grid, source, target=target)
+    astar = AStar[Point](manhattan)
+    result = astar.search(grid, source, target)
+    assert result.target == target
+    assert result.distance(target) == dijkstra.distance(target) == 79.0
+    assert astar.expansions == result.expansions
+    assert astar.expansions < dijkstra.expansions
+
+
+def test_tie_breaking_reduces_expansions(grid: Graph[Point]) -> None:
+    """Test that preferring deeper vertices expands fewer ties on an open grid."""
+    source, target = Vertex((0, 0)), Vertex((14, 29))
+    deeper = AStar[Point](manhattan)
+    fifo = AStar[Point](manhattan, prefer_deeper=False)
+    assert deeper.search(grid, source, target).distance(target) == 43.0
+    assert fifo.search(grid, source, target).distance(target) == 43.0
+    assert deeper.expansions < fifo.expansions
+
+
+def test_weighted_astar_expands_less(grid: Graph[Point]) -> None:
+    """Test that epsilon > 1 trades optimality for fewer expansions."""
+    source, target = Vertex((0, 29)), Vertex((29, 29))
+    exact = AStar[Point](manhattan, prefer_deeper=False)
+    weighted = AStar[Point](manhattan, epsilon=2.0, prefer_deeper=False)
+    exact_cost = exact.search(grid, source, target).distance(target)
+    weighted_cost = weighted.search(grid, source, target).distance(target)
+    assert exact_cost is not None and weighted_cost is not None
+    assert exact_cost <= weighted_cost <= 2.0 * exact_cost
+    assert weighted.expansions < exact.expansions
+
+
+def test_max_expansions(grid: Graph[Point]) -> None:
+    """Test that the search gives up once its expansion budget is spent."""
+    astar = AStar[Point](manhattan, max_expansions=10)
+    result = astar.search(grid, Vertex((0, 29)), Vertex((29, 29)))
+    assert result.target is None
+    assert astar.expansions == 10
+    assert astar.shortest_path(grid, Vertex((0, 29)), Vertex((29, 29))) is None
+    assert sum(1 for v in grid if v in result) == 10
+
+
+def test_unreachable_target() -> None:
+    """Test that an unreachable target yields no path."""
+    graph = Graph[Point]()
+    graph.add_vertices_from([(0, 0), (5, 5)])
+    assert AStar[Point](euclidean).shortest_path(graph, Vertex((0, 0)), Vertex((5, 5))) is None
+
+
+def test_invalid_input(grid: Graph[Point]) -> None:
+    """Test input validation."""
+    with pytest.raises(ValueError, match="epsilon must be at least 1"):
+        AStar[Point](manhattan, epsilon=0.5)
+    astar = AStar[Point](manhattan)
+    with pytest.raises(ValueError, match="must be in the graph"):
+        astar.search(grid, Vertex((0, 0)), Vertex((99, 99)))
+    grid.add_edges_from([((0, 0), (-1, -1), -1.0)])
+    with pytest.raises(ValueError, match="non-negative"):
+        astar.search(grid, Vertex((0, 0)), Vertex((29, 0)))
+
+
+def test_run_method(grid: Graph[Point]) -> None:
+    """Test the run method and its input validation."""
+    astar = AStar[Point](manhattan)
+    assert len(astar.run((grid, Vertex((0, 0)), Vertex((3, 0))))) == 4
+    with pytest.raises(TypeError, match="Expected a tuple"):
+        astar.run((grid, Vertex((0, 0))))
+    with pytest.raises(TypeError, match="must be a Graph"):
+        astar.run(("grid", Vertex((0, 0)), Vertex((3, 0))))
+    with pytest.raises(TypeError, match="must be Vertex objects"):
+        astar.run((grid, (0, 0), Vertex((3, 0))))
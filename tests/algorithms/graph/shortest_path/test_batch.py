@@ -0,0 +1,89 @@
+import math
+import random
+from array import array
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from algolib.algorithms.graph.shortest_path.batch import BatchShortestPaths, DistanceMatrix
+from algolib.algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.data_structures.graph import Graph, Vertex
+
+
+@pytest.fixture
+def random_graph() -> Graph[int]:
+    """Fixture for a random weighted digraph with a few unreachable vertices."""
+    rng = random.Random(3)
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(300))
+    graph.add_edges_from(
+        (rng.randrange(280), rng.randrange(280), rng.uniform(1.0, 10.0)) for _ in range(1_200)
+    )
+    return graph
+
+
+SOURCES = [Vertex(i) for i in (0, 5, 17, 5, 290)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("method", ["bfs", "dijkstra"])
+def test_stream_matches_single_source(random_graph: Graph[int], method: Any, workers: int) -> None:
+    """Test that every source is delivered once with the single-source distances."""
+    batch = BatchShortestPaths[int](method, workers=workers, chunk_size=2)
+    delivered = []
+    assert batch.stream(random_graph, SOURCES, lambda v, d: delivered.append((v, d))) == 5
+
+    assert sorted(v.key for v, _ in delivered) == [0, 5, 5, 17, 290]
+    solver = BFS[int]() if method == "bfs" else Dijkstra[int]()
+    for source, distances in delivered:
+        assert distances == solver.search(random_graph, source).distances
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("method", ["bfs", "dijkstra"])
+def test_write_matrix(random_graph: Graph[int], tmp_path: Path, method: Any, workers: int) -> None:
+    """Test that the matrix file holds one row per source, in source order."""
+    path = tmp_path / "distances.bin"
+    batch = BatchShortestPaths[int](method, workers=workers, chunk_size=2)
+    matrix = batch.write_matrix(random_graph, SOURCES, path)
+
+    typecode = "i" if method == "bfs" else "d"
+    assert matrix == DistanceMatrix(str(path), 5, 300, typecode)
+    assert path.stat().st_size == 5 * 300 * array(typecode).itemsize
+    solver = BFS[int]() if method == "bfs" else Dijkstra[int]()
+    for row, source in enumerate(SOURCES):
+        assert matrix.row(row) == solver.search(random_graph, source).distances
+    assert matrix.row(4)[0] in (-1, math.inf)
+    with pytest.raises(IndexError):
+        matrix.row(5)
+
+
+def test_run_method(random_graph: Graph[int]) -> None:
+    """Test the run method and its input validation."""
+    batch = BatchShortestPaths[int](workers=1)
+    results: Dict[Vertex[int], Any] = batch.run((random_graph, [Vertex(0), Vertex(1)]))
+    assert set(results) == {Vertex(0), Vertex(1)}
+    assert results[Vertex(0)] == BFS[int]().search(random_graph, Vertex(0)).distances
+    with pytest.raises(TypeError, match="Expected a tuple"):
+        batch.run(random_graph)
+    with pytest.raises(TypeError, match="must be a Graph"):
+        batch.run(("graph", [Vertex(0)]))
+    with pytest.raises(TypeError, match="must be Vertex objects"):
+        batch.run((random_graph, [0]))
+
+
+def test_invalid_input(random_graph: Graph[int]) -> None:
+    """Test constructor and source validation."""
+    with pytest.raises(ValueError, match="method"):
+        BatchShortestPaths[int]("floyd")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="workers"):
+        BatchShortestPaths[int](workers=0)
+    with pytest.raises(ValueError, match="chunk_size"):
+        BatchShortestPaths[int](chunk_size=0)
+    batch = BatchShortestPaths[int](workers=1)
+    with pytest.raises(ValueError, match="must be in the graph"):
+        batch.stream(random_graph, [Vertex(0), Vertex(999)], lambda v, d: None)
+    with pytest.raises(ValueError, match="At least one"):
+        batch.stream(random_graph, [], lambda v, d: None)
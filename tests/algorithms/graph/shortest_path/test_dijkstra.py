@@ -0,0 +1,148 @@
+import math
+from typing import Dict, List, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algolib.data_structures.graph import Graph, Vertex
+
+
+@st.composite
+def random_weighted_graph(draw: st.DrawFn) -> Tuple[Graph[int], Vertex[int]]:
+    num_vertices = draw(st.integers(min_value=1, max_value=12))
+    graph = Graph[int](directed=draw(st.booleans()))
+    graph.add_vertices_from(range(num_vertices))
+    vertex_ids = st.integers(min_value=0, max_value=num_vertices - 1)
+    weights = st.integers(min_value=0, max_value=20).map(float)
+    graph.add_edges_from(draw(st.lists(st.tuples(vertex_ids, vertex_ids, weights), max_size=40)))
+    return graph, Vertex(draw(vertex_ids))
+
+
+def bellman_ford(graph: Graph[int], source: Vertex[int]) -> Dict[int, float]:
+    distances = {v.key: math.inf for v in graph}
+    distances[source.key] = 0.0
+    for _ in range(len(graph)):
+        for u in graph:
+            for v, weight in graph.neighbors(u):
+                distances[v.key] = min(distances[v.key], distances[u.key] + weight)
+    return distances
+
+
+@given(graph_and_source=random_weighted_graph())
+def test_dijkstra_property_matches_bellman_ford(
+    graph_and_source: Tuple[Graph[int], Vertex[int]],
+) -> None:
+    graph, source = graph_and_source
+    result = Dijkstra[int]().search(graph, source)
+    expected = bellman_ford(graph, source)
+
+    assert {v.key: result.distances[graph.vertex_id(v)] for v in graph} == expected
+    for v in graph:
+        path = result.path_to(v)
+        if expected[v.key] == math.inf:
+            assert path is None and v not in result
+            continue
+        # The path's edge weights add up to the reported distance.
+        assert path is not None and path[0] == source and path[-1] == v
+        total = sum(
+            min(weight for neighbor, weight in graph.neighbors(a) if neighbor == b)
+            for a, b in zip(path, path[1:], strict=False)
+        )
+        assert total == result.distance(v)
+
+
+@pytest.fixture
+def road_graph() -> Graph[str]:
+    """Fixture for a small weighted undirected graph."""
+    graph = Graph[str]()
+    graph.add_edges_from([
+        ("a", "b", 7.0),
+        ("a", "c", 9.0),
+        ("a", "f", 14.0),
+        ("b", "c", 10.0),
+        ("b", "d", 15.0),
+        ("c", "d", 11.0),
+        ("c", "f", 2.0),
+        ("d", "e", 6.0),
+        ("e", "f", 9.0),
+    ])
+    return graph
+
+
+def keys(path: List[Vertex[str]] | None) -> List[str]:
+    assert path is not None
+    return [v.key for v in path]
+
+
+def test_single_source_distances(road_graph: Graph[str]) -> None:
+    """Test the classic example distances and a reconstructed path."""
+    result = Dijkstra[str]().search(road_graph, Vertex("a"))
+    assert [result.distance(Vertex(k)) for k in "abcdef"] == [0.0, 7.0, 9.0, 20.0, 20.0, 11.0]
+    assert keys(result.path_to(Vertex("e"))) == ["a", "c", "f", "e"]
+    assert result.predecessors[road_graph.vertex_id(Vertex("a"))] == -1
+    assert result.expansions == 6
+
+
+def test_target_early_exit(road_graph: Graph[str]) -> None:
+    """Test that the search stops once the target is settled."""
+    result = Dijkstra[str]().search(road_graph, Vertex("a"), target=Vertex("c"))
+    assert result.target == Vertex("c")
+    assert result.distance(Vertex("c")) == 9.0
+    assert result.expansions == 3
+    # Vertices still on the heap are not reported with tentative distances.
+    assert result.distance(Vertex("f")) is None
+    assert result.distance(Vertex("d")) is None
+    assert keys(Dijkstra[str]().shortest_path(road_graph, Vertex("a"), Vertex("e"))) == [
+        "a",
+        "c",
+        "f",
+        "e",
+    ]
+
+
+def test_cutoff(road_graph: Graph[str]) -> None:
+    """Test that vertices beyond the cutoff are not reached."""
+    result = Dijkstra[str]().search(road_graph, Vertex("a"), cutoff=11.0)
+    assert {v.key for v in road_graph if v in result} == {"a", "b", "c", "f"}
+    assert result.path_to(Vertex("d")) is None
+
+
+def test_multi_source(road_graph: Graph[str]) -> None:
+    """Test distances to the nearest of several sources."""
+    result = Dijkstra[str]().search(road_graph, [Vertex("a"), Vertex("e")])
+    assert [result.distance(Vertex(k)) for k in "abcdef"] == [0.0, 7.0, 9.0, 6.0, 0.0, 9.0]
+
+
+def test_unreachable_target() -> None:
+    """Test that an unreachable target yields no path."""
+    graph = Graph[int](directed=True)
+    graph.add_edges_from([(0, 1, 1.0), (2, 0, 1.0)])
+    assert Dijkstra[int]().shortest_path(graph, Vertex(0), Vertex(2)) is None
+
+
+def test_invalid_input(road_graph: Graph[str]) -> None:
+    """Test input validation and the negative weight check."""
+    dijkstra = Dijkstra[str]()
+    with pytest.raises(ValueError, match="Start vertex must be in the graph"):
+        dijkstra.search(road_graph, Vertex("z"))
+    with pytest.raises(ValueError, match="Target vertex must be in the graph"):
+        dijkstra.shortest_path(road_graph, Vertex("a"), Vertex("z"))
+    with pytest.raises(ValueError, match="Target vertex must be in the graph"):
+        dijkstra.search(road_graph, Vertex("a"), target=Vertex("z"))
+    road_graph.add_edges_from([("f", "g", -1.0)])
+    with pytest.raises(ValueError, match="non-negative"):
+        dijkstra.search(road_graph, Vertex("a"))
+
+
+def test_run_method(road_graph: Graph[str]) -> None:
+    """Test the run method and its input validation."""
+    dijkstra = Dijkstra[str]()
+    assert dijkstra.run((road_graph, Vertex("a"))).distance(Vertex("d")) == 20.0
+    with pytest.raises(TypeError, match="Expected a tuple"):
+        dijkstra.run(road_graph)
+    with pytest.raises(TypeError, match="must be a Graph"):
+        dijkstra.run(("graph", Vertex("a")))
+    with pytest.raises(TypeError, match="must be a Vertex"):
+        dijkstra.run((road_graph, "a"))
@@ -0,0 +1,176 @@
+import math
+from typing import Any, Dict, List, Optional
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algolib.algorithms.graph.shortest_path.floyd_warshall import (
+    AllPairsResult,
+    Backend,
+    FloydWarshall,
+)
+from algolib.data_structures.graph import Graph, Vertex
+
+
+@st.composite
+def random_digraph(draw: st.DrawFn) -> Graph[int]:
+    num_vertices = draw(st.integers(min_value=1, max_value=10))
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(num_vertices))
+    vertex_ids = st.integers(min_value=0, max_value=num_vertices - 1)
+    weights = st.integers(min_value=-3, max_value=20).map(float)
+    graph.add_edges_from(draw(st.lists(st.tuples(vertex_ids, vertex_ids, weights), max_size=30)))
+    return graph
+
+
+def bellman_ford(graph: Graph[int], source: int) -> Optional[Dict[int, float]]:
+    """Returns the distances from `source`, or None if a negative cycle is reachable."""
+    distances = {v.key: math.inf for v in graph}
+    distances[source] = 0.0
+    for _ in range(len(graph) + 1):
+        changed = False
+        for u in graph:
+            for v, weight in graph.neighbors(u):
+                if distances[u.key] + weight < distances[v.key]:
+                    distances[v.key] = distances[u.key] + weight
+                    changed = True
+        if not changed:
+            return distances
+    return None
+
+
+def path_cost(graph: Graph[int], path: List[Vertex[int]]) -> float:
+    return sum(
+        min(weight for neighbor, weight in graph.neighbors(a) if neighbor == b)
+        for a, b in zip(path, path[1:], strict=False)
+    )
+
+
+SOLVERS = [
+    pytest.param({"backend": "python"}, id="python"),
+    pytest.param({"backend": "numpy", "block_size": 3}, id="numpy"),
+]
+
+
+@pytest.mark.parametrize("options", SOLVERS)
+@given(graph=random_digraph())
+def test_floyd_warshall_property_matches_bellman_ford(
+    options: Dict[str, Any], graph: Graph[int]
+) -> None:
+    expected = [bellman_ford(graph, v.key) for v in graph]
+    if any(row is None for row in expected):
+        with pytest.raises(ValueError, match="negative cycle"):
+            FloydWarshall[int](**options).solve(graph)
+        return
+
+    result = FloydWarshall[int](next_hops=True, **options).solve(graph)
+    for u in graph:
+        row = expected[u.key]
+        assert row is not None
+        assert list(result.distances[u.key]) == [row[v.key] for v in graph]
+        for v in graph:
+            path = result.path(u, v)
+            if row[v.key] == math.inf:
+                assert path is None and result.distance(u, v) is None
+            else:
+                assert path is not None and path[0] == u and path[-1] == v
+                assert path_cost(graph, path) == result.distance(u, v)
+
+
+@pytest.fixture
+def road_graph() -> Graph[str]:
+    """Fixture for a small weighted undirected graph with a parallel edge."""
+    graph = Graph[str]()
+    graph.add_edges_from([
+        ("A", "B", 4.0),
+        ("A", "C", 1.0),
+        ("C", "B", 2.0),
+        ("B", "D", 5.0),
+        ("C", "D", 8.0),
+        ("A", "B", 3.5),
+    ])
+    graph.add_vertex("E")
+    return graph
+
+
+def test_matches_dijkstra(road_graph: Graph[str]) -> None:
+    """Test that every row equals the single-source distances."""
+    result = FloydWarshall[str]().solve(road_graph)
+    for v in road_graph:
+        assert (
+            result.distances[road_graph.vertex_id(v)]
+            == Dijkstra[str]().search(road_graph, v).distances
+        )
+    assert result.distance(Vertex("A"), Vertex("D")) == 8.0
+    assert result.distance(Vertex("A"), Vertex("E")) is None
+    assert result.next_hops is None
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_next_hops(road_graph: Graph[str], backend: Backend) -> None:
+    """Test path recovery through the next-hop matrix."""
+    result = FloydWarshall[str](next_hops=True, backend=backend).solve(road_graph)
+    assert result.path(Vertex("A"), Vertex("D")) == [
+        Vertex("A"),
+        Vertex("C"),
+        Vertex("B"),
+        Vertex("D"),
+    ]
+    assert result.path(Vertex("D"), Vertex("D")) == [Vertex("D")]
+    assert result.path(Vertex("E"), Vertex("A")) is None
+    with pytest.raises(ValueError, match="Next hops were not recorded"):
+        FloydWarshall[str]().solve(road_graph).path(Vertex("A"), Vertex("D"))
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_float32(road_graph: Graph[str], backend: Backend) -> None:
+    """Test that float32 rows take half the memory and keep the distances."""
+    exact = FloydWarshall[str](backend=backend).solve(road_graph)
+    compact = FloydWarshall[str](float32=True, backend=backend).solve(road_graph)
+    assert compact.distances[0].itemsize * 2 == exact.distances[0].itemsize
+    for fast, slow in zip(compact.distances, exact.distances, strict=True):
+        assert list(fast) == pytest.approx(list(slow))
+
+
+def test_negative_weights() -> None:
+    """Test negative edges without a cycle, and negative cycle detection."""
+    graph = Graph[int](directed=True)
+    graph.add_edges_from([(0, 1, 4.0), (0, 2, 5.0), (2, 1, -3.0)])
+    assert FloydWarshall[int]().solve(graph).distance(Vertex(0), Vertex(1)) == 2.0
+    graph.add_edges_from([(1, 2, 1.0)])
+    with pytest.raises(ValueError, match="negative cycle"):
+        FloydWarshall[int]().solve(graph)
+    loop = Graph[int](directed=True)
+    loop.add_edges_from([(0, 0, -1.0)])
+    with pytest.raises(ValueError, match="negative cycle"):
+        FloydWarshall[int]().solve(loop)
+
+
+def test_backends_agree() -> None:
+    """Test that the NumPy blocks and the Python rows give the same matrices."""
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(40))
+    graph.add_edges_from((i, (i * 7 + 3) % 40, float(i % 5 - 1)) for i in range(40))
+    graph.add_edges_from((i, (i + 1) % 40, 2.0) for i in range(40))
+    python = FloydWarshall[int](next_hops=True, backend="python").solve(graph)
+    for block_size in (1, 6, 16, 64):
+        blocked = FloydWarshall[int](backend="numpy", block_size=block_size).solve(graph)
+        assert blocked.distances == python.distances
+
+
+def test_backend_validation() -> None:
+    """Test the backend selection and its argument checks."""
+    assert FloydWarshall[int]().backend == "numpy"
+    with pytest.raises(ValueError, match="backend must be"):
+        FloydWarshall[int](backend="gpu")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="block_size must be positive"):
+        FloydWarshall[int](block_size=0)
+
+
+def test_run_method(road_graph: Graph[str]) -> None:
+    """Test the run method and its input validation."""
+    assert isinstance(FloydWarshall[str]().run(road_graph), AllPairsResult)
+    with pytest.raises(TypeError, match="Expected a Graph"):
+        FloydWarshall[str]().run((road_graph,))
@@ -1,3 +1,4 @@
+from array import array
 from typing import List, Set, Tuple
 
 import pytest
@@ -56,6 +57,43 @@ def test_bfs_property_traversal_properties(graph_and_start: Tuple[Graph[int], Ve
     assert set(traversal_result) == reachable
 
 
+@given(graph_and_start=random_graph_and_start_vertex())
+def test_bfs_property_search_distances_and_paths(
+    graph_and_start: Tuple[Graph[int], Vertex[int]],
+) -> None:
+    graph, start_vertex = graph_and_start
+    result = BFS[int]().search(graph, start_vertex)
+
+    assert result.visited == BFS[int]().traverse(graph, start_vertex)
+    for v in graph:
+        path = result.path_to(v)
+        if v not in result:
+            assert path is None and result.distance(v) is None
+            continue
+        # Paths start at the source, follow edges and have distance + 1 vertices.
+        distance = result.distance(v)
+        assert path is not None and distance is not None
+        assert path[0] == start_vertex and path[-1] == v
+        assert len(path) == distance + 1
+        for u, w in zip(path, path[1:], strict=False):
+            assert w in graph.get_neighbors(u)
+        # No neighbor of a reached vertex is more than one hop farther away.
+        for neighbor in graph.get_neighbors(v):
+            neighbor_distance = result.distance(neighbor)
+            assert neighbor_distance is not None and neighbor_distance <= distance + 1
+
+
+@given(graph_and_start=random_graph_and_start_vertex())
+def test_bfs_property_iter_traverse_matches_search(
+    graph_and_start: Tuple[Graph[int], Vertex[int]],
+) -> None:
+    graph, start_vertex = graph_and_start
+    result = BFS[int]().search(graph, start_vertex)
+    pairs = list(BFS[int]().iter_traverse(graph, start_vertex))
+    assert [v for v, _ in pairs] == result.visited
+    assert all(depth == result.distance(v) for v, depth in pairs)
+
+
 @pytest.fixture
 def graph() -> Graph[str]:
     """Fixture for a sample graph."""
@@ -180,3 +218,125 @@ def test_bfs_run_method(graph: Graph[str]) -> None:
         bfs.run(("not a graph", start_vertex))
     with pytest.raises(TypeError, match="Second element.*must be a Vertex"):
         bfs.run((graph, "not a vertex"))
+
+
+def test_bfs_search_distances_and_parents(graph: Graph[str]) -> None:
+    """Test that search records hop counts, parents and shortest paths."""
+    v0, v3, v7 = graph.get_vertex("0"), graph.get_vertex("3"), graph.get_vertex("7")
+    assert v0 and v3 and v7
+    result = BFS[str]().search(graph, v0)
+    assert result.target is None
+    assert [result.distance(v) for v in graph] == [0, 1, 1, 2, 2, 2, 2, 3]
+    assert result.parent(v0) is None
+    assert result.parent(v3) == graph.get_vertex("1")
+    assert [v.key for v in result.path_to(v7) or []] == ["0", "1", "3", "7"]
+    assert list(result.distances) == [0, 1, 1, 2, 2, 2, 2, 3]
+    assert result.parents[0] == -1
+
+
+def test_bfs_search_unreached_vertex(graph: Graph[str]) -> None:
+    """Test that vertices outside the component have no distance or path."""
+    v8 = graph.add_vertex("8")
+    v0 = graph.get_vertex("0")
+    assert v0
+    result = BFS[str]().search(graph, v0)
+    assert v8 not in result
+    assert Vertex("missing") not in result
+    assert result.distance(v8) is None
+    assert result.parent(v8) is None
+    assert result.path_to(v8) is None
+
+
+def test_bfs_search_on_reversed_view() -> None:
+    """Test that searching the reversed view walks in-edges to find ancestors."""
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([("a", "b"), ("b", "c"), ("x", "c"), ("c", "d")])
+    result = BFS[str]().search(graph.reversed(), Vertex("c"))
+    assert sorted(v.key for v in graph if v in result) == ["a", "b", "c", "x"]
+    assert result.distance(Vertex("a")) == 2
+    assert [v.key for v in result.path_to(Vertex("a")) or []] == ["c", "b", "a"]
+
+
+def test_bfs_search_max_depth(graph: Graph[str]) -> None:
+    """Test that max_depth bounds the explored radius."""
+    v0 = graph.get_vertex("0")
+    assert v0
+    assert [v.key for v in BFS[str]().search(graph, v0, max_depth=0).visited] == ["0"]
+    shallow = BFS[str]().search(graph, v0, max_depth=1)
+    assert {v.key for v in shallow.visited} == {"0", "1", "2"}
+    assert shallow.distance(Vertex("3")) is None
+
+
+def test_bfs_search_stops_at_target(graph: Graph[str]) -> None:
+    """Test that the search stops as soon as a target is discovered."""
+    v0 = graph.get_vertex("0")
+    assert v0
+    result = BFS[str]().search(graph, v0, targets=[Vertex("2"), Vertex("7")])
+    assert result.target == Vertex("2")
+    assert [v.key for v in result.visited] == ["0", "1", "2"]
+    assert result.distance(Vertex("3")) is None
+
+    at_source = BFS[str]().search(graph, v0, targets=[v0])
+    assert at_source.target == v0
+    assert at_source.visited == [v0]
+
+
+def test_bfs_search_multi_source(graph: Graph[str]) -> None:
+    """Test that several sources all start at distance zero."""
+    sources = [Vertex("3"), Vertex("6"), Vertex("3")]
+    result = BFS[str]().search(graph, sources)
+    assert result.distance(Vertex("3")) == 0
+    assert result.distance(Vertex("6")) == 0
+    assert result.distance(Vertex("7")) == 1
+    assert result.distance(Vertex("0")) == 2
+    path = result.path_to(Vertex("0"))
+    assert path is not None and path[0] in sources and len(path) == 3
+
+
+def test_bfs_search_invalid_sources(graph: Graph[str]) -> None:
+    """Test that search validates its sources."""
+    with pytest.raises(ValueError, match="Start vertex must be in the graph"):
+        BFS[str]().search(graph, Vertex("missing"))
+    with pytest.raises(ValueError, match="At least one start vertex"):
+        BFS[str]().search(graph, [])
+
+
+def test_bfs_iter_traverse_yields_depths(graph: Graph[str]) -> None:
+    """Test that iter_traverse yields each vertex with its hop count."""
+    v0 = graph.get_vertex("0")
+    assert v0
+    pairs = [(v.key, depth) for v, depth in BFS[str]().iter_traverse(graph, v0)]
+    assert pairs[0] == ("0", 0)
+    assert sorted(pairs) == [
+        ("0", 0),
+        ("1", 1),
+        ("2", 1),
+        ("3", 2),
+        ("4", 2),
+        ("5", 2),
+        ("6", 2),
+        ("7", 3),
+    ]
+
+
+def test_bfs_iter_traverse_is_lazy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that abandoning the iterator leaves the rest of the graph unscanned."""
+    graph = Graph[int](directed=True)
+    graph.add_edges_from((i, i + 1) for i in range(1_000))
+    scanned: List[int] = []
+    neighbor_ids = Graph.neighbor_ids
+
+    def spy(self: Graph[int], index: int) -> "array[int]":
+        scanned.append(index)
+        return neighbor_ids(self, index)
+
+    monkeypatch.setattr(Graph, "neighbor_ids", spy)
+    iterator = BFS[int]().iter_traverse(graph, Vertex(0))
+    assert [next(iterator) for _ in range(3)] == [(Vertex(0), 0), (Vertex(1), 1), (Vertex(2), 2)]
+    assert scanned == [0, 1]
+
+
+def test_bfs_iter_traverse_start_not_in_graph(graph: Graph[str]) -> None:
+    """Test that an invalid start vertex is rejected before iteration begins."""
+    with pytest.raises(ValueError, match="Start vertex must be in the graph"):
+        BFS[str]().iter_traverse(graph, Vertex("missing"))
@@ -0,0 +1,108 @@
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.algorithms.graph.traversal.bidirectional import BidirectionalBFS
+from algolib.data_structures.graph import Graph, Vertex
+
+
+@st.composite
+def random_graph_and_endpoints(
+    draw: st.DrawFn,
+) -> Tuple[Graph[int], Vertex[int], Vertex[int]]:
+    num_vertices = draw(st.integers(min_value=1, max_value=15))
+    graph = Graph[int](directed=draw(st.booleans()))
+    graph.add_vertices_from(range(num_vertices))
+    vertex_ids = st.integers(min_value=0, max_value=num_vertices - 1)
+    graph.add_edges_from(draw(st.lists(st.tuples(vertex_ids, vertex_ids), max_size=30)))
+    return graph, Vertex(draw(vertex_ids)), Vertex(draw(vertex_ids))
+
+
+@given(graph_and_endpoints=random_graph_and_endpoints())
+def test_bidirectional_property_matches_bfs(
+    graph_and_endpoints: Tuple[Graph[int], Vertex[int], Vertex[int]],
+) -> None:
+    graph, source, target = graph_and_endpoints
+    expected = BFS[int]().search(graph, source).distance(target)
+    path = BidirectionalBFS[int]().shortest_path(graph, source, target)
+
+    if expected is None:
+        assert path is None
+        return
+    assert path is not None
+    assert len(path) == expected + 1
+    assert path[0] == source and path[-1] == target
+    for u, v in zip(path, path[1:], strict=False):
+        assert v in graph.get_neighbors(u)
+
+
+@pytest.fixture
+def grid() -> Graph[Tuple[int, int]]:
+    """Fixture for an undirected 20x20 grid graph."""
+    graph = Graph[Tuple[int, int]]()
+    for x in range(20):
+        for y in range(20):
+            if x + 1 < 20:
+                graph.add_edges_from([((x, y), (x + 1, y))])
+            if y + 1 < 20:
+                graph.add_edges_from([((x, y), (x, y + 1))])
+    return graph
+
+
+def test_shortest_path_on_grid(grid: Graph[Tuple[int, int]]) -> None:
+    """Test the hop count and path endpoints on a grid."""
+    bfs = BidirectionalBFS[Tuple[int, int]]()
+    path = bfs.shortest_path(grid, Vertex((0, 0)), Vertex((5, 7)))
+    assert path is not None
+    assert path[0] == Vertex((0, 0)) and path[-1] == Vertex((5, 7))
+    assert bfs.distance(grid, Vertex((0, 0)), Vertex((5, 7))) == 12
+
+
+def test_visits_fewer_vertices_than_one_sided_bfs(grid: Graph[Tuple[int, int]]) -> None:
+    """Test that meeting in the middle touches less of the graph."""
+    bfs = BidirectionalBFS[Tuple[int, int]]()
+    bfs.shortest_path(grid, Vertex((8, 8)), Vertex((11, 11)))
+    one_sided = BFS[Tuple[int, int]]().search(grid, Vertex((8, 8)), targets=[Vertex((11, 11))])
+    assert 0 < bfs.visited < len(one_sided.order)
+
+
+def test_directed_graph_uses_reverse_edges() -> None:
+    """Test that the backward search follows edges against their direction."""
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([("a", "b"), ("b", "c"), ("c", "d"), ("d", "a"), ("x", "d")])
+    bfs = BidirectionalBFS[str]()
+    assert [v.key for v in bfs.shortest_path(graph, Vertex("a"), Vertex("d")) or []] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+    assert bfs.distance(graph, Vertex("d"), Vertex("c")) == 3
+    assert bfs.shortest_path(graph, Vertex("a"), Vertex("x")) is None
+
+    frozen = graph.freeze()
+    assert bfs.distance(frozen, Vertex("d"), Vertex("c"), reverse=frozen.reverse()) == 3
+
+
+def test_same_source_and_target(grid: Graph[Tuple[int, int]]) -> None:
+    """Test that a vertex is at distance zero from itself."""
+    bfs = BidirectionalBFS[Tuple[int, int]]()
+    assert bfs.shortest_path(grid, Vertex((3, 3)), Vertex((3, 3))) == [Vertex((3, 3))]
+    assert bfs.visited == 1
+
+
+def test_run_method(grid: Graph[Tuple[int, int]]) -> None:
+    """Test the run method and its input validation."""
+    bfs = BidirectionalBFS[Tuple[int, int]]()
+    assert len(bfs.run((grid, Vertex((0, 0)), Vertex((0, 3))))) == 4
+    with pytest.raises(TypeError, match="Expected a tuple"):
+        bfs.run((grid, Vertex((0, 0))))
+    with pytest.raises(TypeError, match="must be a Graph"):
+        bfs.run(("grid", Vertex((0, 0)), Vertex((0, 3))))
+    with pytest.raises(TypeError, match="must be Vertex objects"):
+        bfs.run((grid, (0, 0), Vertex((0, 3))))
+    with pytest.raises(ValueError, match="must be in the graph"):
+        bfs.shortest_path(grid, Vertex((0, 0)), Vertex((99, 99)))
@@ -0,0 +1,117 @@
+import sys
+from array import array
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.traversal.dfs import DFS
+from algolib.data_structures.graph import Graph, Vertex
+
+
+@st.composite
+def random_graph(draw: st.DrawFn) -> Graph[int]:
+    num_vertices = draw(st.integers(min_value=1, max_value=15))
+    graph = Graph[int](directed=draw(st.booleans()))
+    graph.add_vertices_from(range(num_vertices))
+    vertex_ids = st.integers(min_value=0, max_value=num_vertices - 1)
+    graph.add_edges_from(draw(st.lists(st.tuples(vertex_ids, vertex_ids), max_size=30)))
+    return graph
+
+
+def recursive_dfs(graph: Graph[int]) -> Tuple[List[int], List[int]]:
+    """The textbook recursive formulation, for comparison on small graphs."""
+    seen = set()
+    pre: List[int] = []
+    post: List[int] = []
+
+    def visit(v: int) -> None:
+        seen.add(v)
+        pre.append(v)
+        for w in graph.neighbor_ids(v):
+            if w not in seen:
+                visit(w)
+        post.append(v)
+
+    for v in range(len(graph)):
+        if v not in seen:
+            visit(v)
+    return pre, post
+
+
+@given(graph=random_graph())
+def test_dfs_property_matches_recursive(graph: Graph[int]) -> None:
+    result = DFS[int]().search(graph)
+    pre, post = recursive_dfs(graph)
+    assert list(result.preorder) == pre
+    assert list(result.postorder) == post
+
+    times = sorted([*result.discovery, *result.finish])
+    assert times == list(range(2 * len(graph)))
+    for v in graph:
+        parent = result.parent(v)
+        if parent is not None:
+            assert v in graph.get_neighbors(parent)
+            assert result.is_ancestor(parent, v) and not result.is_ancestor(v, parent)
+
+
+@pytest.fixture
+def sample_graph() -> Graph[str]:
+    """Fixture for a small directed graph with an unreachable vertex."""
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "A")])
+    graph.add_vertex("E")
+    return graph
+
+
+def test_search_from_source(sample_graph: Graph[str]) -> None:
+    """Test orders, times and parents from one source."""
+    result = DFS[str]().search(sample_graph, Vertex("A"))
+    assert [v.key for v in result.visited] == ["A", "B", "D", "C"]
+    assert [v.key for v in result.finished] == ["D", "B", "C", "A"]
+    assert result.discovery == array("i", [0, 1, 5, 2, -1])
+    assert result.finish == array("i", [7, 4, 6, 3, -1])
+    assert result.parent(Vertex("D")) == Vertex("B")
+    assert result.parent(Vertex("A")) is None
+    assert Vertex("E") not in result and Vertex("Z") not in result
+    assert not result.is_ancestor(Vertex("E"), Vertex("A"))
+
+
+def test_search_whole_graph(sample_graph: Graph[str]) -> None:
+    """Test that the default search covers every vertex as a forest."""
+    result = DFS[str]().search(sample_graph)
+    assert [v.key for v in result.visited] == ["A", "B", "D", "C", "E"]
+    assert result.parent(Vertex("E")) is None
+    assert result.discovery[4] == 8
+
+
+def test_deep_chain_does_not_recurse() -> None:
+    """Test a path far longer than the recursion limit."""
+    n = sys.getrecursionlimit() * 20
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from_arrays(array("i", range(n - 1)), array("i", range(1, n)))
+    result = DFS[int]().search(graph, Vertex(0))
+    assert list(result.preorder) == list(range(n))
+    assert list(result.postorder) == list(range(n - 1, -1, -1))
+
+
+def test_traverse_and_run(sample_graph: Graph[str]) -> None:
+    """Test traverse, run and input validation."""
+    dfs = DFS[str]()
+    assert dfs.traverse(sample_graph, Vertex("C")) == [
+        Vertex("C"),
+        Vertex("D"),
+        Vertex("A"),
+        Vertex("B"),
+    ]
+    assert dfs.run((sample_graph, Vertex("E"))) == [Vertex("E")]
+    with pytest.raises(ValueError, match="must be in the graph"):
+        dfs.traverse(sample_graph, Vertex("Z"))
+    with pytest.raises(TypeError, match="Expected a tuple"):
+        dfs.run(sample_graph)
+    with pytest.raises(TypeError, match="must be a Graph"):
+        dfs.run(("graph", Vertex("A")))
+    with pytest.raises(TypeError, match="must be a Vertex"):
+        dfs.run((sample_graph, "A"))
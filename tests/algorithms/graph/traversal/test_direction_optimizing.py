@@ -0,0 +1,105 @@
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.algorithms.graph.traversal.direction_optimizing import DirectionOptimizingBFS
+from algolib.data_structures.csr_graph import CSRGraph
+from algolib.data_structures.graph import Graph, Vertex
+
+
+@st.composite
+def random_csr_graph_and_sources(
+    draw: st.DrawFn,
+) -> Tuple[CSRGraph[int], List[Vertex[int]]]:
+    num_vertices = draw(st.integers(min_value=1, max_value=15))
+    graph = Graph[int](directed=draw(st.booleans()))
+    graph.add_vertices_from(range(num_vertices))
+    vertex_ids = st.integers(min_value=0, max_value=num_vertices - 1)
+    graph.add_edges_from(draw(st.lists(st.tuples(vertex_ids, vertex_ids), max_size=40)))
+    sources = draw(st.lists(vertex_ids, min_size=1, max_size=3))
+    return graph.freeze(), [Vertex(key) for key in sources]
+
+
+@given(
+    graph_and_sources=random_csr_graph_and_sources(),
+    alpha=st.sampled_from([0.01, 15.0, 1e9]),
+    beta=st.sampled_from([0.01, 1.0, 18.0]),
+)
+def test_direction_optimizing_property_matches_bfs(
+    graph_and_sources: Tuple[CSRGraph[int], List[Vertex[int]]], alpha: float, beta: float
+) -> None:
+    graph, sources = graph_and_sources
+    expected = BFS[int]().search(graph, sources)
+    result = DirectionOptimizingBFS[int](alpha, beta).search(graph, sources)
+
+    assert result.distances == expected.distances
+    assert sorted(result.order) == sorted(expected.order)
+    for v in graph:
+        # Any valid BFS tree is acceptable: the parent must be an in-neighbor one
+        # level closer to a source.
+        parent = result.parent(v)
+        distance = result.distance(v)
+        if parent is not None and distance is not None:
+            assert v in graph.get_neighbors(parent)
+            assert result.distance(parent) == distance - 1
+
+
+@pytest.fixture
+def star() -> CSRGraph[int]:
+    """Fixture for a hub with many leaves, each leaf also linked to the next."""
+    graph = Graph[int]()
+    graph.add_edges_from((0, leaf) for leaf in range(1, 101))
+    graph.add_edges_from((leaf, leaf + 1) for leaf in range(1, 100))
+    return graph.freeze()
+
+
+def test_switches_to_bottom_up_on_large_frontier(star: CSRGraph[int]) -> None:
+    """Test that a frontier touching most edges is expanded bottom-up."""
+    bfs = DirectionOptimizingBFS[int]()
+    result = bfs.search(star, Vertex(1))
+    assert bfs.directions[0] == "top-down"
+    assert "bottom-up" in bfs.directions
+    assert result.distances == BFS[int]().search(star, Vertex(1)).distances
+
+
+def test_top_down_only_with_tiny_alpha(star: CSRGraph[int]) -> None:
+    """Test that a tiny alpha keeps levels with unvisited edges top-down."""
+    bfs = DirectionOptimizingBFS[int](alpha=1e-9)
+    result = bfs.search(star, Vertex(1))
+    assert bfs.directions[:2] == ["top-down", "top-down"]
+    assert len(result.order) == 101
+
+
+def test_reuses_given_reverse_graph() -> None:
+    """Test searching a directed graph with a prebuilt reverse graph."""
+    graph = Graph[int](directed=True)
+    graph.add_edges_from([(0, 1), (0, 2), (1, 3), (2, 3), (3, 0), (4, 0)])
+    frozen = graph.freeze()
+    bfs = DirectionOptimizingBFS[int](alpha=1e9, beta=1e9)
+    result = bfs.search(frozen, Vertex(0), reverse=frozen.reverse())
+    assert [result.distance(Vertex(k)) for k in range(5)] == [0, 1, 1, 2, None]
+    assert bfs.directions == ["bottom-up"] * 3
+
+
+def test_traverse_and_run(star: CSRGraph[int]) -> None:
+    """Test the list-returning traversal and run's input validation."""
+    bfs = DirectionOptimizingBFS[int]()
+    assert bfs.traverse(star, Vertex(0))[0] == Vertex(0)
+    assert len(bfs.run((star, Vertex(0)))) == 101
+    with pytest.raises(TypeError, match="Expected a tuple"):
+        bfs.run("not a tuple")
+    with pytest.raises(TypeError, match="must be a CSRGraph"):
+        bfs.run((Graph[int](), Vertex(0)))
+    with pytest.raises(TypeError, match="must be a Vertex"):
+        bfs.run((star, 0))
+    with pytest.raises(ValueError, match="Start vertex must be in the graph"):
+        bfs.search(star, Vertex(1_000))
+
+
+def test_invalid_thresholds() -> None:
+    """Test that non-positive thresholds are rejected."""
+    with pytest.raises(ValueError, match="must be positive"):
+        DirectionOptimizingBFS[int](alpha=0)
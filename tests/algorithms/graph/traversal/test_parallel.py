@@ -0,0 +1,106 @@
+import random
+import time
+
+import pytest
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.algorithms.graph.traversal.parallel import LevelStats, ParallelBFS
+from algolib.data_structures.csr_graph import CSRGraph
+from algolib.data_structures.graph import Graph, Vertex
+
+
+@pytest.fixture(params=[False, True], ids=["undirected", "directed"])
+def random_graph(request: pytest.FixtureRequest) -> CSRGraph[int]:
+    """Fixture for a random sparse graph with a few unreachable vertices."""
+    rng = random.Random(7)
+    graph = Graph[int](directed=request.param)
+    graph.add_vertices_from(range(600))
+    graph.add_edges_from((rng.randrange(550), rng.randrange(550)) for _ in range(1_500))
+    return graph.freeze()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matches_sequential_bfs(random_graph: CSRGraph[int], workers: int) -> None:
+    """Test distances, reached set and parents against the sequential search."""
+    bfs = ParallelBFS[int](workers=workers, min_parallel_frontier=1)
+    result = bfs.search(random_graph, [Vertex(0), Vertex(1)])
+    expected = BFS[int]().search(random_graph, [Vertex(0), Vertex(1)])
+
+    assert result.distances == expected.distances
+    assert sorted(result.order) == sorted(expected.order)
+    for v in range(len(random_graph)):
+        parent = result.parents[v]
+        if result.distances[v] > 0:
+            assert v in random_graph.neighbor_ids(parent)
+            assert result.distances[parent] == result.distances[v] - 1
+        else:
+            assert parent == -1
+
+
+def test_level_stats(random_graph: CSRGraph[int]) -> None:
+    """Test that every level is timed and sizes add up to the reached set."""
+    bfs = ParallelBFS[int](workers=2, min_parallel_frontier=50)
+    result = bfs.search(random_graph, Vertex(0))
+    assert [level.depth for level in bfs.levels] == list(range(1, len(bfs.levels) + 1))
+    assert bfs.levels[0] == LevelStats(1, 1, bfs.levels[0].discovered, bfs.levels[0].seconds, False)
+    assert any(level.parallel for level in bfs.levels)
+    assert 1 + sum(level.discovered for level in bfs.levels) == len(result.order)
+    assert bfs.levels[-1].discovered == 0
+    assert all(level.seconds >= 0 for level in bfs.levels)
+
+
+def path_graph(n: int) -> CSRGraph[int]:
+    graph = Graph[int](directed=True)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from((i, i + 1) for i in range(n - 1))
+    return graph.freeze()
+
+
+def test_long_path_levels_cost_their_frontier() -> None:
+    """Test that a level costs time in its frontier, not in the whole graph.
+
+    Scanning every vertex per level made this path take tens of seconds.
+    """
+    n = 30_000
+    bfs = ParallelBFS[int](workers=2)
+    start = time.perf_counter()
+    result = bfs.search(path_graph(n), Vertex(0))
+    assert time.perf_counter() - start < 5.0
+    assert list(result.distances) == list(range(n))
+    assert list(result.parents) == list(range(-1, n - 1))
+    assert len(bfs.levels) == n
+
+
+def test_long_path_across_the_pool() -> None:
+    """Test that levels merged from worker results clear the next-frontier map."""
+    n = 300
+    bfs = ParallelBFS[int](workers=2, min_parallel_frontier=1)
+    result = bfs.search(path_graph(n), Vertex(0))
+    assert list(result.distances) == list(range(n))
+    assert list(result.order) == list(range(n))
+    assert all(level.parallel for level in bfs.levels)
+
+
+def test_traverse_and_run() -> None:
+    """Test the list-returning traversal and run's input validation."""
+    graph = Graph[str]()
+    graph.add_edges_from([("a", "b"), ("b", "c"), ("a", "d")])
+    frozen = graph.freeze()
+    bfs = ParallelBFS[str](workers=1)
+    assert [v.key for v in bfs.traverse(frozen, Vertex("a"))] == ["a", "b", "d", "c"]
+    assert len(bfs.run((frozen, Vertex("c")))) == 4
+    with pytest.raises(TypeError, match="Expected a tuple"):
+        bfs.run(frozen)
+    with pytest.raises(TypeError, match="must be a CSRGraph"):
+        bfs.run((graph, Vertex("a")))
+    with pytest.raises(TypeError, match="must be a Vertex"):
+        bfs.run((frozen, "a"))
+    with pytest.raises(ValueError, match="Start vertex must be in the graph"):
+        bfs.search(frozen, Vertex("z"))
+
+
+def test_invalid_worker_count() -> None:
+    """Test that a non-positive worker count is rejected."""
+    with pytest.raises(ValueError, match="at least 1"):
+        ParallelBFS[int](workers=0)
+    assert ParallelBFS[int]().workers >= 1
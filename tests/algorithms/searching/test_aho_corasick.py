@@ -0,0 +1,96 @@
+"""Tests for the Aho-Corasick multi-pattern scanner."""
+
+import pickle
+from typing import List, Set, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.searching.aho_corasick import AhoCorasick
+
+small_alphabet = st.binary(max_size=40).map(lambda b: bytes(x % 3 for x in b))
+
+
+def naive_scan(text: bytes, patterns: List[bytes]) -> Set[Tuple[int, int]]:
+    return {
+        (i, pid)
+        for pid, pattern in enumerate(patterns)
+        for i in range(len(text) - len(pattern) + 1)
+        if text[i : i + len(pattern)] == pattern
+    }
+
+
+@given(
+    text=small_alphabet,
+    patterns=st.lists(small_alphabet.filter(bool), min_size=1, max_size=8),
+    cuts=st.lists(st.integers(min_value=0, max_value=40)),
+)
+def test_scan_chunks_matches_naive(text: bytes, patterns: List[bytes], cuts: List[int]) -> None:
+    automaton = AhoCorasick(patterns)
+    bounds = [0, *sorted(min(c, len(text)) for c in cuts), len(text)]
+    chunks = [text[a:b] for a, b in zip(bounds, bounds[1:], strict=False)]
+
+    found = list(automaton.scan_chunks(chunks))
+    assert len(found) == len(set(found))
+    assert set(found) == naive_scan(text, patterns)
+    ends = [offset + len(patterns[pid]) for offset, pid in found]
+    assert ends == sorted(ends)
+
+
+def test_classic_example() -> None:
+    """Test the textbook he/she/his/hers example."""
+    automaton = AhoCorasick([b"he", b"she", b"his", b"hers"])
+    assert sorted(automaton.scan(b"ushers")) == [(1, 1), (2, 0), (2, 3)]
+
+
+def test_duplicate_patterns_report_every_id() -> None:
+    """Test that identical patterns each report their own id."""
+    automaton = AhoCorasick([b"ab", b"ab", b"b"])
+    assert sorted(automaton.scan(b"xab")) == [(1, 0), (1, 1), (2, 2)]
+
+
+def test_match_across_chunk_boundary() -> None:
+    """Test that a match split over several chunks is reported once."""
+    automaton = AhoCorasick([b"needle"])
+    assert list(automaton.scan_chunks([b"hay ne", b"e", b"dle hay"])) == [(4, 0)]
+
+
+def test_scan_is_lazy() -> None:
+    """Test that matches are yielded as they are found."""
+    matches = AhoCorasick([b"a"]).scan(b"a" * 10_000)
+    assert next(matches) == (0, 0)
+    assert next(matches) == (1, 0)
+
+
+def test_memoryview_input() -> None:
+    """Test scanning a memoryview slice."""
+    automaton = AhoCorasick([b"cd"])
+    assert list(automaton.scan(memoryview(b"abcdcd")[1:])) == [(1, 0), (3, 0)]
+
+
+def test_pickle_round_trip() -> None:
+    """Test that a built automaton survives pickling."""
+    automaton = AhoCorasick([b"foo", b"bar", b"oba"])
+    clone = pickle.loads(pickle.dumps(automaton))
+    assert clone.states == automaton.states
+    assert list(clone.scan(b"foobar")) == list(automaton.scan(b"foobar"))
+
+
+def test_empty_pattern_rejected() -> None:
+    """Test that empty patterns raise ValueError."""
+    with pytest.raises(ValueError, match="patterns must not be empty"):
+        AhoCorasick([b"ok", b""])
+
+
+def test_no_patterns() -> None:
+    """Test that an automaton without patterns never matches."""
+    assert list(AhoCorasick([]).scan(b"anything")) == []
+
+
+def test_run_method() -> None:
+    """Test the run method and its input validation."""
+    automaton = AhoCorasick([b"ab"])
+    assert automaton.run(b"abab") == [(0, 0), (2, 0)]
+    with pytest.raises(TypeError, match="bytes-like buffer"):
+        automaton.run("abab")
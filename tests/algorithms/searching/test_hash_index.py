@@ -0,0 +1,183 @@
+"""Tests for the hash index search algorithm."""
+
+from typing import List
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.searching.hash_index import HashIndexSearcher, VersionedList
+
+
+@given(st.lists(st.integers(min_value=0, max_value=20)), st.integers(0, 20))
+def test_hash_index_matches_first_occurrence(data: List[int], target: int) -> None:
+    searcher = HashIndexSearcher[int]()
+    expected = data.index(target) if target in data else None
+    assert searcher.search(data, target) == expected
+
+
+@given(
+    st.lists(st.integers(min_value=0, max_value=5), min_size=1),
+    st.lists(st.tuples(st.integers(min_value=0), st.integers(min_value=0, max_value=5))),
+)
+def test_notify_set_keeps_index_exact(data: List[int], updates: List[tuple[int, int]]) -> None:
+    searcher = HashIndexSearcher[int]()
+    searcher.build(data)
+    for position, value in updates:
+        position %= len(data)
+        old = data[position]
+        data[position] = value
+        searcher.notify_set(position, old)
+    for target in range(6):
+        expected = data.index(target) if target in data else None
+        assert searcher.search(data, target) == expected
+
+
+@pytest.fixture
+def searcher() -> HashIndexSearcher[int]:
+    """Fixture for a HashIndexSearcher instance."""
+    return HashIndexSearcher()
+
+
+def test_search_empty_list(searcher: HashIndexSearcher[int]) -> None:
+    """Test searching in an empty list."""
+    assert searcher.search([], 5) is None
+
+
+def test_search_with_duplicates(searcher: HashIndexSearcher[int]) -> None:
+    """Test that the first occurrence of a duplicate is returned."""
+    assert searcher.search([1, 2, 3, 2, 1], 2) == 1
+
+
+def test_index_is_reused_between_searches(searcher: HashIndexSearcher[int]) -> None:
+    """Test that repeated searches on the same data do not rebuild the index."""
+    data = [5, 4, 3]
+    searcher.search(data, 5)
+    stats = searcher.stats
+    assert searcher.search(data, 3) == 2
+    assert searcher.stats is stats
+
+
+def test_rebuilds_for_different_sequence(searcher: HashIndexSearcher[int]) -> None:
+    """Test that searching a different sequence rebuilds the index."""
+    assert searcher.search([1, 2, 3], 3) == 2
+    assert searcher.search([3, 2, 1], 3) == 0
+
+
+def test_rebuilds_when_length_changes(searcher: HashIndexSearcher[int]) -> None:
+    """Test that an unreported append is detected through the length check."""
+    data = [1, 2]
+    assert searcher.search(data, 3) is None
+    data.append(3)
+    assert searcher.search(data, 3) == 2
+
+
+def test_notify_append(searcher: HashIndexSearcher[int]) -> None:
+    """Test incremental updates after appends."""
+    data = [1, 2]
+    stats = searcher.build(data)
+    data.append(2)
+    searcher.notify_append(2)
+    data.append(7)
+    searcher.notify_append(7)
+    assert searcher.search(data, 2) == 1
+    assert searcher.search(data, 7) == 3
+    assert searcher.stats is stats
+
+
+def test_notify_set_moves_first_occurrence(searcher: HashIndexSearcher[int]) -> None:
+    """Test that overwriting a first occurrence falls back to the next one."""
+    data = [4, 1, 4, 4]
+    searcher.build(data)
+    data[0] = 9
+    searcher.notify_set(0, 4)
+    assert searcher.search(data, 4) == 2
+    assert searcher.search(data, 9) == 0
+
+
+def test_notify_set_out_of_range(searcher: HashIndexSearcher[int]) -> None:
+    """Test that notify_set rejects positions outside the indexed data."""
+    searcher.build([1, 2, 3])
+    with pytest.raises(IndexError):
+        searcher.notify_set(3, 1)
+
+
+def test_notifications_before_build_are_ignored(searcher: HashIndexSearcher[int]) -> None:
+    """Test that hooks are no-ops until an index has been built."""
+    searcher.notify_append(1)
+    searcher.notify_set(0, 1)
+    assert searcher.search([1], 1) == 0
+
+
+def test_invalidate_forces_rebuild(searcher: HashIndexSearcher[int]) -> None:
+    """Test that invalidate picks up unreported in-place assignments."""
+    data = [1, 2, 3]
+    assert searcher.search(data, 3) == 2
+    data[0] = 3
+    searcher.invalidate()
+    assert searcher.search(data, 3) == 0
+
+
+def test_versioned_list_triggers_rebuild(searcher: HashIndexSearcher[int]) -> None:
+    """Test that in-place changes to a VersionedList are detected automatically."""
+    data = VersionedList([1, 2, 3])
+    assert searcher.search(data, 3) == 2
+    data[0] = 3
+    assert searcher.search(data, 3) == 0
+    del data[0]
+    assert searcher.search(data, 3) == 1
+    data.insert(0, 8)
+    assert searcher.search(data, 8) == 0
+
+
+def test_versioned_list_with_notify_skips_rebuild(searcher: HashIndexSearcher[int]) -> None:
+    """Test that hooks keep a VersionedList index current without a rebuild."""
+    data = VersionedList([1, 2, 3])
+    stats = searcher.build(data)
+    data.append(4)
+    searcher.notify_append(4)
+    data[0] = 5
+    searcher.notify_set(0, 1)
+    assert searcher.search(data, 4) == 3
+    assert searcher.search(data, 5) == 0
+    assert searcher.search(data, 1) is None
+    assert searcher.stats is stats
+
+
+def test_versioned_list_unreported_mutation_between_hooks(
+    searcher: HashIndexSearcher[int],
+) -> None:
+    """Test that a mutation skipped by the hooks still forces a rebuild."""
+    data = VersionedList([1, 2, 3])
+    stats = searcher.build(data)
+    data[0] = 9
+    data.append(4)
+    searcher.notify_append(4)
+    assert searcher.search(data, 9) == 0
+    assert searcher.search(data, 1) is None
+    assert searcher.stats is not stats
+
+
+def test_versioned_list_behaves_like_list() -> None:
+    """Test the sequence protocol of VersionedList."""
+    data = VersionedList([3, 1, 2])
+    assert len(data) == 3
+    assert data[1:] == [1, 2]
+    data[0:2] = [7, 8]
+    assert list(data) == [7, 8, 2]
+    assert data.version == 1
+    assert repr(data) == "VersionedList([7, 8, 2], version=1)"
+
+
+def test_build_reports_stats(searcher: HashIndexSearcher[int]) -> None:
+    """Test that build reports size, time and memory."""
+    stats = searcher.build([1, 1, 2, 3])
+    assert stats.size == 3
+    assert stats.build_seconds >= 0
+    assert stats.memory_bytes > 0
+    assert searcher.stats == stats
+
+
+def test_run_method(searcher: HashIndexSearcher[int]) -> None:
+    """Test the run method of the searcher."""
+    assert searcher.run(([9, 8, 7], 7)) == 2
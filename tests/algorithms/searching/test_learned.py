@@ -0,0 +1,131 @@
+"""Tests for the learned index search algorithm."""
+
+from array import array
+from pathlib import Path
+from typing import List
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.searching.learned import LearnedIndexSearcher
+
+
+@given(
+    st.lists(st.integers(min_value=-1000, max_value=1000)),
+    st.integers(min_value=-1100, max_value=1100),
+    st.integers(min_value=0, max_value=8),
+)
+def test_learned_index_matches_first_occurrence(data: List[int], target: int, epsilon: int) -> None:
+    data.sort()
+    searcher = LearnedIndexSearcher(epsilon)
+    expected = data.index(target) if target in data else None
+    assert searcher.search(data, target) == expected
+
+
+@pytest.fixture
+def keys() -> "array[int]":
+    """Sorted keys with irregular gaps and a long run of duplicates."""
+    values = [i * i for i in range(2000)] + [4_000_000] * 100 + list(range(4_000_001, 4_003_000))
+    return array("q", values)
+
+
+def test_search_every_key(keys: "array[int]") -> None:
+    """Test that every key resolves to its first occurrence."""
+    searcher = LearnedIndexSearcher(epsilon=4)
+    for target in set(keys):
+        assert searcher.search(keys, target) == keys.index(target)
+    assert searcher.search(keys, 3) is None
+    assert searcher.search(keys, -1) is None
+    assert searcher.search(keys, 10**9) is None
+
+
+def test_model_is_compact(keys: "array[int]") -> None:
+    """Test that the model is much smaller than the keys it indexes."""
+    searcher = LearnedIndexSearcher(epsilon=32)
+    searcher.fit(keys)
+    assert 0 < searcher.segments < len(keys) // 20
+    assert searcher.size_bytes == searcher.segments * 24
+
+
+def test_empty_sequence() -> None:
+    """Test searching an empty sequence."""
+    searcher = LearnedIndexSearcher()
+    assert searcher.search([], 1) is None
+    assert searcher.segments == 0
+
+
+def test_refits_for_new_sequence() -> None:
+    """Test that a different sequence triggers a refit."""
+    searcher = LearnedIndexSearcher()
+    assert searcher.search([1, 2, 3], 3) == 2
+    assert searcher.search([3, 4, 5, 6], 3) == 0
+
+
+def test_refits_when_sequence_grows() -> None:
+    """Test that the same list refits after it is extended or truncated."""
+    searcher = LearnedIndexSearcher(epsilon=0)
+    data = [1, 2, 3]
+    assert searcher.search(data, 3) == 2
+    data.extend([4, 5, 6])
+    assert searcher.search(data, 6) == 5
+    del data[4:]
+    assert searcher.search(data, 5) is None
+    assert searcher.search(data, 4) == 3
+
+
+def test_unsorted_keys_rejected() -> None:
+    """Test that fitting unsorted keys raises ValueError."""
+    with pytest.raises(ValueError, match="Keys must be sorted"):
+        LearnedIndexSearcher().fit([1, 3, 2])
+
+
+def test_negative_epsilon_rejected() -> None:
+    """Test that a negative epsilon raises ValueError."""
+    with pytest.raises(ValueError, match="epsilon must be non-negative"):
+        LearnedIndexSearcher(-1)
+
+
+def test_save_and_load(tmp_path: Path, keys: "array[int]") -> None:
+    """Test that a saved model can be loaded and reused without refitting."""
+    searcher = LearnedIndexSearcher(epsilon=8)
+    searcher.fit(keys)
+    path = tmp_path / "model.idx"
+    searcher.save(path)
+
+    loaded = LearnedIndexSearcher.load(path)
+    assert loaded.epsilon == 8
+    assert loaded.segments == searcher.segments
+    assert loaded.search(keys, 1_000_000) == 1000
+    assert loaded._keys is keys
+
+
+def test_save_unfitted(tmp_path: Path) -> None:
+    """Test that saving an unfitted model raises ValueError."""
+    with pytest.raises(ValueError, match="unfitted"):
+        LearnedIndexSearcher().save(tmp_path / "model.idx")
+
+
+def test_load_invalid_file(tmp_path: Path) -> None:
+    """Test that loading a foreign file raises ValueError."""
+    path = tmp_path / "bogus"
+    path.write_bytes(b"short")
+    with pytest.raises(ValueError, match="Not a learned index file"):
+        LearnedIndexSearcher.load(path)
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError, match="Not a learned index file"):
+        LearnedIndexSearcher.load(path)
+
+
+def test_huge_integer_keys() -> None:
+    """Test keys that are not exactly representable as floats."""
+    base = 2**60
+    data = [base + i for i in range(500)]
+    searcher = LearnedIndexSearcher(epsilon=2)
+    for i in (0, 1, 250, 499):
+        assert searcher.search(data, base + i) == i
+
+
+def test_run_method() -> None:
+    """Test the run method of the searcher."""
+    assert LearnedIndexSearcher().run(([1.5, 2.5, 3.5], 2.5)) == 1
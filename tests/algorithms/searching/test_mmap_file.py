@@ -0,0 +1,127 @@
+"""Tests for memory-mapped file search."""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from algolib.algorithms.searching.binary import BinarySearcher
+from algolib.algorithms.searching.mmap_file import FixedWidthRecordFile, LineRecordFile
+
+words = st.binary(min_size=0, max_size=12).map(lambda b: b.replace(b"\n", b"_"))
+
+
+def write_lines(path: Path, lines: List[bytes], trailing_newline: bool = True) -> None:
+    path.write_bytes(b"\n".join(lines) + (b"\n" if trailing_newline and lines else b""))
+
+
+@settings(max_examples=50)
+@given(st.lists(words, max_size=30), words, st.booleans())
+def test_line_file_find_property(
+    tmp_path_factory: pytest.TempPathFactory, lines: List[bytes], key: bytes, trailing: bool
+) -> None:
+    lines = sorted(line for line in lines if line)
+    path = tmp_path_factory.mktemp("lines") / "keys.txt"
+    write_lines(path, lines, trailing)
+
+    with LineRecordFile(path) as f:
+        offset = f.find(key)
+        if key in lines:
+            assert offset is not None
+            assert f.record_at(offset) == key
+            assert offset == sum(len(line) + 1 for line in lines[: lines.index(key)])
+        else:
+            assert offset is None
+
+
+@pytest.fixture
+def fixed_file(tmp_path: Path) -> Path:
+    """A file of 8-byte records: a 4-byte key followed by a 4-byte payload."""
+    path = tmp_path / "records.bin"
+    keys = [b"aaaa", b"bbbb", b"bbbb", b"dddd", b"eeee"]
+    path.write_bytes(b"".join(key + f"{i:04d}".encode() for i, key in enumerate(keys)))
+    return path
+
+
+def test_fixed_width_find(fixed_file: Path) -> None:
+    """Test finding records by key in a fixed-width file."""
+    with FixedWidthRecordFile(fixed_file, record_size=8, key_size=4) as f:
+        assert len(f) == 5
+        assert f.find(b"aaaa") == 0
+        assert f.find(b"bbbb") == 8
+        assert f.find(b"eeee") == 32
+        assert f.find(b"cccc") is None
+        assert f.find(b"zzzz") is None
+        assert f.record_at(24) == b"dddd0003"
+
+
+def test_fixed_width_find_many(fixed_file: Path) -> None:
+    """Test batch lookups preserve input order."""
+    with FixedWidthRecordFile(fixed_file, record_size=8, key_size=4) as f:
+        assert f.find_many([b"eeee", b"cccc", b"aaaa", b"bbbb"]) == [32, None, 0, 8]
+
+
+def test_fixed_width_is_a_sequence(fixed_file: Path) -> None:
+    """Test that the record file works with sequence-based searchers."""
+    with FixedWidthRecordFile(fixed_file, record_size=8, key_size=4) as f:
+        assert f[0] == b"aaaa"
+        assert f[-1] == b"eeee"
+        assert f[3:] == [b"dddd", b"eeee"]
+        assert BinarySearcher[bytes]().search(f, b"dddd") == 3
+        with pytest.raises(IndexError):
+            f[5]
+
+
+def test_fixed_width_key_offset(fixed_file: Path) -> None:
+    """Test keys located in the middle of a record."""
+    with FixedWidthRecordFile(fixed_file, record_size=8, key_offset=4) as f:
+        assert f[2] == b"0002"
+        assert f.find(b"0004") == 32
+
+
+def test_fixed_width_invalid_layout(fixed_file: Path) -> None:
+    """Test that invalid layouts are rejected."""
+    with pytest.raises(ValueError, match="must be positive"):
+        FixedWidthRecordFile(fixed_file, record_size=0)
+    with pytest.raises(ValueError, match="within the record"):
+        FixedWidthRecordFile(fixed_file, record_size=8, key_offset=6, key_size=4)
+    with pytest.raises(ValueError, match="multiple of record_size"):
+        FixedWidthRecordFile(fixed_file, record_size=3)
+
+
+def test_empty_files(tmp_path: Path) -> None:
+    """Test that empty files can be opened and searched."""
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    with FixedWidthRecordFile(path, record_size=4) as f:
+        assert len(f) == 0
+        assert f.find(b"abcd") is None
+    with LineRecordFile(path) as lines:
+        assert lines.find(b"abcd") is None
+
+
+def test_line_file_variable_lengths(tmp_path: Path) -> None:
+    """Test resynchronization over lines of very different lengths."""
+    lines = [b"a", b"b" * 500, b"c", b"d" * 3, b"e" * 1000, b"f"]
+    path = tmp_path / "keys.txt"
+    write_lines(path, lines)
+    with LineRecordFile(path) as f:
+        for line in lines:
+            offset = f.find(line)
+            assert offset is not None
+            assert f.record_at(offset) == line
+        assert f.find(b"bb") is None
+
+
+def test_line_file_separator(tmp_path: Path) -> None:
+    """Test keyed lines with a separator and duplicate keys."""
+    path = tmp_path / "kv.tsv"
+    write_lines(path, [b"apple\t1", b"banana\t2", b"banana\t3", b"cherry\t4"])
+    with LineRecordFile(path, separator=b"\t") as f:
+        offset = f.find(b"banana")
+        assert offset is not None
+        assert f.record_at(offset) == b"banana\t2"
+        assert f.find(b"ban") is None
+        assert f.find_many([b"cherry", b"apple", b"durian"]) == [26, 0, None]
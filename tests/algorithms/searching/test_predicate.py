@@ -0,0 +1,111 @@
+"""Tests for the predicate binary search algorithm."""
+
+import math
+from typing import List
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.searching.predicate import MemoizedPredicate, PredicateSearcher
+
+
+@given(st.integers(-100, 100), st.integers(-100, 100), st.integers(-120, 120))
+def test_first_true_property(lo: int, hi: int, threshold: int) -> None:
+    searcher = PredicateSearcher[int]()
+    expected = next((x for x in range(lo, hi + 1) if x >= threshold), None)
+    assert searcher.first_true(lo, hi, lambda x: x >= threshold) == expected
+
+
+@given(st.integers(-100, 100), st.integers(-100, 100), st.integers(-120, 120))
+def test_last_true_property(lo: int, hi: int, threshold: int) -> None:
+    searcher = PredicateSearcher[int]()
+    expected = next((x for x in range(hi, lo - 1, -1) if x <= threshold), None)
+    assert searcher.last_true(lo, hi, lambda x: x <= threshold) == expected
+
+
+@pytest.fixture
+def searcher() -> PredicateSearcher[int]:
+    """Fixture for a PredicateSearcher instance."""
+    return PredicateSearcher()
+
+
+def test_first_true_over_huge_domain(searcher: PredicateSearcher[int]) -> None:
+    """Test that huge domains are searched without materializing them."""
+    probes: List[int] = []
+
+    def pred(x: int) -> bool:
+        probes.append(x)
+        return x * x >= 10**30
+
+    assert searcher.first_true(0, 10**18, pred) == 10**15
+    assert len(probes) <= 61
+
+
+def test_first_true_empty_range(searcher: PredicateSearcher[int]) -> None:
+    """Test that an empty range has no answer."""
+    assert searcher.first_true(5, 4, lambda x: True) is None
+    assert searcher.last_true(5, 4, lambda x: True) is None
+
+
+def test_first_true_never_true(searcher: PredicateSearcher[int]) -> None:
+    """Test a predicate that is False across the whole domain."""
+    assert searcher.first_true(0, 100, lambda x: False) is None
+
+
+def test_memoization_avoids_repeat_evaluations(searcher: PredicateSearcher[int]) -> None:
+    """Test that a shared MemoizedPredicate is reused across searches."""
+    pred = MemoizedPredicate[int](lambda x: x >= 37)
+    assert searcher.first_true(0, 100, pred) == 37
+    first_calls = pred.calls
+    assert searcher.first_true(0, 100, pred) == 37
+    assert pred.calls == first_calls
+    assert pred.hits == first_calls
+
+
+def test_last_true_probes_each_point_at_most_once(searcher: PredicateSearcher[int]) -> None:
+    """Test that last_true finds the boundary without evaluating any point twice."""
+    seen: List[int] = []
+
+    def pred(x: int) -> bool:
+        seen.append(x)
+        return x <= 42
+
+    assert searcher.last_true(0, 1000, pred) == 42
+    assert len(seen) == len(set(seen))
+
+
+def test_first_true_float(searcher: PredicateSearcher[int]) -> None:
+    """Test float bisection converges within tolerance."""
+    result = searcher.first_true_float(0.0, 2.0, lambda x: x * x >= 2.0, tol=1e-6)
+    assert result is not None
+    assert result * result >= 2.0
+    assert math.isclose(result, math.sqrt(2.0), abs_tol=1e-6)
+
+
+def test_first_true_float_boundaries(searcher: PredicateSearcher[int]) -> None:
+    """Test float bisection when the answer is at or beyond the bounds."""
+    assert searcher.first_true_float(1.0, 2.0, lambda x: True) == 1.0
+    assert searcher.first_true_float(1.0, 2.0, lambda x: False) is None
+    assert searcher.first_true_float(2.0, 1.0, lambda x: True) is None
+
+
+def test_first_true_float_exhausts_precision(searcher: PredicateSearcher[int]) -> None:
+    """Test that bisection stops when the bracket cannot be split further."""
+    result = searcher.first_true_float(0.0, 1.0, lambda x: x >= 0.5, tol=1e-300)
+    assert result == 0.5
+
+
+def test_first_true_float_invalid_tolerance(searcher: PredicateSearcher[int]) -> None:
+    """Test that a non-positive tolerance is rejected."""
+    with pytest.raises(ValueError, match="tol must be positive"):
+        searcher.first_true_float(0.0, 1.0, lambda x: True, tol=0.0)
+
+
+def test_search_sorted_sequence(searcher: PredicateSearcher[int]) -> None:
+    """Test the Searcher interface on a sorted sequence."""
+    assert searcher.search([1, 2, 2, 2, 5], 2) == 1
+    assert searcher.search([1, 2, 5], 3) is None
+    assert searcher.search([1, 2, 5], 9) is None
+    assert searcher.search([], 1) is None
+    assert searcher.run(([1, 3, 5], 5)) == 2
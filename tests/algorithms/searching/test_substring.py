@@ -0,0 +1,117 @@
+"""Tests for the substring search algorithms."""
+
+import mmap
+from pathlib import Path
+from typing import List, Type
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.searching.substring import (
+    HorspoolSearcher,
+    KMPSearcher,
+    SubstringSearcher,
+)
+
+ALL_SUBSTRING_SEARCHERS: List[Type[SubstringSearcher]] = [HorspoolSearcher, KMPSearcher]
+
+small_alphabet = st.binary(max_size=60).map(lambda b: bytes(x % 3 for x in b))
+
+
+def naive_findall(text: bytes, pattern: bytes) -> List[int]:
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i : i + len(pattern)] == pattern]
+
+
+@pytest.mark.parametrize("searcher_class", ALL_SUBSTRING_SEARCHERS)
+@given(text=small_alphabet, pattern=small_alphabet.filter(bool))
+def test_findall_matches_naive(
+    searcher_class: Type[SubstringSearcher], text: bytes, pattern: bytes
+) -> None:
+    assert searcher_class().findall(text, pattern) == naive_findall(text, pattern)
+
+
+@pytest.mark.parametrize("searcher_class", ALL_SUBSTRING_SEARCHERS)
+@given(
+    text=small_alphabet,
+    pattern=small_alphabet.filter(bool),
+    cuts=st.lists(st.integers(min_value=0, max_value=60)),
+)
+def test_chunked_stream_matches_naive(
+    searcher_class: Type[SubstringSearcher], text: bytes, pattern: bytes, cuts: List[int]
+) -> None:
+    bounds = [0, *sorted(min(c, len(text)) for c in cuts), len(text)]
+    chunks = [text[a:b] for a, b in zip(bounds, bounds[1:], strict=False)]
+    found = list(searcher_class().finditer_chunks(chunks, pattern))
+    assert found == naive_findall(text, pattern)
+
+
+@pytest.fixture(params=ALL_SUBSTRING_SEARCHERS)
+def searcher(request: pytest.FixtureRequest) -> SubstringSearcher:
+    """Fixture yielding an instance of each substring searcher."""
+    searcher_class: Type[SubstringSearcher] = request.param
+    return searcher_class()
+
+
+def test_search_first_match(searcher: SubstringSearcher) -> None:
+    """Test that search returns the first match or None."""
+    assert searcher.search(b"abracadabra", b"abra") == 0
+    assert searcher.search(b"abracadabra", b"cad") == 4
+    assert searcher.search(b"abracadabra", b"dab") == 6
+    assert searcher.search(b"abracadabra", b"zzz") is None
+    assert searcher.search(b"ab", b"abc") is None
+
+
+def test_overlapping_matches(searcher: SubstringSearcher) -> None:
+    """Test that overlapping matches are all reported."""
+    assert searcher.findall(b"aaaaa", b"aa") == [0, 1, 2, 3]
+
+
+def test_finditer_is_lazy(searcher: SubstringSearcher) -> None:
+    """Test that matches are yielded one at a time."""
+    matches = searcher.finditer(b"x" * 10_000, b"x")
+    assert next(matches) == 0
+    assert next(matches) == 1
+
+
+def test_memoryview_and_bytearray(searcher: SubstringSearcher) -> None:
+    """Test scanning memoryview and bytearray buffers."""
+    data = bytearray(b"--needle--needle")
+    assert searcher.findall(data, b"needle") == [2, 10]
+    assert searcher.findall(memoryview(data)[2:], b"needle") == [0, 8]
+
+
+def test_mmapped_file(searcher: SubstringSearcher, tmp_path: Path) -> None:
+    """Test scanning a memory-mapped file."""
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"INFO ok\nERROR bad\nINFO ok\nERROR worse\n")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert searcher.findall(mm, b"ERROR") == [8, 26]
+
+
+def test_file_streaming_across_chunks(searcher: SubstringSearcher, tmp_path: Path) -> None:
+    """Test scanning a file in chunks smaller than the pattern."""
+    text = b"0123456789" * 50 + b"PATTERN" + b"abcdefghij" * 50 + b"PATTERN"
+    path = tmp_path / "data.bin"
+    path.write_bytes(text)
+    found = list(searcher.finditer_file(path, b"PATTERN", chunk_size=3))
+    assert found == naive_findall(text, b"PATTERN")
+
+
+def test_empty_pattern_rejected(searcher: SubstringSearcher) -> None:
+    """Test that an empty pattern raises ValueError."""
+    with pytest.raises(ValueError, match="pattern must not be empty"):
+        searcher.search(b"abc", b"")
+    with pytest.raises(ValueError, match="pattern must not be empty"):
+        list(searcher.finditer_chunks([b"abc"], b""))
+
+
+def test_run_method(searcher: SubstringSearcher) -> None:
+    """Test the run method and its input validation."""
+    assert searcher.run((b"hello world", b"world")) == 6
+    with pytest.raises(TypeError, match="Expected a tuple"):
+        searcher.run(b"hello")
+    with pytest.raises(TypeError, match="bytes-like buffer"):
+        searcher.run(("hello", b"l"))
+    with pytest.raises(TypeError, match="must be bytes"):
+        searcher.run((b"hello", "l"))
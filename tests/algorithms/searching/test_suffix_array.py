@@ -0,0 +1,102 @@
+"""Tests for the suffix array index."""
+
+import mmap
+from pathlib import Path
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from algolib.algorithms.searching.suffix_array import SuffixArray
+
+small_alphabet = st.binary(max_size=80).map(lambda b: bytes(x % 3 for x in b))
+
+
+@given(text=small_alphabet, pattern=small_alphabet.filter(bool))
+def test_suffix_array_properties(text: bytes, pattern: bytes) -> None:
+    index = SuffixArray(text)
+    assert list(index.sa) == sorted(range(len(text)), key=lambda i: text[i:])
+    for i in range(1, len(text)):
+        a, b = text[index.sa[i - 1] :], text[index.sa[i] :]
+        common = next((j for j in range(min(len(a), len(b))) if a[j] != b[j]), min(len(a), len(b)))
+        assert index.lcp[i] == common
+
+    expected = [i for i in range(len(text)) if text.startswith(pattern, i)]
+    assert index.positions(pattern) == expected
+    assert index.count(pattern) == len(expected)
+    assert index.find(pattern) == (expected[0] if expected else None)
+
+
+@pytest.fixture
+def banana() -> SuffixArray:
+    """Fixture for the suffix array of b'banana'."""
+    return SuffixArray(b"banana")
+
+
+def test_banana_suffix_array(banana: SuffixArray) -> None:
+    """Test the textbook banana example."""
+    assert list(banana.sa) == [5, 3, 1, 0, 4, 2]
+    assert list(banana.lcp) == [0, 1, 3, 0, 0, 2]
+    assert len(banana) == 6
+
+
+def test_queries(banana: SuffixArray) -> None:
+    """Test count, positions and find."""
+    assert banana.count(b"ana") == 2
+    assert banana.positions(b"an") == [1, 3]
+    assert banana.find(b"nan") == 2
+    assert banana.find(b"apple") is None
+    assert banana.count(b"bananas") == 0
+
+
+def test_longest_repeat(banana: SuffixArray) -> None:
+    """Test the longest repeated substring."""
+    position, length = banana.longest_repeat()
+    assert b"banana"[position : position + length] == b"ana"
+    assert SuffixArray(b"abc").longest_repeat() == (0, 0)
+
+
+def test_empty_text() -> None:
+    """Test indexing an empty text."""
+    index = SuffixArray(b"")
+    assert len(index) == 0
+    assert index.count(b"a") == 0
+    assert index.longest_repeat() == (0, 0)
+
+
+def test_save_and_load(tmp_path: Path, banana: SuffixArray) -> None:
+    """Test that a saved index is memory-mapped back with identical answers."""
+    path = tmp_path / "banana.sfx"
+    banana.save(path)
+    with SuffixArray.load(path, b"banana") as loaded:
+        assert list(loaded.sa) == list(banana.sa)
+        assert list(loaded.lcp) == list(banana.lcp)
+        assert loaded.positions(b"a") == [1, 3, 5]
+        copy = tmp_path / "copy.sfx"
+        loaded.save(copy)
+    assert copy.read_bytes() == path.read_bytes()
+
+
+def test_mmapped_text(tmp_path: Path) -> None:
+    """Test indexing a memory-mapped corpus."""
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(b"the cat sat on the mat")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as text:
+        index = SuffixArray(text)
+        assert index.positions(b"the") == [0, 15]
+        assert index.count(b"at") == 3
+
+
+def test_load_rejects_invalid_files(tmp_path: Path, banana: SuffixArray) -> None:
+    """Test that foreign or mismatched files raise ValueError."""
+    path = tmp_path / "bogus"
+    path.write_bytes(b"tiny")
+    with pytest.raises(ValueError, match="Not a suffix array file"):
+        SuffixArray.load(path, b"banana")
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError, match="Not a suffix array file"):
+        SuffixArray.load(path, b"banana")
+
+    banana.save(path)
+    with pytest.raises(ValueError, match="does not match the text length"):
+        SuffixArray.load(path, b"bananas")
@@ -0,0 +1,32 @@
+"""Graph generators shared by the graph benchmarks."""
+
+import random
+from typing import Set
+
+from algolib.data_structures.graph import Graph
+
+
+def power_law_graph(n: int, m: int, seed: int = 0, directed: bool = False) -> Graph[int]:
+    """Generates a Barabási–Albert preferential-attachment graph.
+
+    Each new vertex links to `m` distinct earlier vertices chosen with probability
+    proportional to their degree, giving a power-law degree distribution and a
+    small diameter, like social networks.
+    """
+    rng = random.Random(seed)
+    sources = []
+    targets = []
+    endpoints = list(range(m))
+    for v in range(m, n):
+        chosen: Set[int] = set()
+        while len(chosen) < m:
+            chosen.add(rng.choice(endpoints))
+        for u in chosen:
+            sources.append(v)
+            targets.append(u)
+        endpoints.extend(chosen)
+        endpoints.extend([v] * m)
+    graph = Graph[int](directed=directed)
+    graph.add_vertices_from(range(n))
+    graph.add_edges_from_arrays(sources, targets)
+    return graph
@@ -0,0 +1,51 @@
+"""Benchmarks for A* against Dijkstra on a 300x300 grid with random obstacles."""
+
+import random
+from typing import Tuple
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.shortest_path.astar import AStar, manhattan
+from algolib.algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algolib.data_structures.graph import Graph, Vertex
+from tests.benchmarks.pedantic import run_pedantic
+
+SIDE = 300
+_rng = random.Random(0)
+_blocked = {(x, y) for x in range(SIDE) for y in range(SIDE) if _rng.random() < 0.2}
+_blocked -= {(0, 0), (SIDE - 1, SIDE - 1)}
+GRID = Graph[Tuple[int, int]]()
+GRID.add_edges_from(
+    ((x, y), neighbor)
+    for x in range(SIDE)
+    for y in range(SIDE)
+    if (x, y) not in _blocked
+    for neighbor in ((x + 1, y), (x, y + 1))
+    if neighbor[0] < SIDE and neighbor[1] < SIDE and neighbor not in _blocked
+)
+SOURCE = Vertex((0, 0))
+TARGET = Vertex((SIDE - 1, SIDE - 1))
+
+
+@pytest.mark.benchmark(group="A* (300x300 grid)")
+def test_bench_dijkstra_point_to_point(benchmark: BenchmarkFixture) -> None:
+    result = run_pedantic(
+        benchmark, Dijkstra[Tuple[int, int]]().search, (GRID, SOURCE), {"target": TARGET}, rounds=3
+    )
+    benchmark.extra_info["expansions"] = result.expansions
+
+
+@pytest.mark.benchmark(group="A* (300x300 grid)")
+@pytest.mark.parametrize("prefer_deeper", [True, False])
+def test_bench_astar(benchmark: BenchmarkFixture, prefer_deeper: bool) -> None:
+    astar = AStar[Tuple[int, int]](manhattan, prefer_deeper=prefer_deeper)
+    run_pedantic(benchmark, astar.search, (GRID, SOURCE, TARGET), rounds=3)
+    benchmark.extra_info["expansions"] = astar.expansions
+
+
+@pytest.mark.benchmark(group="A* (300x300 grid)")
+def test_bench_weighted_astar(benchmark: BenchmarkFixture) -> None:
+    astar = AStar[Tuple[int, int]](manhattan, epsilon=1.5)
+    run_pedantic(benchmark, astar.search, (GRID, SOURCE, TARGET), rounds=3)
+    benchmark.extra_info["expansions"] = astar.expansions
@@ -0,0 +1,35 @@
+"""Benchmarks for many-source BFS, one call at a time versus batched over a pool."""
+
+import os
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.shortest_path.batch import BatchShortestPaths
+from algolib.algorithms.graph.traversal.bfs import BFS
+from tests.benchmarks.graph.graphs import power_law_graph
+from tests.benchmarks.pedantic import run_pedantic
+
+GRAPH = power_law_graph(20_000, 4)
+SOURCES = [GRAPH.vertex_at(i) for i in range(0, 20_000, 625)]
+
+
+@pytest.mark.benchmark(group="Many-source BFS (32 sources)")
+def test_bench_sequential_sources(benchmark: BenchmarkFixture) -> None:
+    bfs = BFS[int]()
+    run_pedantic(benchmark, lambda: [bfs.traverse(GRAPH, v) for v in SOURCES], rounds=3)
+
+
+@pytest.mark.benchmark(group="Many-source BFS (32 sources)")
+def test_bench_batch_stream(benchmark: BenchmarkFixture) -> None:
+    batch = BatchShortestPaths[int](workers=os.cpu_count())
+    run_pedantic(benchmark, batch.stream, (GRAPH, SOURCES, lambda v, d: None), rounds=3)
+    benchmark.extra_info["workers"] = batch.workers
+
+
+@pytest.mark.benchmark(group="Many-source BFS (32 sources)")
+def test_bench_batch_matrix(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    batch = BatchShortestPaths[int](workers=os.cpu_count())
+    run_pedantic(benchmark, batch.write_matrix, (GRAPH, SOURCES, tmp_path / "m.bin"), rounds=3)
+    benchmark.extra_info["workers"] = batch.workers
@@ -0,0 +1,54 @@
+"""Benchmarks comparing id-based BFS against hashing Vertex objects."""
+
+import random
+from collections import deque
+from typing import List, Set
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.data_structures.graph import Graph, Vertex
+
+N = 50_000
+DEGREE = 8
+
+
+def build_graph() -> Graph[int]:
+    rng = random.Random(0)
+    graph = Graph[int](directed=True)
+    vertices = [graph.add_vertex(key) for key in range(N)]
+    for u in vertices:
+        for _ in range(DEGREE):
+            graph.add_edge(u, vertices[rng.randrange(N)])
+    return graph
+
+
+GRAPH = build_graph()
+START = GRAPH.vertex_at(0)
+
+
+def hashed_bfs(graph: Graph[int], start: Vertex[int]) -> List[Vertex[int]]:
+    """BFS over the `Vertex` API with a hash set, as traversals did before ids."""
+    queue = deque([start])
+    visited: Set[Vertex[int]] = {start}
+    order = []
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        for neighbor, _ in graph.neighbors(current):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+    return order
+
+
+@pytest.mark.benchmark(group="BFS")
+def test_bench_bfs_hashed_vertices(benchmark: BenchmarkFixture) -> None:
+    benchmark(hashed_bfs, GRAPH, START)
+
+
+@pytest.mark.benchmark(group="BFS")
+def test_bench_bfs_dense_ids(benchmark: BenchmarkFixture) -> None:
+    result = benchmark(BFS[int]().traverse, GRAPH, START)
+    assert result == hashed_bfs(GRAPH, START)
@@ -0,0 +1,44 @@
+"""Benchmarks comparing bidirectional and one-sided BFS for point-to-point queries."""
+
+import random
+from typing import List, Tuple
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.algorithms.graph.traversal.bidirectional import BidirectionalBFS
+from algolib.data_structures.graph import Vertex
+from tests.benchmarks.graph.graphs import power_law_graph
+
+GRAPH = power_law_graph(100_000, 4)
+_rng = random.Random(1)
+PAIRS: List[Tuple[Vertex[int], Vertex[int]]] = [
+    (GRAPH.vertex_at(_rng.randrange(len(GRAPH))), GRAPH.vertex_at(_rng.randrange(len(GRAPH))))
+    for _ in range(20)
+]
+
+
+def one_sided(bfs: BFS[int]) -> int:
+    visited = 0
+    for source, target in PAIRS:
+        visited += len(bfs.search(GRAPH, source, targets=[target]).order)
+    return visited
+
+
+def bidirectional(bfs: BidirectionalBFS[int]) -> int:
+    visited = 0
+    for source, target in PAIRS:
+        bfs.shortest_path(GRAPH, source, target)
+        visited += bfs.visited
+    return visited
+
+
+@pytest.mark.benchmark(group="Point-to-point hops")
+def test_bench_one_sided_bfs(benchmark: BenchmarkFixture) -> None:
+    benchmark.extra_info["visited"] = benchmark(one_sided, BFS[int]())
+
+
+@pytest.mark.benchmark(group="Point-to-point hops")
+def test_bench_bidirectional_bfs(benchmark: BenchmarkFixture) -> None:
+    benchmark.extra_info["visited"] = benchmark(bidirectional, BidirectionalBFS[int]())
@@ -0,0 +1,47 @@
+"""Benchmarks for connected component labelling on a sparse graph with many components."""
+
+import random
+from array import array
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.connectivity.components import ConnectedComponents
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.data_structures.graph import Graph
+from tests.benchmarks.pedantic import run_pedantic
+
+N = 100_000
+M = 80_000
+_rng = random.Random(0)
+GRAPH = Graph[int]()
+GRAPH.add_vertices_from(range(N))
+GRAPH.add_edges_from_arrays(
+    array("i", (_rng.randrange(N) for _ in range(M))),
+    array("i", (_rng.randrange(N) for _ in range(M))),
+)
+
+
+def traverse_loop() -> int:
+    """Labels components the old way, one `BFS.traverse` per unvisited vertex."""
+    seen = set()
+    count = 0
+    bfs = BFS[int]()
+    for v in GRAPH:
+        if v not in seen:
+            seen.update(bfs.traverse(GRAPH, v))
+            count += 1
+    return count
+
+
+@pytest.mark.benchmark(group="Connected components (100k vertices)")
+def test_bench_traverse_loop(benchmark: BenchmarkFixture) -> None:
+    run_pedantic(benchmark, traverse_loop, rounds=3)
+
+
+@pytest.mark.benchmark(group="Connected components (100k vertices)")
+@pytest.mark.parametrize("backend", ["bfs", "union_find"])
+def test_bench_components(benchmark: BenchmarkFixture, backend: str) -> None:
+    components = ConnectedComponents[int](backend)  # type: ignore[arg-type]
+    result = run_pedantic(benchmark, components.label, (GRAPH,), rounds=3)
+    benchmark.extra_info["components"] = result.count
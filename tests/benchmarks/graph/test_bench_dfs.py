@@ -0,0 +1,35 @@
+"""Benchmarks for iterative DFS and topological sort on a million-vertex dependency chain."""
+
+from array import array
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.ordering.toposort import TopologicalSort
+from algolib.algorithms.graph.traversal.dfs import DFS
+from algolib.data_structures.graph import Graph
+from tests.benchmarks.pedantic import run_pedantic
+
+N = 1_000_000
+# A long chain with a shortcut edge from every vertex ten steps ahead, so the
+# DFS stack grows to nearly a million frames.
+CHAIN = Graph[int](directed=True)
+CHAIN.add_vertices_from(range(N))
+CHAIN.add_edges_from_arrays(array("i", range(N - 1)), array("i", range(1, N)))
+CHAIN.add_edges_from_arrays(array("i", range(N - 10)), array("i", range(10, N)))
+ROOT = CHAIN.vertex_at(0)
+
+
+@pytest.mark.benchmark(group="Deep chain (1M vertices)")
+def test_bench_dfs(benchmark: BenchmarkFixture) -> None:
+    run_pedantic(benchmark, DFS[int]().search, (CHAIN, ROOT), rounds=1)
+
+
+@pytest.mark.benchmark(group="Deep chain (1M vertices)")
+def test_bench_toposort(benchmark: BenchmarkFixture) -> None:
+    run_pedantic(benchmark, TopologicalSort[int]().sort, (CHAIN,), rounds=1)
+
+
+@pytest.mark.benchmark(group="Deep chain (1M vertices)")
+def test_bench_find_cycle(benchmark: BenchmarkFixture) -> None:
+    run_pedantic(benchmark, TopologicalSort[int]().find_cycle, (CHAIN,), rounds=1)
@@ -0,0 +1,45 @@
+"""Benchmarks for Dijkstra on a random weighted graph with a million edges."""
+
+import random
+from array import array
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algolib.data_structures.graph import Graph
+from tests.benchmarks.pedantic import run_pedantic
+
+N = 100_000
+M = 1_000_000
+_rng = random.Random(0)
+GRAPH = Graph[int](directed=True)
+GRAPH.add_vertices_from(range(N))
+GRAPH.add_edges_from_arrays(
+    array("i", (_rng.randrange(N) for _ in range(M))),
+    array("i", (_rng.randrange(N) for _ in range(M))),
+    array("d", (_rng.uniform(1.0, 100.0) for _ in range(M))),
+)
+FROZEN = GRAPH.freeze()
+SOURCE = GRAPH.vertex_at(0)
+TARGET = GRAPH.vertex_at(N - 1)
+
+
+@pytest.mark.benchmark(group="Dijkstra (1M edges)")
+def test_bench_dijkstra_single_source(benchmark: BenchmarkFixture) -> None:
+    result = run_pedantic(benchmark, Dijkstra[int]().search, (GRAPH, SOURCE), rounds=3)
+    benchmark.extra_info["expansions"] = result.expansions
+
+
+@pytest.mark.benchmark(group="Dijkstra (1M edges)")
+def test_bench_dijkstra_single_source_csr(benchmark: BenchmarkFixture) -> None:
+    result = run_pedantic(benchmark, Dijkstra[int]().search, (FROZEN, SOURCE), rounds=3)
+    benchmark.extra_info["expansions"] = result.expansions
+
+
+@pytest.mark.benchmark(group="Dijkstra (1M edges)")
+def test_bench_dijkstra_early_exit(benchmark: BenchmarkFixture) -> None:
+    result = run_pedantic(
+        benchmark, Dijkstra[int]().search, (GRAPH, SOURCE), {"target": TARGET}, rounds=3
+    )
+    benchmark.extra_info["expansions"] = result.expansions
@@ -0,0 +1,25 @@
+"""Benchmarks comparing top-down and direction-optimizing BFS on a power-law graph."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.algorithms.graph.traversal.direction_optimizing import DirectionOptimizingBFS
+from tests.benchmarks.graph.graphs import power_law_graph
+
+GRAPH = power_law_graph(100_000, 8).freeze()
+REVERSE = GRAPH.reverse()
+START = GRAPH.vertex_at(0)
+
+
+@pytest.mark.benchmark(group="BFS (power-law)")
+def test_bench_top_down_bfs(benchmark: BenchmarkFixture) -> None:
+    benchmark(BFS[int]().search, GRAPH, START)
+
+
+@pytest.mark.benchmark(group="BFS (power-law)")
+def test_bench_direction_optimizing_bfs(benchmark: BenchmarkFixture) -> None:
+    bfs = DirectionOptimizingBFS[int]()
+    result = benchmark(bfs.search, GRAPH, START, REVERSE)
+    benchmark.extra_info["directions"] = bfs.directions
+    assert result.distances == BFS[int]().search(GRAPH, START).distances
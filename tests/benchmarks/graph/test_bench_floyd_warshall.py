@@ -0,0 +1,80 @@
+"""Benchmarks for dense all-pairs shortest paths."""
+
+import math
+import random
+from array import array
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algolib.algorithms.graph.shortest_path.floyd_warshall import Backend, FloydWarshall
+from algolib.data_structures.graph import Graph
+from tests.benchmarks.pedantic import run_pedantic
+
+N = 150
+_rng = random.Random(0)
+COMPLETE = Graph[int](directed=True)
+COMPLETE.add_vertices_from(range(N))
+COMPLETE.add_edges_from(
+    (i, j, _rng.uniform(1.0, 10.0)) for i in range(N) for j in range(N) if i != j
+)
+SPARSE = Graph[int](directed=True)
+SPARSE.add_vertices_from(range(N))
+SPARSE.add_edges_from(
+    (_rng.randrange(N), _rng.randrange(N), _rng.uniform(1.0, 10.0)) for _ in range(2 * N)
+)
+
+
+def naive_floyd_warshall(graph: Graph[int]) -> None:
+    """The textbook triple loop over the same packed rows."""
+    matrix = [array("d", [math.inf]) * N for _ in range(N)]
+    for i in range(N):
+        matrix[i][i] = 0.0
+        for j, weight in zip(graph.neighbor_ids(i), graph.neighbor_weights(i), strict=True):
+            matrix[i][j] = min(matrix[i][j], weight)
+    for k in range(N):
+        row_k = matrix[k]
+        for row_i in matrix:
+            d_ik = row_i[k]
+            for j in range(N):
+                if d_ik + row_k[j] < row_i[j]:
+                    row_i[j] = d_ik + row_k[j]
+
+
+@pytest.mark.benchmark(group="All pairs (150 vertices, complete)")
+def test_bench_naive_triple_loop(benchmark: BenchmarkFixture) -> None:
+    run_pedantic(benchmark, naive_floyd_warshall, (COMPLETE,), rounds=3)
+
+
+@pytest.mark.benchmark(group="All pairs (150 vertices, complete)")
+def test_bench_dijkstra_per_source(benchmark: BenchmarkFixture) -> None:
+    dijkstra = Dijkstra[int]()
+    run_pedantic(benchmark, lambda: [dijkstra.search(COMPLETE, v) for v in COMPLETE], rounds=3)
+
+
+@pytest.mark.benchmark(group="All pairs (150 vertices, complete)")
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+@pytest.mark.parametrize("float32", [False, True])
+def test_bench_floyd_warshall(benchmark: BenchmarkFixture, float32: bool, backend: Backend) -> None:
+    solver = FloydWarshall[int](float32=float32, backend=backend)
+    result = run_pedantic(benchmark, solver.solve, (COMPLETE,), rounds=3)
+    benchmark.extra_info["matrix_bytes"] = sum(len(r) * r.itemsize for r in result.distances)
+
+
+@pytest.mark.benchmark(group="All pairs (150 vertices, complete)")
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_bench_floyd_warshall_next_hops(benchmark: BenchmarkFixture, backend: Backend) -> None:
+    solver = FloydWarshall[int](next_hops=True, backend=backend)
+    run_pedantic(benchmark, solver.solve, (COMPLETE,), rounds=3)
+
+
+@pytest.mark.benchmark(group="All pairs (150 vertices, sparse)")
+def test_bench_naive_triple_loop_sparse(benchmark: BenchmarkFixture) -> None:
+    run_pedantic(benchmark, naive_floyd_warshall, (SPARSE,), rounds=3)
+
+
+@pytest.mark.benchmark(group="All pairs (150 vertices, sparse)")
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_bench_floyd_warshall_sparse(benchmark: BenchmarkFixture, backend: Backend) -> None:
+    run_pedantic(benchmark, FloydWarshall[int](backend=backend).solve, (SPARSE,), rounds=3)
@@ -0,0 +1,50 @@
+"""Benchmarks for edge lookups and removals with and without the neighbor index."""
+
+import random
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.data_structures.graph import Graph, Vertex
+from tests.benchmarks.pedantic import run_pedantic
+
+_rng = random.Random(0)
+EDGES = list({(_rng.randrange(2_000), _rng.randrange(2_000)) for _ in range(200_000)})
+QUERIES = [(Vertex(_rng.randrange(2_000)), Vertex(_rng.randrange(2_000))) for _ in range(100_000)]
+REMOVALS = [(Vertex(u), Vertex(v)) for u, v in _rng.sample(EDGES, 20_000)]
+
+
+def _build(indexed: bool) -> Graph[int]:
+    graph = Graph[int](directed=True, indexed=indexed)
+    graph.add_edges_from(EDGES)
+    return graph
+
+
+def _lookups(graph: Graph[int]) -> int:
+    has_edge = graph.has_edge
+    return sum(has_edge(u, v) for u, v in QUERIES)
+
+
+def _removals(graph: Graph[int]) -> None:
+    for u, v in REMOVALS:
+        graph.remove_edge(u, v)
+
+
+@pytest.mark.benchmark(group="has_edge (2k vertices, avg degree 100)")
+@pytest.mark.parametrize("indexed", [False, True], ids=["scan", "indexed"])
+def test_bench_has_edge(benchmark: BenchmarkFixture, indexed: bool) -> None:
+    graph = _build(indexed)
+    run_pedantic(benchmark, _lookups, (graph,), rounds=3)
+    memory = graph.memory_usage()
+    benchmark.extra_info["adjacency_bytes"] = memory.adjacency_bytes
+    benchmark.extra_info["index_bytes"] = memory.index_bytes
+
+
+@pytest.mark.benchmark(group="remove_edge (2k vertices, avg degree 100)")
+@pytest.mark.parametrize("indexed", [False, True], ids=["scan", "indexed"])
+def test_bench_remove_edge(benchmark: BenchmarkFixture, indexed: bool) -> None:
+    def setup() -> Tuple[List[Graph[int]], Dict[str, Any]]:
+        return [_build(indexed)], {}
+
+    run_pedantic(benchmark, _removals, setup=setup, rounds=3)
@@ -0,0 +1,56 @@
+"""Benchmarks for bulk graph construction and edge-list loading."""
+
+import random
+from array import array
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.data_structures.graph import Graph
+from algolib.data_structures.graph_io import load_binary_edges, load_edge_list, write_binary_edges
+
+N = 20_000
+M = 200_000
+_rng = random.Random(0)
+SOURCES = array("i", (_rng.randrange(N) for _ in range(M)))
+TARGETS = array("i", (_rng.randrange(N) for _ in range(M)))
+
+
+def add_edge_loop() -> Graph[int]:
+    graph = Graph[int](directed=True)
+    for u, v in zip(SOURCES, TARGETS, strict=True):
+        graph.add_edge(graph.add_vertex(u), graph.add_vertex(v))
+    return graph
+
+
+def add_edges_bulk() -> Graph[int]:
+    graph = Graph[int](directed=True)
+    graph.add_edges_from_arrays(SOURCES, TARGETS)
+    return graph
+
+
+@pytest.mark.benchmark(group="Graph construction")
+def test_bench_add_edge_loop(benchmark: BenchmarkFixture) -> None:
+    benchmark(add_edge_loop)
+
+
+@pytest.mark.benchmark(group="Graph construction")
+def test_bench_add_edges_from_arrays(benchmark: BenchmarkFixture) -> None:
+    benchmark(add_edges_bulk)
+
+
+@pytest.mark.benchmark(group="Graph construction")
+def test_bench_load_tsv(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    path = tmp_path / "edges.tsv"
+    path.write_text("".join(f"{u}\t{v}\n" for u, v in zip(SOURCES, TARGETS, strict=True)))
+    _, stats = benchmark(load_edge_list, path, delimiter=b"\t", directed=True)
+    benchmark.extra_info["edges_per_second"] = stats.edges_per_second
+
+
+@pytest.mark.benchmark(group="Graph construction")
+def test_bench_load_binary(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    path = tmp_path / "edges.bin"
+    write_binary_edges(add_edges_bulk(), path)
+    _, stats = benchmark(load_binary_edges, path, directed=True)
+    benchmark.extra_info["edges_per_second"] = stats.edges_per_second
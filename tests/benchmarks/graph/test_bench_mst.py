@@ -0,0 +1,36 @@
+"""Benchmarks for Kruskal and Prim on sparse and dense random graphs."""
+
+import random
+from array import array
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.mst.kruskal import Kruskal
+from algolib.algorithms.graph.mst.prim import Prim
+from algolib.data_structures.graph import Graph
+from tests.benchmarks.pedantic import run_pedantic
+
+_rng = random.Random(0)
+SPARSE = Graph[int]()
+SPARSE.add_vertices_from(range(50_000))
+SPARSE.add_edges_from_arrays(
+    array("i", (_rng.randrange(50_000) for _ in range(500_000))),
+    array("i", (_rng.randrange(50_000) for _ in range(500_000))),
+    array("d", (_rng.random() for _ in range(500_000))),
+)
+DENSE = Graph[int]()
+DENSE.add_edges_from((i, j, _rng.random()) for i in range(600) for j in range(i + 1, 600))
+
+
+@pytest.mark.benchmark(group="MST (50k vertices, 500k edges)")
+@pytest.mark.parametrize("solver", [Kruskal, Prim], ids=["kruskal", "prim"])
+def test_bench_mst_sparse(benchmark: BenchmarkFixture, solver: type) -> None:
+    forest = run_pedantic(benchmark, solver().solve, (SPARSE,), rounds=3)
+    benchmark.extra_info["trees"] = forest.trees
+
+
+@pytest.mark.benchmark(group="MST (600 vertices, complete)")
+@pytest.mark.parametrize("solver", [Kruskal, Prim], ids=["kruskal", "prim"])
+def test_bench_mst_dense(benchmark: BenchmarkFixture, solver: type) -> None:
+    run_pedantic(benchmark, solver().solve, (DENSE,), rounds=3)
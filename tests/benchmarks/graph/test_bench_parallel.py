@@ -0,0 +1,30 @@
+"""Benchmarks comparing sequential and process-pool BFS on a power-law graph."""
+
+import os
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.algorithms.graph.traversal.parallel import ParallelBFS
+from tests.benchmarks.graph.graphs import power_law_graph
+from tests.benchmarks.pedantic import run_pedantic
+
+GRAPH = power_law_graph(200_000, 8).freeze()
+START = GRAPH.vertex_at(0)
+
+
+@pytest.mark.benchmark(group="BFS (parallel)")
+def test_bench_sequential_bfs(benchmark: BenchmarkFixture) -> None:
+    benchmark(BFS[int]().search, GRAPH, START)
+
+
+@pytest.mark.benchmark(group="BFS (parallel)")
+def test_bench_parallel_bfs(benchmark: BenchmarkFixture) -> None:
+    bfs = ParallelBFS[int](workers=os.cpu_count())
+    run_pedantic(benchmark, bfs.search, (GRAPH, START), rounds=3)
+    benchmark.extra_info["workers"] = bfs.workers
+    benchmark.extra_info["levels"] = [
+        {"frontier": level.frontier, "seconds": level.seconds, "parallel": level.parallel}
+        for level in bfs.levels
+    ]
@@ -0,0 +1,60 @@
+"""Benchmarks for in-edge access through the cached reverse adjacency."""
+
+import random
+from array import array
+from typing import List, Tuple
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.algorithms.graph.traversal.bidirectional import BidirectionalBFS
+from algolib.data_structures.csr_graph import CSRGraph
+from algolib.data_structures.graph import Graph, GraphView, Vertex
+from tests.benchmarks.pedantic import run_pedantic
+
+_rng = random.Random(0)
+GRAPH = Graph[int](directed=True)
+GRAPH.add_vertices_from(range(100_000))
+GRAPH.add_edges_from_arrays(
+    array("i", (_rng.randrange(100_000) for _ in range(500_000))),
+    array("i", (_rng.randrange(100_000) for _ in range(500_000))),
+)
+PAIRS: List[Tuple[Vertex[int], Vertex[int]]] = [
+    (Vertex(_rng.randrange(100_000)), Vertex(_rng.randrange(100_000))) for _ in range(8)
+]
+
+
+def _csr_reverse() -> GraphView[int]:
+    return CSRGraph.from_graph(GRAPH).reverse()
+
+
+def _bidirectional(per_query_csr: bool) -> int:
+    bfs = BidirectionalBFS[int]()
+    visited = 0
+    for source, target in PAIRS:
+        reverse = _csr_reverse() if per_query_csr else None
+        bfs.shortest_path(GRAPH, source, target, reverse)
+        visited += bfs.visited
+    return visited
+
+
+def _reverse_bfs(use_view: bool) -> int:
+    # Each round starts from a modified graph, so the view's cache is cold.
+    GRAPH.add_edge(PAIRS[0][0], PAIRS[0][1])
+    reverse = GRAPH.reversed() if use_view else _csr_reverse()
+    return len(BFS[int]().search(reverse, PAIRS[0][1]).order)
+
+
+@pytest.mark.benchmark(group="Bidirectional BFS, directed Graph (8 queries)")
+@pytest.mark.parametrize("per_query_csr", [True, False], ids=["csr-per-query", "cached-view"])
+def test_bench_bidirectional_reverse(benchmark: BenchmarkFixture, per_query_csr: bool) -> None:
+    benchmark.extra_info["visited"] = run_pedantic(
+        benchmark, _bidirectional, (per_query_csr,), rounds=3
+    )
+
+
+@pytest.mark.benchmark(group="Reverse BFS, cold (100k vertices, 500k edges)")
+@pytest.mark.parametrize("use_view", [False, True], ids=["csr-reverse", "reversed-view"])
+def test_bench_reverse_bfs(benchmark: BenchmarkFixture, use_view: bool) -> None:
+    benchmark.extra_info["reached"] = run_pedantic(benchmark, _reverse_bfs, (use_view,), rounds=3)
@@ -0,0 +1,42 @@
+"""Benchmarks for iterative Tarjan SCC on million-vertex deep chains.
+
+A recursive Tarjan needs one Python frame per vertex on the DFS path, so both
+graphs here would exceed the recursion limit long before finishing.
+"""
+
+from array import array
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.graph.connectivity.scc import StronglyConnectedComponents
+from algolib.data_structures.graph import Graph
+from tests.benchmarks.pedantic import run_pedantic
+
+N = 1_000_000
+# One giant cycle: the chain 0 -> 1 -> ... -> N-1 closed back to 0.
+CYCLE = Graph[int](directed=True)
+CYCLE.add_vertices_from(range(N))
+CYCLE.add_edges_from_arrays(array("i", range(N)), array("i", [*range(1, N), 0]))
+# A chain with a back edge inside every block
+# of ten, so the condensation is a chain of 100k components.
+BLOCKS = Graph[int](directed=True)
+BLOCKS.add_vertices_from(range(N))
+BLOCKS.add_edges_from_arrays(array("i", range(N - 1)), array("i", range(1, N)))
+BLOCKS.add_edges_from_arrays(array("i", range(9, N, 10)), array("i", range(0, N, 10)))
+
+
+@pytest.mark.benchmark(group="SCC (1M-vertex chains)")
+def test_bench_scc_single_cycle(benchmark: BenchmarkFixture) -> None:
+    result = run_pedantic(benchmark, StronglyConnectedComponents[int]().label, (CYCLE,), rounds=1)
+    benchmark.extra_info["components"] = result.count
+
+
+@pytest.mark.benchmark(group="SCC (1M-vertex chains)")
+def test_bench_scc_with_condensation(benchmark: BenchmarkFixture) -> None:
+    scc = StronglyConnectedComponents[int]()
+
+    def label_and_condense() -> int:
+        return len(scc.condensation(BLOCKS, scc.label(BLOCKS)))
+
+    benchmark.extra_info["components"] = run_pedantic(benchmark, label_and_condense, rounds=1)
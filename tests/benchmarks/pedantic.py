@@ -0,0 +1,27 @@
+"""A typed front end to pytest-benchmark's untyped `pedantic` runner."""
+
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, TypeVar, cast
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+R = TypeVar("R")
+
+
+def run_pedantic(
+    benchmark: BenchmarkFixture,
+    target: Callable[..., R],
+    args: Sequence[Any] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+    *,
+    setup: Optional[Callable[[], Tuple[Sequence[Any], Dict[str, Any]]]] = None,
+    rounds: int = 1,
+) -> R:
+    """Times `target` over a fixed number of rounds and returns its result.
+
+    Heavy benchmarks use this instead of calling `benchmark` directly, which
+    calibrates the number of rounds and would run them many times.
+    """
+    result = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        target, args, kwargs, setup=setup, rounds=rounds
+    )
+    return cast(R, result)
@@ -0,0 +1,34 @@
+"""Benchmarks comparing the learned index against binary search."""
+
+import random
+from array import array
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from algolib.algorithms.searching.binary import BinarySearcher
+from algolib.algorithms.searching.learned import LearnedIndexSearcher
+
+N = 200_000
+KEYS = array("q", sorted(random.Random(0).sample(range(N * 50), N)))
+QUERIES = random.Random(1).choices(KEYS, k=1_000)
+
+
+def lookup_all(searcher: BinarySearcher[int] | LearnedIndexSearcher) -> None:
+    for query in QUERIES:
+        searcher.search(KEYS, query)
+
+
+@pytest.mark.benchmark(group="Sorted lookup")
+def test_bench_binary_search(benchmark: BenchmarkFixture) -> None:
+    benchmark(lookup_all, BinarySearcher[int]())
+
+
+@pytest.mark.benchmark(group="Sorted lookup")
+def test_bench_learned_index(benchmark: BenchmarkFixture) -> None:
+    searcher = LearnedIndexSearcher(epsilon=32)
+    searcher.fit(KEYS)
+    benchmark.extra_info["segments"] = searcher.segments
+    benchmark.extra_info["model_bytes"] = searcher.size_bytes
+    benchmark.extra_info["keys_bytes"] = len(KEYS) * KEYS.itemsize
+    benchmark(lookup_all, searcher)
@@ -0,0 +1,116 @@
+import pickle
+from array import array
+
+import pytest
+from hypothesis import given
+
+from algolib.algorithms.graph.traversal.bfs import BFS
+from algolib.data_structures.csr_graph import CSRGraph
+from algolib.data_structures.graph import Graph, Vertex
+from tests.property.strategies import small_graph
+
+
+@given(graph=small_graph())
+def test_freeze_preserves_adjacency(graph: Graph[int]) -> None:
+    frozen = graph.freeze()
+    assert len(frozen) == len(graph)
+    assert [v.key for v in frozen] == [v.key for v in graph]
+    for v in graph:
+        assert list(frozen.neighbors(v)) == list(graph.neighbors(v))
+
+
+@pytest.fixture
+def graph() -> Graph[str]:
+    g = Graph[str](directed=True)
+    a, b, c = g.add_vertex("A"), g.add_vertex("B"), g.add_vertex("C")
+    g.add_edge(a, b, 2.0)
+    g.add_edge(a, c, 3.0)
+    g.add_edge(c, a, 4.0)
+    g.add_vertex("D")
+    return g
+
+
+def test_csr_arrays(graph: Graph[str]) -> None:
+    frozen = graph.freeze()
+    assert frozen.directed
+    assert list(frozen.offsets) == [0, 2, 2, 3, 3]
+    assert list(frozen.targets) == [1, 2, 0]
+    assert list(frozen.weights) == [2.0, 3.0, 4.0]
+    assert frozen.num_edges == 3
+    assert frozen.memory_bytes == 5 * 8 + 3 * frozen.targets.itemsize + 3 * 8
+
+
+def test_vertex_api(graph: Graph[str]) -> None:
+    frozen = graph.freeze()
+    a = frozen.get_vertex("A")
+    assert a == Vertex("A")
+    assert frozen.get_vertex("Z") is None
+    assert "A" in frozen
+    assert Vertex("D") in frozen
+    assert Vertex("Z") not in frozen
+    assert frozen.vertex_id(Vertex("C")) == 2
+    assert frozen.vertex_at(1) == Vertex("B")
+    assert list(frozen.neighbor_ids(0)) == [1, 2]
+    assert list(frozen.neighbor_weights(0)) == [2.0, 3.0]
+    assert frozen.get_neighbors(Vertex("A")) == [Vertex("B"), Vertex("C")]
+
+
+def test_neighbors_of_nonexistent_vertex(graph: Graph[str]) -> None:
+    frozen = graph.freeze()
+    with pytest.raises(ValueError, match="Vertex not in graph"):
+        frozen.neighbors(Vertex("Z"))
+
+
+def test_bfs_runs_on_frozen_graph(graph: Graph[str]) -> None:
+    frozen = graph.freeze()
+    bfs = BFS[str]()
+    assert bfs.traverse(frozen, Vertex("A")) == bfs.traverse(graph, Vertex("A"))
+    assert bfs.run((frozen, Vertex("C"))) == [Vertex("C"), Vertex("A"), Vertex("B")]
+
+
+def test_from_arrays() -> None:
+    csr = CSRGraph[int]([10, 20], array("q", [0, 1, 2]), array("i", [1, 0]), array("d", [1, 1]))
+    assert not csr.directed
+    assert list(csr.neighbors(Vertex(10))) == [(Vertex(20), 1.0)]
+
+
+def test_invalid_arrays() -> None:
+    with pytest.raises(ValueError, match="offsets"):
+        CSRGraph[int]([1], array("q", [0]), array("i"), array("d"))
+    with pytest.raises(ValueError, match="targets and weights"):
+        CSRGraph[int]([1], array("q", [0, 1]), array("i", [0]), array("d"))
+
+
+def test_reverse(graph: Graph[str]) -> None:
+    frozen = graph.freeze()
+    reverse = frozen.reverse()
+    assert reverse.directed
+    assert [v.key for v in reverse] == ["A", "B", "C", "D"]
+    assert reverse.get_neighbors(Vertex("A")) == [Vertex("C")]
+    assert list(reverse.neighbors(Vertex("B"))) == [(Vertex("A"), 2.0)]
+    assert list(reverse.neighbors(Vertex("C"))) == [(Vertex("A"), 3.0)]
+    assert reverse.get_neighbors(Vertex("D")) == []
+    assert list(reverse.reverse().targets) == list(frozen.targets)
+
+
+def test_reverse_of_undirected_graph_is_itself() -> None:
+    graph = Graph[int]()
+    graph.add_edges_from([(0, 1), (1, 2)])
+    frozen = graph.freeze()
+    assert frozen.reverse() is frozen
+
+
+def test_neighbor_slices_share_the_packed_arrays(graph: Graph[str]) -> None:
+    frozen = graph.freeze()
+    ids, weights = frozen.neighbor_ids(0), frozen.neighbor_weights(0)
+    assert isinstance(ids, memoryview) and ids.obj is frozen.targets
+    assert isinstance(weights, memoryview) and weights.obj is frozen.weights
+    reverse = frozen.reverse()
+    assert reverse.neighbor_ids(1).obj is reverse.targets
+
+
+def test_pickle_round_trip(graph: Graph[str]) -> None:
+    frozen = graph.freeze()
+    clone = pickle.loads(pickle.dumps(frozen))
+    assert list(clone.targets) == list(frozen.targets)
+    assert list(clone.neighbors(Vertex("A"))) == list(frozen.neighbors(Vertex("A")))
@@ -169,3 +169,30 @@ def test_disjoint_set_repeated_unions() -> None:
     ds.union("A", "B")
     assert ds.find("A") == ds.find("B")
     assert ds.find("A") != ds.find("C")
+
+
+def test_disjoint_set_add_and_contains(ds: DisjointSet[str]) -> None:
+    assert "E" not in ds
+    ds.add("E")
+    assert "E" in ds
+    assert ds.find("E") == "E"
+    ds.union("A", "E")
+    ds.add("E")
+    assert ds.find("E") == ds.find("A")
+
+
+def test_disjoint_set_union_reports_merge(ds: DisjointSet[str]) -> None:
+    assert ds.union("A", "B")
+    assert not ds.union("B", "A")
+
+
+def test_disjoint_set_pairwise_merges() -> None:
+    # Merging equal-rank trees pairwise builds the tallest trees union by rank allows.
+    ds = DisjointSet[int](range(1 << 14))
+    step = 1
+    while step < 1 << 14:
+        for i in range(0, 1 << 14, 2 * step):
+            ds.union(i, i + step)
+        step *= 2
+    root = ds.find(0)
+    assert all(ds.find(i) == root for i in range(1 << 14))
@@ -1,6 +1,10 @@
+import random
+from array import array
+from typing import Dict, Tuple
+
 import pytest
 
-from algolib.data_structures.graph import Graph, Vertex
+from algolib.data_structures.graph import Graph, ReversedGraph, Vertex
 
 
 @pytest.fixture
@@ -164,3 +168,250 @@ def test_vertex_inequality_with_non_vertex_object() -> None:
     assert vertex != 123
     assert vertex != ["A"]
     assert vertex is not None
+
+
+def test_graph_iterates_vertices_in_insertion_order(graph: Graph[str]) -> None:
+    vB = graph.add_vertex("B")
+    vA = graph.add_vertex("A")
+    assert list(graph) == [vB, vA]
+
+
+def test_graph_dense_vertex_ids(graph: Graph[str]) -> None:
+    vA = graph.add_vertex("A")
+    vB = graph.add_vertex("B")
+    vC = graph.add_vertex("C")
+    graph.add_edge(vA, vB, 2.0)
+    graph.add_edge(vC, vA, 3.0)
+    assert graph.add_vertex("B") is vB
+    assert [graph.vertex_id(v) for v in (vA, vB, vC)] == [0, 1, 2]
+    assert graph.vertex_at(2) is vC
+    assert list(graph.neighbor_ids(0)) == [1, 2]
+    assert list(graph.neighbor_weights(0)) == [2.0, 3.0]
+    assert list(graph.neighbor_ids(1)) == [0]
+    with pytest.raises(ValueError, match="Vertex not in graph"):
+        graph.vertex_id(Vertex("Z"))
+
+
+def test_add_vertices_from(graph: Graph[str]) -> None:
+    vA = graph.add_vertex("A")
+    graph.add_vertices_from(["B", "A", "C"])
+    assert [v.key for v in graph] == ["A", "B", "C"]
+    assert graph.get_vertex("A") is vA
+
+
+def test_add_edges_from_pairs_and_triples() -> None:
+    graph = Graph[int](directed=True)
+    assert graph.add_edges_from([(1, 2), (2, 3)], weight=5.0) == 2
+    assert graph.add_edges_from([(3, 1, 0.5)]) == 1
+    assert [v.key for v in graph] == [1, 2, 3]
+    assert list(graph.neighbors(Vertex(1))) == [(Vertex(2), 5.0)]
+    assert list(graph.neighbors(Vertex(3))) == [(Vertex(1), 0.5)]
+
+
+def test_add_edges_from_arrays() -> None:
+    graph = Graph[int]()
+    count = graph.add_edges_from_arrays(
+        array("i", [0, 1]), array("i", [1, 2]), array("d", [2.0, 3.0])
+    )
+    assert count == 2
+    assert list(graph.neighbors(Vertex(1))) == [(Vertex(0), 2.0), (Vertex(2), 3.0)]
+    with pytest.raises(ValueError):
+        graph.add_edges_from_arrays([0, 1], [1])
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_has_edge_and_get_weight(indexed: bool) -> None:
+    graph = Graph[str](directed=True, indexed=indexed)
+    graph.add_edges_from([("A", "B", 2.0), ("B", "C", 3.0)])
+    a, b, c = Vertex("A"), Vertex("B"), Vertex("C")
+    assert graph.has_edge(a, b)
+    assert not graph.has_edge(b, a)
+    assert graph.get_weight(b, c) == 3.0
+    assert graph.get_weight(a, c) is None
+    with pytest.raises(ValueError):
+        graph.has_edge(a, Vertex("Z"))
+
+
+def test_indexed_graph_replaces_existing_edges() -> None:
+    graph = Graph[str](indexed=True)
+    assert graph.indexed
+    assert graph.add_edges_from([("A", "B", 1.0), ("B", "A", 4.0)]) == 1
+    assert graph.add_edges_from([("A", "C")]) == 1
+    graph.add_edge(Vertex("C"), Vertex("A"), 5.0)
+    assert list(graph.neighbors(Vertex("A"))) == [(Vertex("B"), 4.0), (Vertex("C"), 5.0)]
+    assert list(graph.neighbors(Vertex("B"))) == [(Vertex("A"), 4.0)]
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_remove_edge_undirected(indexed: bool) -> None:
+    graph = Graph[str](indexed=indexed)
+    graph.add_edges_from([("A", "B"), ("A", "C"), ("A", "D")])
+    a, b = Vertex("A"), Vertex("B")
+    graph.remove_edge(b, a)
+    assert not graph.has_edge(a, b)
+    assert not graph.has_edge(b, a)
+    assert sorted(v.key for v in graph.get_neighbors(a)) == ["C", "D"]
+    assert graph.has_edge(a, Vertex("D"))
+    with pytest.raises(ValueError, match="Edge not in graph"):
+        graph.remove_edge(a, b)
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_remove_self_loop(indexed: bool) -> None:
+    graph = Graph[str](indexed=indexed)
+    a = graph.add_vertex("A")
+    graph.add_edge(a, a)
+    graph.remove_edge(a, a)
+    assert graph.get_neighbors(a) == []
+
+
+def test_remove_edge_removes_one_parallel_edge() -> None:
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([("A", "B", 1.0), ("A", "B", 2.0)])
+    graph.remove_edge(Vertex("A"), Vertex("B"))
+    assert list(graph.neighbors(Vertex("A"))) == [(Vertex("B"), 2.0)]
+
+
+def test_remove_undirected_parallel_edge_removes_both_copies_of_one_weight() -> None:
+    graph = Graph[str]()
+    graph.add_edges_from([("B", "C", 5.0), ("A", "B", 1.0), ("A", "B", 2.0)])
+    a, b = Vertex("A"), Vertex("B")
+    graph.remove_edge(b, Vertex("C"))
+    graph.remove_edge(a, b)
+    assert list(graph.neighbors(a)) == [(b, 2.0)]
+    assert list(graph.neighbors(b)) == [(a, 2.0)]
+
+    loops = Graph[str]()
+    loops.add_edges_from([("A", "A", 1.0), ("A", "A", 2.0), ("A", "B", 3.0)])
+    loops.remove_edge(a, b)
+    loops.remove_edge(a, a)
+    assert list(loops.neighbors(a)) == [(a, 2.0), (a, 2.0)]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("indexed", [False, True])
+def test_remove_vertex_moves_last_vertex_into_its_id(directed: bool, indexed: bool) -> None:
+    graph = Graph[str](directed=directed, indexed=indexed)
+    graph.add_edges_from([("A", "B"), ("B", "C"), ("C", "D"), ("D", "B"), ("D", "D")])
+    graph.remove_vertex(Vertex("B"))
+    assert [v.key for v in graph] == ["A", "D", "C"]
+    assert graph.vertex_id(Vertex("D")) == 1
+    assert "B" not in graph
+    assert graph.get_neighbors(Vertex("A")) == []
+    assert graph.has_edge(Vertex("C"), Vertex("D"))
+    assert graph.has_edge(Vertex("D"), Vertex("D"))
+    assert graph.has_edge(Vertex("D"), Vertex("C")) is not directed
+    with pytest.raises(ValueError):
+        graph.remove_vertex(Vertex("B"))
+
+
+def test_build_and_drop_index() -> None:
+    graph = Graph[int](directed=True)
+    graph.add_edges_from([(0, 1), (1, 2)])
+    graph.build_index()
+    assert graph.indexed
+    graph.remove_edge(Vertex(0), Vertex(1))
+    graph.drop_index()
+    assert not graph.indexed
+    graph.add_edges_from([(1, 2), (1, 2)])
+    with pytest.raises(ValueError, match="parallel edges"):
+        graph.build_index()
+
+
+def test_memory_usage_reports_index_cost() -> None:
+    graph = Graph[int]()
+    graph.add_edges_from((i, i + 1) for i in range(100))
+    plain = graph.memory_usage()
+    assert plain.index_bytes == 0
+    assert plain.total_bytes == plain.adjacency_bytes > 0
+    graph.build_index()
+    indexed = graph.memory_usage()
+    assert indexed.adjacency_bytes == plain.adjacency_bytes
+    assert indexed.index_bytes > 0
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("indexed", [False, True])
+def test_random_mutations_match_a_dict_model(directed: bool, indexed: bool) -> None:
+    rng = random.Random(7)
+    graph = Graph[int](directed=directed, indexed=indexed)
+    model: Dict[Tuple[int, int], float] = {}
+    keys = list(range(12))
+    graph.add_vertices_from(keys)
+    for step in range(400):
+        u, v = rng.choice(keys), rng.choice(keys)
+        pair = (u, v) if directed else (min(u, v), max(u, v))
+        if rng.random() < 0.05 and len(keys) > 2:
+            graph.remove_vertex(Vertex(u))
+            keys.remove(u)
+            model = {e: w for e, w in model.items() if u not in e}
+        elif pair in model:
+            graph.remove_edge(Vertex(u), Vertex(v))
+            del model[pair]
+        else:
+            graph.add_edge(Vertex(u), Vertex(v), float(step))
+            model[pair] = float(step)
+
+        for x in keys:
+            for y in keys:
+                expected = model.get((x, y) if directed else (min(x, y), max(x, y)))
+                assert graph.get_weight(Vertex(x), Vertex(y)) == expected
+        if step % 2:
+            # Warms the reverse adjacency, which remove_vertex then reuses.
+            for x in keys:
+                expected_in = sum(1 for e in model if e[1] == x or (not directed and e[0] == x))
+                expected_in += (x, x) in model and not directed and not indexed
+                assert graph.in_degree(Vertex(x)) == expected_in
+        assert sorted(v.key for v in graph) == sorted(keys)
+        assert all(graph.vertex_at(graph.vertex_id(v)) == v for v in graph)
+
+
+def test_predecessors_and_in_degree() -> None:
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([("A", "C", 1.0), ("B", "C", 2.0), ("C", "A", 3.0)])
+    c = Vertex("C")
+    assert list(graph.predecessors(c)) == [(Vertex("A"), 1.0), (Vertex("B"), 2.0)]
+    assert graph.in_degree(c) == 2
+    assert graph.in_degree(Vertex("B")) == 0
+    with pytest.raises(ValueError):
+        graph.in_degree(Vertex("Z"))
+
+
+def test_predecessors_of_undirected_graph_are_neighbors(graph: Graph[str]) -> None:
+    graph.add_edges_from([("A", "B"), ("A", "C")])
+    a = Vertex("A")
+    assert list(graph.predecessors(a)) == list(graph.neighbors(a))
+    assert graph.memory_usage().reverse_bytes == 0
+
+
+def test_reverse_adjacency_follows_modifications() -> None:
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([("A", "B"), ("C", "B")])
+    b = Vertex("B")
+    assert graph.in_degree(b) == 2
+    assert graph.memory_usage().reverse_bytes > 0
+    graph.remove_edge(Vertex("A"), b)
+    assert graph.memory_usage().reverse_bytes == 0
+    assert [v.key for v, _ in graph.predecessors(b)] == ["C"]
+    graph.add_edge(graph.add_vertex("D"), b)
+    assert graph.in_degree(b) == 2
+    graph.remove_vertex(Vertex("C"))
+    assert [v.key for v, _ in graph.predecessors(b)] == ["D"]
+
+
+def test_reversed_view() -> None:
+    graph = Graph[str](directed=True)
+    graph.add_edges_from([("A", "B", 1.0), ("B", "C", 2.0)])
+    view = graph.reversed()
+    assert isinstance(view, ReversedGraph)
+    assert view.directed
+    assert len(view) == 3
+    assert "A" in view
+    assert [v.key for v in view] == ["A", "B", "C"]
+    c = view.vertex_id(Vertex("C"))
+    assert view.vertex_at(c) == Vertex("C")
+    assert list(view.neighbor_ids(c)) == [view.vertex_id(Vertex("B"))]
+    assert list(view.neighbor_weights(c)) == [2.0]
+    assert list(view.neighbors(Vertex("B"))) == [(Vertex("A"), 1.0)]
+    graph.add_edge(Vertex("C"), Vertex("A"))
+    assert list(view.neighbors(Vertex("A"))) == [(Vertex("C"), 1.0)]
@@ -0,0 +1,84 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from algolib.data_structures.graph import Graph, Vertex
+from algolib.data_structures.graph_io import (
+    load_binary_edges,
+    load_edge_list,
+    write_binary_edges,
+)
+
+
+def adjacency(graph: Graph[int]) -> dict[int, list[tuple[int, float]]]:
+    return {v.key: sorted((n.key, w) for n, w in graph.neighbors(v)) for v in graph}
+
+
+def test_load_tsv(tmp_path: Path) -> None:
+    path = tmp_path / "edges.tsv"
+    path.write_bytes(b"# source\ttarget\n1\t2\n2\t3\n\n3\t1\n")
+    graph, stats = load_edge_list(path, delimiter=b"\t", directed=True)
+    assert adjacency(graph) == {1: [(2, 1.0)], 2: [(3, 1.0)], 3: [(1, 1.0)]}
+    assert stats.edges == 3
+    assert stats.vertices == 3
+    assert stats.bytes_read == len(path.read_bytes())
+    assert stats.edges_per_second > 0
+
+
+def test_load_weighted_gzip_csv_in_small_chunks(tmp_path: Path) -> None:
+    path = tmp_path / "edges.csv.gz"
+    lines = [f"a{i},a{i + 1},{i / 2}" for i in range(100)]
+    with gzip.open(path, "wb") as f:
+        f.write("\n".join(lines).encode())
+    graph, stats = load_edge_list(
+        path, delimiter=b",", key=bytes.decode, weighted=True, chunk_size=7
+    )
+    assert stats.edges == 100
+    assert len(graph) == 101
+    assert list(graph.neighbors(Vertex("a10"))) == [(Vertex("a9"), 4.5), (Vertex("a11"), 5.0)]
+
+
+def test_load_into_existing_graph(tmp_path: Path) -> None:
+    path = tmp_path / "edges.txt"
+    path.write_bytes(b"1 2\n")
+    graph = Graph[int](directed=True)
+    graph.add_vertex(5)
+    loaded, _ = load_edge_list(path, graph=graph)
+    assert loaded is graph
+    assert [v.key for v in graph] == [5, 1, 2]
+
+
+def test_load_rejects_ragged_lines(tmp_path: Path) -> None:
+    path = tmp_path / "edges.txt"
+    path.write_bytes(b"1 2\n3\n")
+    with pytest.raises(ValueError, match="Expected 2 columns"):
+        load_edge_list(path)
+    path.write_bytes(b"1 2 3\n4\n")
+    with pytest.raises(ValueError, match="Expected 2 columns"):
+        load_edge_list(path)
+    path.write_bytes(b"1 2 3 4\n\n")
+    with pytest.raises(ValueError, match="Expected 2 columns"):
+        load_edge_list(path)
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("directed", [False, True])
+def test_binary_round_trip(tmp_path: Path, weighted: bool, directed: bool) -> None:
+    graph = Graph[int](directed=directed)
+    graph.add_edges_from([(0, 1, 1.5), (1, 2, 2.5), (2, 0, 3.5), (2, 2, 4.5), (3, 1, 0.25)])
+    path = tmp_path / "edges.bin"
+    assert write_binary_edges(graph, path, weighted=weighted) == 5
+    loaded, stats = load_binary_edges(path, weighted=weighted, directed=directed, chunk_size=20)
+    assert stats.edges == 5
+    expected = adjacency(graph)
+    if not weighted:
+        expected = {k: [(n, 1.0) for n, _ in edges] for k, edges in expected.items()}
+    assert adjacency(loaded) == expected
+
+
+def test_binary_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "edges.bin"
+    path.write_bytes(b"\x00" * 12)
+    with pytest.raises(ValueError, match="Truncated"):
+        load_binary_edges(path)
@@ -38,12 +38,9 @@ def small_graph(draw: st.DrawFn) -> Graph[int]:
     for u_key, v_key in edge_tuples:
         u = graph.get_vertex(u_key)
         v = graph.get_vertex(v_key)
-        if u and v:
-            # Avoid adding parallel edges for simplicity in this strategy
-            # A more complex strategy could handle this, but it's not needed for now
-            is_neighbor = any(neighbor == v for neighbor, _ in graph.neighbors(u))
-            if not is_neighbor:
-                graph.add_edge(u, v)
+        # Avoid adding parallel edges for simplicity in this strategy
+        if u and v and not graph.has_edge(u, v):
+            graph.add_edge(u, v)
 
     return graph
 
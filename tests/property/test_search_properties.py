@@ -7,7 +7,10 @@ from hypothesis import strategies as st
 
 from algolib.algorithms.searching.base import Searcher
 from algolib.algorithms.searching.binary import BinarySearcher
+from algolib.algorithms.searching.hash_index import HashIndexSearcher
+from algolib.algorithms.searching.learned import LearnedIndexSearcher
 from algolib.algorithms.searching.linear import LinearSearcher
+from algolib.algorithms.searching.predicate import PredicateSearcher
 
 # A strategy for a sorted list and an element to search for
 sorted_list_and_element = st.lists(st.integers(), min_size=1).flatmap(
@@ -16,14 +19,20 @@ sorted_list_and_element = st.lists(st.integers(), min_size=1).flatmap(
     )
 )
 
-ALL_SEARCHERS: List[Type[Searcher[int]]] = [LinearSearcher, BinarySearcher]
+ALL_SEARCHERS: List[Type[Searcher[float]]] = [
+    LinearSearcher,
+    BinarySearcher,
+    HashIndexSearcher,
+    PredicateSearcher,
+    LearnedIndexSearcher,
+]
 
 
 @pytest.mark.property
 @pytest.mark.parametrize("searcher_class", ALL_SEARCHERS)
 @given(data_and_target=sorted_list_and_element)
 def test_search_properties(
-    searcher_class: Type[Searcher[int]], data_and_target: Tuple[List[int], int]
+    searcher_class: Type[Searcher[float]], data_and_target: Tuple[List[int], int]
 ) -> None:
     """
     Tests that search algorithms correctly find an element or return None.